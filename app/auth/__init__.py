@@ -13,6 +13,7 @@ from .auth import (
     SECRET_KEY,
     ALGORITHM,
 )
+from app.utils.security import UNUSABLE_PASSWORD_PREFIX, make_unusable_password
 
 __all__ = [
     "create_access_token",
@@ -28,4 +29,6 @@ __all__ = [
     "ACCESS_TOKEN_EXPIRE_MINUTES",
     "SECRET_KEY",
     "ALGORITHM",
+    "UNUSABLE_PASSWORD_PREFIX",
+    "make_unusable_password",
 ]
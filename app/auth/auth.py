@@ -3,11 +3,11 @@ from fastapi import Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import TimeoutError as SATimeoutError, OperationalError
 from datetime import datetime, timedelta, UTC
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 from urllib.parse import urlencode  # Added import
 from app.schemas.schemas import UserRole, Permission
 from app.schemas.user import User as UserSchema
-from app.data.user_manager import UserManager  # Import the class
+from app.data.user_manager import UserManager, get_user_manager  # Import the class
 from app.database import (
     get_db,
 )  # Import DB session dependency AND SessionLocal for middleware
@@ -118,6 +118,10 @@ elif not validate_secret_key(SECRET_KEY):
 else:
     logger.info("JWT secret key validated and loaded from environment.")
 
+# Build the HMAC key object once; python-jose otherwise reconstructs it from
+# the raw secret on every encode/decode.
+_JWT_KEY = jwk.construct(SECRET_KEY, ALGORITHM)
+
 # Warn about token expiration configuration
 if ACCESS_TOKEN_EXPIRE_MINUTES > 60:
     logger.warning(
@@ -168,7 +172,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     )
 
     try:
-        encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+        encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=ALGORITHM)
         logger.info(f"Successfully created access token for subject: {data.get('sub')}")
         return encoded_jwt
     except Exception as e:
@@ -234,7 +238,7 @@ async def get_current_user(
         logger.debug("Attempting to decode JWT token for get_current_user.")
         payload = jwt.decode(
             token,
-            SECRET_KEY,
+            _JWT_KEY,
             algorithms=[ALGORITHM],
             issuer=JWT_ISSUER,
             options={"verify_aud": False},
@@ -279,7 +283,7 @@ async def _get_current_user_model_optional(
     try:
         payload = jwt.decode(
             token,
-            SECRET_KEY,
+            _JWT_KEY,
             algorithms=[ALGORITHM],
             issuer=JWT_ISSUER,
             options={"verify_aud": False},
@@ -390,6 +394,24 @@ async def get_current_active_user(
     return safe_user
 
 
+async def get_current_user_model(
+    current_user_login: str = Depends(get_current_user),
+    user_manager: UserManager = Depends(get_user_manager),
+) -> UserModel:
+    """
+    FastAPI dependency returning the session-bound User row for the token's login.
+    It shares the request's cached UserManager, so the lookup runs once per
+    request and the row can be used with the endpoint's own managers.
+    Raises 404 if the user no longer exists.
+    """
+    user = user_manager.get_user_by_login(current_user_login)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+    return user
+
+
 # --- Role and Permission Dependencies ---
 
 
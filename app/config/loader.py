@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, TypeVar
 
 import yaml
 
@@ -132,26 +134,68 @@ def _db_get(key: str) -> Any:
         return None
 
 
+# ── Getter caching ────────────────────────────────────────────────────────────
+# Infrastructure-only getters (no DB overlay) are memoised per config path so
+# hot page routes do not re-read and re-coerce config.yaml on every request.
+# Cached values are shared; callers must treat them as read-only.
+
+_T = TypeVar("_T")
+_CACHED_GETTERS: List[Any] = []
+
+
+def _cached_per_config_path(getter: Callable[[], _T]) -> Callable[[], _T]:
+    cached = functools.lru_cache(maxsize=4)(lambda _config_path: getter())
+
+    @functools.wraps(getter)
+    def wrapper() -> _T:
+        return cached(_CONFIG_PATH)
+
+    wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    _CACHED_GETTERS.append(wrapper)
+    return wrapper
+
+
+def clear_config_caches() -> None:
+    """Drop memoised config values so the next call re-reads config.yaml."""
+    _PARSED_CONFIG.clear()
+    for getter in _CACHED_GETTERS:
+        getter.cache_clear()
+
+
 # ── YAML loader ──────────────────────────────────────────────────────────────
+# The last successfully parsed mapping is kept per path and reused while the
+# file's mtime and size are unchanged. Error fallbacks are never cached.
+
+_PARSED_CONFIG: Dict[Path, tuple[int, int, Dict[str, Any]]] = {}
+
 
 def load_config() -> Dict[str, Any]:
-    """Load the application config from YAML, returning an empty mapping on error."""
+    """Load the application config from YAML, returning an empty mapping on error.
+
+    Each call returns a fresh copy, so callers may mutate the result freely.
+    """
+    config_path = _CONFIG_PATH
     try:
-        with _CONFIG_PATH.open("r", encoding="utf-8") as handle:
+        stat = config_path.stat()
+        cached = _PARSED_CONFIG.get(config_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return copy.deepcopy(cached[2])
+        with config_path.open("r", encoding="utf-8") as handle:
             data = yaml.safe_load(handle) or {}
             if isinstance(data, dict):
-                return data
+                _PARSED_CONFIG[config_path] = (stat.st_mtime_ns, stat.st_size, data)
+                return copy.deepcopy(data)
             logging.warning(
-                "Config file %s is not a mapping; using defaults.", _CONFIG_PATH
+                "Config file %s is not a mapping; using defaults.", config_path
             )
             return {}
     except FileNotFoundError:
         logging.warning(
-            "Configuration file %s not found; using defaults.", _CONFIG_PATH
+            "Configuration file %s not found; using defaults.", config_path
         )
         return {}
     except Exception as exc:  # noqa: BLE001
-        logging.error("Failed to load configuration from %s: %s", _CONFIG_PATH, exc)
+        logging.error("Failed to load configuration from %s: %s", config_path, exc)
         return {}
 
 
@@ -267,6 +311,7 @@ def get_activity_participant_exclusivity() -> bool:
     return base
 
 
+@_cached_per_config_path
 def get_meeting_refresh_settings() -> Dict[str, Any]:
     """Return meeting refresh polling settings sourced from config with safe defaults.
 
@@ -351,6 +396,7 @@ def _normalise_retry_policy(
     return merged
 
 
+@_cached_per_config_path
 def get_frontend_reliability_settings() -> Dict[str, Any]:
     """Return frontend retry/backoff defaults used by auth and meeting UI paths.
 
@@ -384,6 +430,7 @@ def get_frontend_reliability_settings() -> Dict[str, Any]:
     }
 
 
+@_cached_per_config_path
 def get_ui_refresh_settings() -> Dict[str, Any]:
     """Return UI refresh polling settings sourced from config with safe defaults.
 
@@ -413,6 +460,7 @@ def get_ui_refresh_settings() -> Dict[str, Any]:
     }
 
 
+@_cached_per_config_path
 def get_meeting_activity_log_settings() -> Dict[str, Any]:
     """Return meeting activity log settings sourced from config with safe defaults."""
     config = load_config()
@@ -1,17 +1,32 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, func
-from typing import Dict, Optional, List, Any, Sequence, Iterable, Set, Tuple
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import exists, or_, func
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import re
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException, Depends
 
-from ..models.meeting import Meeting, MeetingFacilitator, AgendaActivity
+from ..models.meeting import (
+    Meeting,
+    MeetingFacilitator,
+    AgendaActivity,
+    participants_table,
+)
 from ..models.idea import Idea
 from ..models.voting import VotingVote
 from ..models.activity_bundle import ActivityBundle
-from ..models.user import User, UserRole
+from ..models.user import ADMIN_ROLES, User, UserRole
 from ..models.categorization import (
     CategorizationAssignment,
     CategorizationAuditEvent,
@@ -32,6 +47,51 @@ from ..config.loader import get_activity_participant_exclusivity
 from ..services import meeting_state_manager
 
 ACTIVITY_SEQUENCE_WIDTH = 4
+_UNSET: Any = object()
+
+
+def activity_by_id(meeting, activity_id: str) -> Optional[AgendaActivity]:
+    """Return an agenda activity by id using an index cached on the loaded meeting.
+
+    The index is rebuilt whenever the ``agenda_activities`` collection is
+    replaced (reload/expiry) or changes length, so it never outlives the
+    collection it was built from.
+    """
+    activities = getattr(meeting, "agenda_activities", None) or []
+    cached = meeting.__dict__.get("_activity_index")
+    if (
+        cached is None
+        or cached[0] is not activities
+        or cached[1] != len(activities)
+    ):
+        index = {item.activity_id: item for item in activities}
+        cached = (activities, len(activities), index)
+        meeting.__dict__["_activity_index"] = cached
+    return cached[2].get(activity_id)
+
+
+def _cached_user_ids(meeting, relationship: str, cache_key: str) -> FrozenSet[str]:
+    # Same invalidation rule as ``activity_by_id``: rebuild when the collection
+    # is replaced or changes length.
+    members = getattr(meeting, relationship, None) or []
+    cached = meeting.__dict__.get(cache_key)
+    if cached is None or cached[0] is not members or cached[1] != len(members):
+        user_ids = frozenset(
+            member.user_id for member in members if getattr(member, "user_id", None)
+        )
+        cached = (members, len(members), user_ids)
+        meeting.__dict__[cache_key] = cached
+    return cached[2]
+
+
+def facilitator_user_ids(meeting) -> FrozenSet[str]:
+    """Return facilitator user ids, cached on the loaded meeting."""
+    return _cached_user_ids(meeting, "facilitator_links", "_facilitator_user_ids")
+
+
+def participant_user_ids(meeting) -> FrozenSet[str]:
+    """Return participant user ids, cached on the loaded meeting."""
+    return _cached_user_ids(meeting, "participants", "_participant_user_ids")
 
 
 class MeetingManager:
@@ -282,6 +342,9 @@ class MeetingManager:
         placeholder_base = max_existing + 1000
         for idx, activity in enumerate(ordered, start=1):
             activity.order_index = placeholder_base + idx
+        # Writing the ordered list back keeps ``agenda_activities`` in
+        # order_index order (as the relationship loads it), so readers never
+        # need to re-sort it.
         meeting.agenda_activities[:] = ordered
         self.db.flush()
 
@@ -349,7 +412,7 @@ class MeetingManager:
         meeting = self.get_meeting(meeting_id)
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
-        return sorted(meeting.agenda_activities, key=lambda item: item.order_index)
+        return list(meeting.agenda_activities)
 
     def get_activity_data_flags(self, meeting_id: str) -> Dict[str, bool]:
         idea_ids = {
@@ -795,7 +858,7 @@ class MeetingManager:
         self._resequence_agenda(meeting, new_ordered_list)
         self.db.commit()
         self.db.refresh(meeting)  # Refresh meeting to load resequenced agenda
-        return sorted(meeting.agenda_activities, key=lambda item: item.order_index)
+        return list(meeting.agenda_activities)
 
     async def check_participant_collisions(
         self,
@@ -804,6 +867,9 @@ class MeetingManager:
         new_activity_participant_ids: Set[
             str
         ],  # Participants of the activity being started
+        *,
+        meeting: Optional[Meeting] = None,
+        snapshot: Any = _UNSET,
     ) -> List[str]:  # Returns a list of conflicting user_ids
         """
         Checks if starting the given activity would lead to participant collisions
@@ -811,50 +877,58 @@ class MeetingManager:
 
         A collision occurs if a participant assigned to activity_id_to_start
         is already active in another running activity.
+
+        Callers that already hold the loaded meeting and/or a state snapshot
+        (``None`` meaning "no live state") can pass them to skip re-fetching.
         """
         if not get_activity_participant_exclusivity():
             return []
-        meeting = self.get_meeting(meeting_id)
+        if meeting is None:
+            meeting = self.get_meeting(meeting_id)
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
 
-        current_meeting_state = await meeting_state_manager.snapshot(meeting_id)
+        if snapshot is _UNSET:
+            current_meeting_state = await meeting_state_manager.snapshot(meeting_id)
+        else:
+            current_meeting_state = snapshot
+        if not current_meeting_state:
+            return []
+        all_participant_ids: Optional[Set[str]] = None
         active_entries: List[Tuple[str, Set[str]]] = []
-        if current_meeting_state:
-            raw_active = current_meeting_state.get("activeActivities") or []
-            if isinstance(raw_active, dict):
-                raw_active = raw_active.values()
-            for entry in raw_active:
-                if not isinstance(entry, dict):
-                    continue
-                active_id = entry.get("activityId") or entry.get("activity_id")
-                if not active_id or active_id == activity_id_to_start:
-                    continue
-                status = str(entry.get("status") or "").lower()
-                if status in {"completed", "stopped"}:
-                    continue
-                participant_ids = (
-                    entry.get("participantIds")
-                    or entry.get("participant_ids")
-                    or []
-                )
-                if isinstance(participant_ids, list):
-                    participant_set = {
-                        str(pid).strip() for pid in participant_ids if str(pid).strip()
+        raw_active = current_meeting_state.get("activeActivities") or []
+        if isinstance(raw_active, dict):
+            raw_active = raw_active.values()
+        for entry in raw_active:
+            if not isinstance(entry, dict):
+                continue
+            active_id = entry.get("activityId") or entry.get("activity_id")
+            if not active_id or active_id == activity_id_to_start:
+                continue
+            status = str(entry.get("status") or "").lower()
+            if status in {"completed", "stopped"}:
+                continue
+            participant_ids = (
+                entry.get("participantIds")
+                or entry.get("participant_ids")
+                or []
+            )
+            if isinstance(participant_ids, list):
+                participant_set = {
+                    str(pid).strip() for pid in participant_ids if str(pid).strip()
+                }
+            else:
+                participant_set = set()
+            if not participant_set:
+                if all_participant_ids is None:
+                    all_participant_ids = {
+                        p.user_id for p in (meeting.participants or [])
                     }
-                else:
-                    participant_set = set()
-                if not participant_set:
-                    meeting_participants = self.list_participants(meeting_id)
-                    participant_set = {p.user_id for p in meeting_participants}
-                active_entries.append((str(active_id), participant_set))
+                participant_set = all_participant_ids
+            active_entries.append((str(active_id), participant_set))
 
         # Backward-compatible fallback: use legacy single currentActivity state
-        if (
-            not active_entries
-            and current_meeting_state
-            and current_meeting_state.get("currentActivity")
-        ):
+        if not active_entries and current_meeting_state.get("currentActivity"):
             current_active_activity_id = current_meeting_state["currentActivity"]
             if current_active_activity_id != activity_id_to_start:
                 active_activity = next(
@@ -876,8 +950,9 @@ class MeetingManager:
                     if raw_ids:
                         participant_set = {str(pid).strip() for pid in raw_ids if str(pid).strip()}
                     else:
-                        meeting_participants = self.list_participants(meeting_id)
-                        participant_set = {p.user_id for p in meeting_participants}
+                        participant_set = {
+                            p.user_id for p in (meeting.participants or [])
+                        }
                     active_entries.append(
                         (str(current_active_activity_id), participant_set)
                     )
@@ -1141,27 +1216,137 @@ class MeetingManager:
             # self.db.close() # moved to finally block
             return None
 
+    @staticmethod
+    def _meeting_detail_options():
+        # Collections use selectinload so each relationship costs one IN query
+        # instead of multiplying rows through a chain of JOINs.
+        return (
+            selectinload(Meeting.participants),
+            selectinload(Meeting.facilitator_links).joinedload(
+                MeetingFacilitator.user
+            ),
+            selectinload(Meeting.agenda_activities),
+            joinedload(Meeting.owner),
+        )
+
     def get_meeting(self, meeting_id: str) -> Optional[Meeting]:
-        """Get a meeting by its primary key ID, optionally loading relationships."""
+        """Get a meeting by its primary key ID with its relationships loaded."""
         try:
             return (
                 self.db.query(Meeting)
-                .options(
-                    joinedload(Meeting.participants),
-                    joinedload(Meeting.facilitator_links).joinedload(
-                        MeetingFacilitator.user
-                    ),
-                    joinedload(Meeting.owner),
-                    joinedload(Meeting.agenda_activities),
-                )
+                .options(*self._meeting_detail_options())
                 .filter(Meeting.meeting_id == meeting_id)
-                .first()
+                .one_or_none()
             )
         except Exception as e:
             print(f"Error getting meeting ID {meeting_id}: {str(e)}")
             return None
 
-    def join_meeting_by_code(self, meeting_code: str, user: User) -> Meeting:
+    def get_meeting_with_roster(self, meeting_id: str) -> Optional[Meeting]:
+        """Get a meeting with only its participant and facilitator rosters loaded.
+
+        Roster-only consumers (such as the meeting-scoped user directory) skip
+        the agenda load and the facilitator-user join done by ``get_meeting``.
+        """
+        return (
+            self.db.query(Meeting)
+            .options(
+                selectinload(Meeting.participants),
+                selectinload(Meeting.facilitator_links),
+            )
+            .filter(Meeting.meeting_id == meeting_id)
+            .one_or_none()
+        )
+
+    def get_meeting_row(self, meeting_id: str) -> Optional[Meeting]:
+        """Get a meeting's own columns without eager-loading any relationships."""
+        # Session.get answers from the identity map when this session already
+        # holds the meeting, so repeat lookups skip the SELECT.
+        return self.db.get(Meeting, meeting_id)
+
+    @staticmethod
+    def _access_clause(user_id: str, *, include_participants: bool = True):
+        # Correlated EXISTS probes keep membership checks O(1) in Python no
+        # matter how large the rosters are.
+        conditions = [
+            Meeting.owner_id == user_id,
+            exists().where(
+                MeetingFacilitator.meeting_id == Meeting.meeting_id,
+                MeetingFacilitator.user_id == user_id,
+            ),
+        ]
+        if include_participants:
+            conditions.append(
+                exists().where(
+                    participants_table.c.meeting_id == Meeting.meeting_id,
+                    participants_table.c.user_id == user_id,
+                )
+            )
+        return or_(*conditions)
+
+    def user_has_access(
+        self, meeting_id: str, user_id: str, *, include_participants: bool = True
+    ) -> bool:
+        """Return whether ``user_id`` owns, facilitates or (optionally) attends the meeting."""
+        return bool(
+            self.db.query(
+                exists().where(
+                    Meeting.meeting_id == meeting_id,
+                    self._access_clause(
+                        user_id, include_participants=include_participants
+                    ),
+                )
+            ).scalar()
+        )
+
+    def get_meeting_for_user(self, meeting_id: str, user: User) -> Optional[Meeting]:
+        """Load a meeting only if ``user`` may view it.
+
+        The owner/facilitator/participant check runs inside the SELECT, so a
+        denied request never hydrates the meeting or its collections. Returns
+        None when the meeting is missing or not visible to ``user``.
+        """
+        query = (
+            self.db.query(Meeting)
+            .options(*self._meeting_detail_options())
+            .filter(Meeting.meeting_id == meeting_id)
+        )
+        if user.role not in ADMIN_ROLES:
+            query = query.filter(self._access_clause(user.user_id))
+        try:
+            return query.one_or_none()
+        except Exception as e:
+            print(f"Error getting meeting ID {meeting_id} for user {user.user_id}: {str(e)}")
+            return None
+
+    def user_is_facilitator(self, meeting_id: str, user_id: str) -> bool:
+        return bool(
+            self.db.query(
+                exists().where(
+                    MeetingFacilitator.meeting_id == meeting_id,
+                    MeetingFacilitator.user_id == user_id,
+                )
+            ).scalar()
+        )
+
+    def user_is_participant(self, meeting_id: str, user_id: str) -> bool:
+        return bool(
+            self.db.query(
+                exists().where(
+                    participants_table.c.meeting_id == meeting_id,
+                    participants_table.c.user_id == user_id,
+                )
+            ).scalar()
+        )
+
+    def meeting_exists(self, meeting_id: str) -> bool:
+        return bool(
+            self.db.query(exists().where(Meeting.meeting_id == meeting_id)).scalar()
+        )
+
+    def join_meeting_by_code(
+        self, meeting_code: str, user: User, *, commit: bool = True
+    ) -> Meeting:
         meeting = (
             self.db.query(Meeting)
             .options(joinedload(Meeting.participants))
@@ -1175,8 +1360,9 @@ class MeetingManager:
         if user.user_id not in existing_ids:
             meeting.participants.append(user)
             self.db.flush()
-            self.db.commit()
-            self.db.refresh(meeting)
+            if commit:
+                self.db.commit()
+                self.db.refresh(meeting)
         return meeting
 
     # --- Participants administration ----------------------------------------
@@ -1344,7 +1530,9 @@ class MeetingManager:
         if added_ids or removal_targets:
             self.db.flush()
             self.db.commit()
-            self.db.refresh(meeting)
+            # Callers render the roster straight from the returned meeting, so
+            # reload it here rather than forcing a second get_meeting() round-trip.
+            self.db.refresh(meeting, attribute_names=["participants"])
 
         summary = {
             "added_user_ids": added_ids,
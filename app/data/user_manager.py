@@ -2,12 +2,14 @@ import logging
 from sqlalchemy.orm import Session
 from fastapi import Depends
 from ..database import get_db
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, select
 from typing import Dict, Optional, List, Any, Iterable, Tuple
 import uuid
 import hashlib
 import secrets
+import time
 
+from ..models.meeting import Meeting
 from ..models.user import User, UserRole  # Import UserRole
 from ..utils.security import get_password_hash, verify_password
 from ..utils.identifiers import generate_user_id
@@ -17,6 +19,11 @@ from ..services.avatar_catalog import is_valid_avatar_key, pick_avatar_key
 
 logger = logging.getLogger("auth")
 
+# Admins are practically never all removed, so anonymous pages may reuse a
+# positive has_admin_user() answer for this long instead of querying.
+ADMIN_EXISTS_CACHE_TTL_SECONDS = 30.0
+_admin_exists_until = 0.0
+
 
 def get_initials(first_name: str, last_name: str) -> str:
     """Extracts initials from the first and last names."""
@@ -162,6 +169,19 @@ class UserManager:
             logger.warning(f"[{req_id}] User not found with user_id: {user_id}")
         return user
 
+    def get_users_by_ids(self, user_ids: Iterable[str]) -> Dict[str, User]:
+        """Get users for many primary keys in one query, keyed by user_id."""
+        req_id = uuid.uuid4()
+        wanted = {user_id for user_id in (user_ids or []) if user_id}
+        logger.debug(f"[{req_id}] Attempting to get {len(wanted)} users by user_id.")
+        if not wanted:
+            return {}
+        users = self.db.query(User).filter(User.user_id.in_(wanted)).all()
+        for user in users:
+            self._ensure_avatar_state(user, commit=False)
+        logger.info(f"[{req_id}] Found {len(users)} of {len(wanted)} users by user_id.")
+        return {user.user_id: user for user in users}
+
     def verify_user_credentials(self, identifier: str, password: str) -> Optional[User]:
         """
         Verify user credentials using login or email (case-insensitive).
@@ -218,8 +238,13 @@ class UserManager:
         role: str = UserRole.PARTICIPANT.value,
         login: Optional[str] = None,
         organization: Optional[str] = None,
+        commit: bool = True,
     ) -> User:
-        """Add a new user to the database. Returns the created User model. Raises ValueError if user exists."""
+        """Add a new user to the database. Returns the created User model. Raises ValueError if user exists.
+
+        With ``commit=False`` the insert is only flushed, leaving the caller to
+        commit it together with its own follow-up writes.
+        """
         req_id = uuid.uuid4()
         logger.debug(f"[{req_id}] Adding user with email: {email}")
         raw_email = email.strip() if email else None
@@ -275,10 +300,13 @@ class UserManager:
 
         try:
             self.db.add(db_user)
-            self.db.commit()
-            self.db.refresh(
-                db_user
-            )  # Refresh to get any server-side defaults updated on the instance.
+            if commit:
+                self.db.commit()
+                self.db.refresh(
+                    db_user
+                )  # Refresh to get any server-side defaults updated on the instance.
+            else:
+                self.db.flush()
 
             logger.info(
                 f"[{req_id}] Successfully added user: {db_user.email} with user_id {db_user.user_id}"
@@ -473,6 +501,38 @@ class UserManager:
         logger.info(f"[{req_id}] Participant count: {count}")
         return count
 
+    def get_role_counts(self, *, include_meeting_count: bool = False) -> Dict[str, int]:
+        """Get total, admin, facilitator and participant user counts in one query.
+
+        With ``include_meeting_count`` the total meeting count rides along as a
+        scalar subquery under the ``meetings`` key, still in a single round trip.
+        """
+        req_id = uuid.uuid4()
+        logger.debug(f"[{req_id}] Getting user role counts.")
+        columns = [
+            func.count().label("total"),
+            func.count()
+            .filter(User.role.in_([UserRole.ADMIN.value, UserRole.SUPER_ADMIN.value]))
+            .label("admin"),
+            func.count()
+            .filter(User.role == UserRole.FACILITATOR.value)
+            .label("facilitator"),
+            func.count()
+            .filter(User.role == UserRole.PARTICIPANT.value)
+            .label("participant"),
+        ]
+        if include_meeting_count:
+            columns.append(
+                select(func.count())
+                .select_from(Meeting)
+                .scalar_subquery()
+                .label("meetings")
+            )
+        row = self.db.query(*columns).select_from(User).one()
+        counts = dict(row._mapping)
+        logger.info(f"[{req_id}] User role counts: {counts}")
+        return counts
+
     def update_user(
         self, user_identifier: str, updated_data: Dict[str, Any]
     ) -> Optional[User]:
@@ -984,8 +1044,16 @@ class UserManager:
             role="PARTICIPANT",
         )
 
-    def has_admin_user(self) -> bool:
-        """Check if any admin user exists."""
+    def has_admin_user(self, *, allow_cached: bool = False) -> bool:
+        """Check if any admin user exists.
+
+        With ``allow_cached`` a positive answer from the last
+        ``ADMIN_EXISTS_CACHE_TTL_SECONDS`` is reused without a query. Role
+        decisions such as first-user registration must use the live check.
+        """
+        global _admin_exists_until
+        if allow_cached and time.monotonic() < _admin_exists_until:
+            return True
         req_id = uuid.uuid4()
         logger.debug(f"[{req_id}] Checking if any admin user exists.")
         has_admin = (
@@ -995,6 +1063,8 @@ class UserManager:
             is not None
         )
         logger.info(f"[{req_id}] Has admin user: {has_admin}")
+        if has_admin:
+            _admin_exists_until = time.monotonic() + ADMIN_EXISTS_CACHE_TTL_SECONDS
         return has_admin
 
 
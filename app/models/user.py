@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from app.database import Base
 from enum import Enum
 
@@ -15,6 +15,11 @@ class UserRole(str, Enum):
     PARTICIPANT = "participant"
 
 
+# Roles with unrestricted access. UserRole is a str enum, so raw role strings
+# from the users table match these members too.
+ADMIN_ROLES = frozenset({UserRole.ADMIN, UserRole.SUPER_ADMIN})
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -69,6 +74,12 @@ class User(Base):
         primaryjoin="User.user_id==participants.c.user_id",
     )
 
+    @validates("role")
+    def _normalise_role(self, _key, value):
+        # Callers assign both UserRole members and raw strings; store the plain
+        # value so serializers can emit ``user.role`` without unwrapping enums.
+        return value.value if isinstance(value, UserRole) else value
+
     @property
     def avatar_icon_path(self) -> str | None:
         from app.services.avatar_catalog import get_avatar_path
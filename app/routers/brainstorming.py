@@ -17,8 +17,9 @@ import logging
 from app.auth import get_current_active_user
 from app.database import get_db
 from app.data.idempotency_manager import BrainstormingIdempotencyManager
+from app.data.meeting_manager import facilitator_user_ids, participant_user_ids
 from app.models.meeting import Meeting, MeetingFacilitator
-from app.models.user import User, UserRole
+from app.models.user import ADMIN_ROLES, User
 from app.schemas.brainstorming import (
     BrainstormingIdeaCreate,
     BrainstormingIdeaResponse,
@@ -86,23 +87,12 @@ def _assert_user_can_participate(
     user: User,
     allowed_participant_ids: Optional[Set[str]] = None,
 ) -> bool:
-    facilitator_ids = {
-        link.user_id
-        for link in getattr(meeting, "facilitator_links", []) or []
-        if link.user_id
-    }
-    participant_ids = {
-        participant.user_id
-        for participant in getattr(meeting, "participants", []) or []
-        if participant.user_id
-    }
-
-    is_admin = user.role in {UserRole.ADMIN, UserRole.SUPER_ADMIN}
-    is_owner = meeting.owner_id == user.user_id
-    is_facilitator = user.user_id in facilitator_ids
-    is_participant = user.user_id in participant_ids
-
-    if is_admin or is_owner or is_facilitator:
+    user_id = user.user_id
+    if (
+        user.role in ADMIN_ROLES
+        or meeting.owner_id == user_id
+        or user_id in facilitator_user_ids(meeting)
+    ):
         return True
 
     if allowed_participant_ids is not None:
@@ -113,7 +103,7 @@ def _assert_user_can_participate(
             detail="You are not assigned to this activity.",
         )
 
-    if is_participant:
+    if user_id in participant_user_ids(meeting):
         return False
 
     raise HTTPException(
@@ -169,7 +159,9 @@ async def _resolve_brainstorming_scope(
                 None,
             )
             if activity:
-                raw_ids = dict(getattr(activity, "config", {}) or {}).get("participant_ids")
+                raw_ids = (getattr(activity, "config", None) or {}).get(
+                    "participant_ids"
+                )
                 if isinstance(raw_ids, list) and raw_ids:
                     return {str(pid).strip() for pid in raw_ids if str(pid).strip()}
         return None
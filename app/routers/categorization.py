@@ -8,9 +8,10 @@ from sqlalchemy.orm import Session, joinedload
 
 from app.auth import get_current_active_user
 from app.database import get_db
+from app.data.meeting_manager import facilitator_user_ids, participant_user_ids
 from app.models.categorization import CategorizationBallot
 from app.models.meeting import AgendaActivity, Meeting, MeetingFacilitator
-from app.models.user import User, UserRole
+from app.models.user import ADMIN_ROLES, User, UserRole
 from app.schemas.categorization import (
     CategorizationAssignmentRequest,
     CategorizationBallotAssignmentRequest,
@@ -68,21 +69,15 @@ def _resolve_activity(meeting: Meeting, activity_id: str) -> AgendaActivity:
 
 
 def _access(meeting: Meeting, user: User) -> tuple[bool, bool]:
-    facilitator_ids = {
-        link.user_id
-        for link in getattr(meeting, "facilitator_links", []) or []
-        if getattr(link, "user_id", None)
-    }
-    if getattr(meeting, "owner_id", None):
-        facilitator_ids.add(meeting.owner_id)
-    participant_ids = {
-        person.user_id for person in getattr(meeting, "participants", []) or []
-    }
-
+    user_id = user.user_id
     role = getattr(user, "role", UserRole.PARTICIPANT.value)
-    is_admin = role in {UserRole.ADMIN.value, UserRole.SUPER_ADMIN.value}
-    is_facilitator = is_admin or user.user_id in facilitator_ids
-    is_participant = is_facilitator or is_admin or user.user_id in participant_ids
+    is_admin = role in ADMIN_ROLES
+    is_facilitator = (
+        is_admin
+        or getattr(meeting, "owner_id", None) == user_id
+        or user_id in facilitator_user_ids(meeting)
+    )
+    is_participant = is_facilitator or user_id in participant_user_ids(meeting)
     if not is_participant:
         raise HTTPException(status_code=403, detail="You do not have access to this meeting.")
     return is_participant, is_facilitator
@@ -142,8 +137,7 @@ async def _resolve_participant_scope(
                         allowed = normalized
 
     if allowed is None and activity:
-        config = dict(getattr(activity, "config", {}) or {})
-        raw_ids = config.get("participant_ids")
+        raw_ids = (getattr(activity, "config", None) or {}).get("participant_ids")
         if isinstance(raw_ids, list) and raw_ids:
             allowed = {str(pid).strip() for pid in raw_ids if str(pid).strip()}
     return allowed, is_active
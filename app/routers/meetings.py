@@ -1,5 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Response, Query
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    status,
+    Response,
+    Query,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.schemas.meeting import (
     MeetingCreate,
@@ -21,14 +30,21 @@ from app.schemas.meeting import (
     JoinMeetingResponse,
     AgendaReorderPayload,
 )
-from app.models.user import User, UserRole
+from app.models.user import ADMIN_ROLES, User, UserRole
 from app.models.meeting import AgendaActivity, Meeting
 from app.models.idea import Idea
 from app.models.activity_bundle import ActivityBundle
-from app.models.voting import VotingVote
-from app.data.meeting_manager import MeetingManager, get_meeting_manager
+from app.models.voting import VotingVote, generate_vote_id
+from app.data.meeting_manager import (
+    MeetingManager,
+    activity_by_id,
+    facilitator_user_ids,
+    get_meeting_manager,
+    participant_user_ids,
+)
 from app.auth.auth import (
     get_current_user,
+    get_current_user_model,
     get_optional_user_model_dependency,
     create_access_token,
     ACCESS_TOKEN_EXPIRE_MINUTES,
@@ -36,17 +52,32 @@ from app.auth.auth import (
 )
 from app.config.loader import get_guest_join_enabled, get_secure_cookies_enabled
 from app.schemas.schemas import Permission
-from app.utils.security import get_password_hash
+from app.utils.security import make_unusable_password
 from fastapi import Request
-from typing import List, Optional, Literal, Iterable, Set, Dict
-from sqlalchemy import func
+from typing import (
+    AbstractSet,
+    BinaryIO,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+)
+from sqlalchemy import case, func, insert, update
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 from datetime import datetime, timezone
 from pathlib import Path
 import re
 from app.data.user_manager import UserManager, get_user_manager
 import logging
 from datetime import timedelta, UTC
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
 from app.services import meeting_state_manager
 from app.plugins.context import ActivityContext
 from app.plugins.registry import get_activity_registry
@@ -56,15 +87,39 @@ from app.plugins.autosave import start_autosave, stop_autosave
 from app.utils.websocket_manager import websocket_manager
 from app.utils.user_colors import get_user_color
 import json
+from dataclasses import dataclass
 import io
+import operator
+import orjson
+import secrets
+import tempfile
 import zipfile
 
 # Set up logging
 logger = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 MEETING_ARCHIVE_DIR = PROJECT_ROOT / "data" / "meetings_archive"
-
-router = APIRouter(prefix="/api/meetings", tags=["meetings"])
+EXPORT_CHUNK_SIZE = 64 * 1024
+IMPORT_SPOOL_MAX_SIZE = 10 * 1024 * 1024
+IMPORT_MAX_BODY_SIZE = 200 * 1024 * 1024
+# Each row in the parent_id CASE update binds three parameters (WHEN, THEN and
+# IN), so 300 rows stay under SQLite's historical 999-variable limit.
+IMPORT_PARENT_BATCH_SIZE = 300
+# JSON compresses well at low levels; level 3 is much faster than zlib's
+# default 6 for a few percent larger archives.
+EXPORT_COMPRESS_LEVEL = 3
+# Built once so list responses validate in a single pydantic-core call.
+_AGENDA_LIST_ADAPTER = TypeAdapter(List[AgendaActivityResponse])
+_MEETING_LIST_ADAPTER = TypeAdapter(List[MeetingResponse])
+# Naive datetimes are stored as UTC; orjson renders them with a +00:00 offset,
+# matching the isoformat() strings earlier exports contained.
+EXPORT_JSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+router = APIRouter(
+    prefix="/api/meetings",
+    tags=["meetings"],
+    default_response_class=ORJSONResponse,
+)
 
 
 class MeetingCreatePayload(BaseModel):
@@ -147,31 +202,63 @@ class ActivityParticipantAssignment(BaseModel):
     available_participants: List[dict] = Field(default_factory=list)
 
 
+_PARTICIPANT_FIELDS = operator.attrgetter(
+    "user_id", "login", "first_name", "last_name", "role"
+)
+_PARTICIPANT_SUMMARY_FIELDS = operator.attrgetter(
+    "user_id",
+    "login",
+    "first_name",
+    "last_name",
+    "avatar_color",
+    "avatar_key",
+    "avatar_icon_path",
+    "role",
+)
+
+
+def _participant_to_dict(participant: User) -> dict:
+    user_id, login, first_name, last_name, role = _PARTICIPANT_FIELDS(participant)
+    return {
+        "user_id": user_id,
+        "login": login,
+        "first_name": first_name,
+        "last_name": last_name,
+        "role": role,
+    }
+
+
 def _build_participant_summary(users: Iterable[User]) -> List[dict]:
     summary = []
     for user in users or []:
-        if not getattr(user, "user_id", None):
+        (
+            user_id,
+            login,
+            first_name,
+            last_name,
+            avatar_color,
+            avatar_key,
+            avatar_icon_path,
+            role,
+        ) = _PARTICIPANT_SUMMARY_FIELDS(user)
+        if not user_id:
             continue
         summary.append(
             {
-                "user_id": user.user_id,
-                "login": getattr(user, "login", None),
-                "first_name": getattr(user, "first_name", None),
-                "last_name": getattr(user, "last_name", None),
-                "avatar_color": getattr(user, "avatar_color", None),
-                "avatar_key": getattr(user, "avatar_key", None),
-                "avatar_icon_path": getattr(user, "avatar_icon_path", None),
-                "role": (
-                    getattr(user.role, "value", user.role)
-                    if getattr(user, "role", None)
-                    else None
-                ),
+                "user_id": user_id,
+                "login": login,
+                "first_name": first_name,
+                "last_name": last_name,
+                "avatar_color": avatar_color,
+                "avatar_key": avatar_key,
+                "avatar_icon_path": avatar_icon_path,
+                "role": role or None,
             }
         )
     summary.sort(
         key=lambda row: (
-            row.get("first_name") or "",
-            row.get("last_name") or "",
+            row["first_name"] or "",
+            row["last_name"] or "",
             row["user_id"],
         )
     )
@@ -200,40 +287,112 @@ def _build_activity_participant_assignment(
     )
 
 
+def _elapsed_seconds(started_at: datetime, now: datetime) -> int:
+    """Return whole seconds from ``started_at`` to ``now``, treating naive values as UTC."""
+    if started_at.tzinfo is None:
+        started_at = started_at.replace(tzinfo=timezone.utc)
+    return int((now - started_at).total_seconds())
+
+
+def _write_activity_timing(
+    db: Session,
+    activity: AgendaActivity,
+    *,
+    started_at: Optional[datetime],
+    stopped_at: Optional[datetime],
+    elapsed_duration: Optional[int],
+) -> None:
+    """Persist an activity's timing fields with a single targeted UPDATE.
+
+    The values are mirrored onto the loaded instance as committed state, so
+    callers can keep reading them without a refresh and the ORM does not
+    re-emit the same columns at the next flush.
+    """
+    db.execute(
+        update(AgendaActivity)
+        .where(AgendaActivity.activity_id == activity.activity_id)
+        .values(
+            started_at=started_at,
+            stopped_at=stopped_at,
+            elapsed_duration=elapsed_duration,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    set_committed_value(activity, "started_at", started_at)
+    set_committed_value(activity, "stopped_at", stopped_at)
+    set_committed_value(activity, "elapsed_duration", elapsed_duration)
+
+
+def _unloaded_relationship_session(meeting, relationship: str) -> Optional[Session]:
+    """Return the meeting's session if ``relationship`` has not been loaded yet."""
+    state = sa_inspect(meeting, raiseerr=False)
+    if state is None or state.session is None or relationship not in state.unloaded:
+        return None
+    return state.session
+
+
+@dataclass(frozen=True)
+class _MeetingAccess:
+    is_admin: bool
+    is_owner: bool
+    is_facilitator: bool
+
+    @property
+    def can_facilitate(self) -> bool:
+        return self.is_admin or self.is_owner or self.is_facilitator
+
+
+def _meeting_access(meeting, user) -> _MeetingAccess:
+    user_id = user.user_id
+    # Membership on an unloaded collection is answered by an EXISTS probe
+    # rather than hydrating every link just to test one id.
+    session = _unloaded_relationship_session(meeting, "facilitator_links")
+    if session is not None:
+        is_facilitator = MeetingManager(session).user_is_facilitator(
+            meeting.meeting_id, user_id
+        )
+    else:
+        is_facilitator = user_id in facilitator_user_ids(meeting)
+    return _MeetingAccess(
+        is_admin=user.role in ADMIN_ROLES,
+        is_owner=meeting.owner_id == user_id,
+        is_facilitator=is_facilitator,
+    )
+
+
 def _assert_meeting_access(
     meeting,
     user,
     require_facilitator: bool = False,
-) -> None:
-    facilitator_links = getattr(meeting, "facilitator_links", []) or []
-    participants = getattr(meeting, "participants", []) or []
-
-    is_admin = user.role in {UserRole.ADMIN, UserRole.SUPER_ADMIN}
-    is_owner = meeting.owner_id == user.user_id
-    is_facilitator = any(link.user_id == user.user_id for link in facilitator_links)
-    is_participant = any(person.user_id == user.user_id for person in participants)
+    detail: Optional[str] = None,
+) -> _MeetingAccess:
+    """Raise 403 unless ``user`` may use ``meeting``; return the computed flags."""
+    access = _meeting_access(meeting, user)
+    # Participants are only touched (and lazily loaded) when the caller is
+    # neither staff nor a facilitator.
+    if access.can_facilitate:
+        return access
 
     if require_facilitator:
-        if not (is_admin or is_owner or is_facilitator):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only facilitators can modify the meeting agenda.",
-            )
-        return
-
-    if not (is_admin or is_owner or is_facilitator or is_participant):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions to access this meeting",
+            detail=detail or "Only facilitators can modify the meeting agenda.",
         )
 
-
-def _serialize_datetime(value: Optional[datetime]) -> Optional[str]:
-    if not value:
-        return None
-    if value.tzinfo is None:
-        value = value.replace(tzinfo=timezone.utc)
-    return value.isoformat()
+    session = _unloaded_relationship_session(meeting, "participants")
+    if session is not None:
+        is_participant = MeetingManager(session).user_is_participant(
+            meeting.meeting_id, user.user_id
+        )
+    else:
+        participants = getattr(meeting, "participants", []) or []
+        is_participant = any(person.user_id == user.user_id for person in participants)
+    if not is_participant:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=detail or "Not enough permissions to access this meeting",
+        )
+    return access
 
 
 def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
@@ -241,12 +400,10 @@ def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
         return None
     if isinstance(value, datetime):
         return value
-    cleaned = str(value).strip()
-    if cleaned.endswith("Z"):
-        cleaned = f"{cleaned[:-1]}+00:00"
     try:
-        return datetime.fromisoformat(cleaned)
-    except ValueError:
+        # 3.11+ fromisoformat accepts the "Z" suffix natively.
+        return datetime.fromisoformat(value.strip())
+    except (AttributeError, ValueError):
         return None
 
 
@@ -295,14 +452,17 @@ def _build_meeting_export_bundle(
                 "instructions": activity.instructions,
                 "order_index": activity.order_index,
                 "config": dict(getattr(activity, "config", {}) or {}),
-                "started_at": _serialize_datetime(activity.started_at),
-                "stopped_at": _serialize_datetime(activity.stopped_at),
+                "started_at": activity.started_at,
+                "stopped_at": activity.stopped_at,
                 "elapsed_duration": activity.elapsed_duration,
             }
         )
 
     ideas = (
-        meeting_manager.db.query(Idea).filter(Idea.meeting_id == meeting.meeting_id).all()
+        meeting_manager.db.query(Idea)
+        .options(joinedload(Idea.author))
+        .filter(Idea.meeting_id == meeting.meeting_id)
+        .all()
     )
     votes = (
         meeting_manager.db.query(VotingVote)
@@ -312,16 +472,16 @@ def _build_meeting_export_bundle(
 
     return {
         "version": 1,
-        "exported_at": _serialize_datetime(datetime.now(timezone.utc)),
+        "exported_at": datetime.now(timezone.utc),
         "meeting": {
             "meeting_id": meeting.meeting_id,
             "title": meeting.title,
             "description": meeting.description,
             "status": meeting.status,
             "is_public": meeting.is_public,
-            "created_at": _serialize_datetime(meeting.created_at),
-            "start_time": _serialize_datetime(meeting.started_at),
-            "end_time": _serialize_datetime(meeting.end_time),
+            "created_at": meeting.created_at,
+            "start_time": meeting.started_at,
+            "end_time": meeting.end_time,
         },
         "facilitators": facilitators,
         "participants": participants,
@@ -331,8 +491,8 @@ def _build_meeting_export_bundle(
                 "id": idea.id,
                 "content": idea.content,
                 "parent_id": idea.parent_id,
-                "timestamp": _serialize_datetime(idea.timestamp),
-                "updated_at": _serialize_datetime(idea.updated_at),
+                "timestamp": idea.timestamp,
+                "updated_at": idea.updated_at,
                 "meeting_id": idea.meeting_id,
                 "activity_id": idea.activity_id,
                 "user_id": idea.user_id,
@@ -350,20 +510,115 @@ def _build_meeting_export_bundle(
                 "option_id": vote.option_id,
                 "option_label": vote.option_label,
                 "weight": vote.weight,
-                "created_at": _serialize_datetime(vote.created_at),
+                "created_at": vote.created_at,
             }
             for vote in votes
         ],
     }
 
 
-def _build_meeting_export_zip(bundle: Dict[str, object]) -> io.BytesIO:
-    payload = json.dumps(bundle, indent=2, ensure_ascii=True)
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
-        archive.writestr("meeting.json", payload)
-    buffer.seek(0)
-    return buffer
+class _ZipChunkSink:
+    """Write-only, non-seekable file object that hands zip bytes to a generator.
+
+    ``zipfile`` detects the missing ``tell``/``seek`` and falls back to data
+    descriptors, so CRC32 and sizes are emitted after each member's data.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _iter_export_json(bundle: Dict[str, object]) -> Iterator[bytes]:
+    """Encode the bundle piecewise so list sections are emitted row by row."""
+    yield b"{"
+    for index, (key, value) in enumerate(bundle.items()):
+        if index:
+            yield b","
+        yield orjson.dumps(key) + b":"
+        if isinstance(value, list):
+            yield b"["
+            for position, row in enumerate(value):
+                encoded = orjson.dumps(row, option=EXPORT_JSON_OPTIONS)
+                yield b"," + encoded if position else encoded
+            yield b"]"
+        else:
+            yield orjson.dumps(value, option=EXPORT_JSON_OPTIONS)
+    yield b"}"
+
+
+def _iter_meeting_export_zip(bundle: Dict[str, object]) -> Iterator[bytes]:
+    """Yield a zip containing ``meeting.json`` without materialising the JSON text."""
+    sink = _ZipChunkSink()
+    with zipfile.ZipFile(
+        sink, "w", zipfile.ZIP_DEFLATED, compresslevel=EXPORT_COMPRESS_LEVEL
+    ) as archive:
+        with archive.open("meeting.json", "w", force_zip64=True) as entry:
+            pending: List[bytes] = []
+            pending_size = 0
+            for fragment in _iter_export_json(bundle):
+                pending.append(fragment)
+                pending_size += len(fragment)
+                if pending_size < EXPORT_CHUNK_SIZE:
+                    continue
+                entry.write(b"".join(pending))
+                pending.clear()
+                pending_size = 0
+                chunk = sink.drain()
+                if chunk:
+                    yield chunk
+            if pending:
+                entry.write(b"".join(pending))
+    yield sink.drain()
+
+
+def _import_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail="Import file is too large",
+    )
+
+
+def _read_import_archive(spooled: BinaryIO) -> Dict[str, object]:
+    """Parse the JSON export out of an uploaded bundle without copying it."""
+    if spooled.seek(0, io.SEEK_END) == 0:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Import file is empty")
+    spooled.seek(0)
+    try:
+        archive = zipfile.ZipFile(spooled)
+    except zipfile.BadZipFile as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid zip file"
+        ) from exc
+
+    with archive:
+        json_name = next(
+            (name for name in archive.namelist() if name.lower().endswith(".json")),
+            None,
+        )
+        if not json_name:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Meeting bundle is missing a JSON export",
+            )
+        try:
+            with archive.open(json_name) as handle:
+                return orjson.loads(handle.read())
+        except orjson.JSONDecodeError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON export"
+            ) from exc
 
 
 def _write_meeting_archive_bundle(
@@ -385,10 +640,11 @@ def _write_meeting_archive_bundle(
     meeting_payload = bundle.get("meeting")
     if isinstance(meeting_payload, dict):
         meeting_payload["status"] = "archived"
-    archive_buffer = _build_meeting_export_zip(bundle)
 
     archive_path = archive_dir / filename
-    archive_path.write_bytes(archive_buffer.getvalue())
+    with archive_path.open("wb") as handle:
+        for chunk in _iter_meeting_export_zip(bundle):
+            handle.write(chunk)
     try:
         return str(archive_path.relative_to(PROJECT_ROOT))
     except ValueError:
@@ -396,13 +652,18 @@ def _write_meeting_archive_bundle(
 
 
 def _resolve_import_user_id(
-    entry: Optional[Dict[str, Optional[str]]], user_manager: UserManager
+    entry: Optional[Dict[str, Optional[str]]],
+    user_manager: UserManager,
+    users_by_id: Optional[Dict[str, User]] = None,
 ) -> Optional[str]:
     if not entry:
         return None
     user_id = entry.get("user_id")
     if user_id:
-        user = user_manager.get_user_by_id(user_id)
+        if users_by_id is not None:
+            user = users_by_id.get(user_id)
+        else:
+            user = user_manager.get_user_by_id(user_id)
         if user:
             return user.user_id
     email = entry.get("email")
@@ -446,10 +707,9 @@ async def _broadcast_agenda_update(
     _apply_activity_lock_metadata(meeting_id, meeting_manager, updated_agenda_items)
     _apply_transfer_counts(meeting_id, meeting_manager, updated_agenda_items)
     # Convert to Pydantic models for consistent output
-    payload = [
-        AgendaActivityResponse.model_validate(item).model_dump()
-        for item in updated_agenda_items
-    ]
+    payload = _AGENDA_LIST_ADAPTER.dump_python(
+        _AGENDA_LIST_ADAPTER.validate_python(updated_agenda_items)
+    )
     await websocket_manager.broadcast(
         meeting_id,
         {
@@ -466,9 +726,12 @@ def _apply_transfer_counts(
     meeting_id: str,
     meeting_manager: MeetingManager,
     agenda_items: Iterable[AgendaActivity],
+    *,
+    meeting: Optional[Meeting] = None,
 ) -> None:
     db = meeting_manager.db
-    meeting = meeting_manager.get_meeting(meeting_id)
+    if meeting is None:
+        meeting = meeting_manager.get_meeting(meeting_id)
     if not meeting:
         return
 
@@ -574,11 +837,37 @@ def _apply_activity_lock_metadata(
         setattr(item, "locked_config_keys", deduped)
 
 
+def _conflict_response(detail: str, conflict_payload: Dict[str, object]) -> Response:
+    """Build a 409 whose body and X-Conflict-Details share one encoding pass."""
+    serialized = orjson.dumps(conflict_payload)
+    body = b"".join(
+        (b'{"detail":', orjson.dumps(detail), b',"conflict_details":', serialized, b"}")
+    )
+    # Header values must stay latin-1 safe; orjson emits raw UTF-8, so fall
+    # back to ASCII-escaped JSON when a display name is non-ASCII.
+    header = serialized.decode() if serialized.isascii() else json.dumps(conflict_payload)
+    return Response(
+        content=body,
+        status_code=status.HTTP_409_CONFLICT,
+        media_type="application/json",
+        headers={"X-Conflict-Details": header},
+    )
+
+
+def _clean_participant_ids(raw_ids) -> List[str]:
+    """Strip, dedupe and sort a participant id list; non-lists yield []."""
+    if not isinstance(raw_ids, list):
+        return []
+    return sorted({pid for pid in (str(value).strip() for value in raw_ids) if pid})
+
+
 def _format_conflicting_users(user_manager: UserManager, user_ids: Iterable[str]):
     """Build a lightweight descriptor list for conflicting participants."""
+    user_ids = list(user_ids)
+    users_by_id = user_manager.get_users_by_ids(user_ids)
     details = []
     for user_id in user_ids:
-        user_obj = user_manager.get_user_by_id(user_id)
+        user_obj = users_by_id.get(user_id)
         if user_obj:
             display_name = (
                 f"{(user_obj.first_name or '').strip()} {(user_obj.last_name or '').strip()}".strip()
@@ -727,7 +1016,7 @@ async def get_active_meetings(
         logger.debug(f"Fetching active meetings for user: {current_user}")
         # Removed await as get_active_meetings is synchronous
         meetings = meeting_manager.get_active_meetings()
-        return [MeetingResponse.model_validate(meeting) for meeting in meetings]
+        return _MEETING_LIST_ADAPTER.validate_python(meetings)
     except Exception as e:
         logger.error(f"Error fetching active meetings: {str(e)}")
         raise HTTPException(
@@ -776,16 +1065,14 @@ async def create_meeting(
 
         participant_ids = []
         if payload.participant_ids:
-            participant_ids = [
-                pid
-                for pid in (str(value).strip() for value in payload.participant_ids)
-                if pid
-            ]
             # Preserve order while removing duplicates
-            seen = set()
-            participant_ids = [
-                pid for pid in participant_ids if not (pid in seen or seen.add(pid))
-            ]
+            participant_ids = list(
+                dict.fromkeys(
+                    pid
+                    for pid in (str(value).strip() for value in payload.participant_ids)
+                    if pid
+                )
+            )
 
         meeting_request = MeetingCreate(
             title=payload.title,
@@ -838,16 +1125,12 @@ async def update_meeting_configuration(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found"
             )
 
-        facilitator_links = getattr(meeting, "facilitator_links", []) or []
-        is_admin = user.role in {UserRole.ADMIN, UserRole.SUPER_ADMIN}
-        is_owner = meeting.owner_id == user.user_id
-        is_facilitator = any(link.user_id == user.user_id for link in facilitator_links)
-
-        if not (is_admin or is_owner or is_facilitator):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You do not have permission to update this meeting",
-            )
+        _assert_meeting_access(
+            meeting,
+            user,
+            require_facilitator=True,
+            detail="You do not have permission to update this meeting",
+        )
 
         start_dt = payload.scheduled_datetime
         end_dt = start_dt + timedelta(minutes=60) if start_dt else None
@@ -868,15 +1151,13 @@ async def update_meeting_configuration(
 
         participant_ids = []
         if payload.participant_ids:
-            participant_ids = [
-                pid
-                for pid in (str(value).strip() for value in payload.participant_ids)
-                if pid
-            ]
-            seen = set()
-            participant_ids = [
-                pid for pid in participant_ids if not (pid in seen or seen.add(pid))
-            ]
+            participant_ids = list(
+                dict.fromkeys(
+                    pid
+                    for pid in (str(value).strip() for value in payload.participant_ids)
+                    if pid
+                )
+            )
 
         updated_meeting = meeting_manager.update_meeting_configuration(
             meeting_id,
@@ -945,10 +1226,10 @@ async def get_meeting_agenda(
         )
 
     _assert_meeting_access(meeting, user, require_facilitator=False)
-    agenda_items = sorted(meeting.agenda_activities, key=lambda item: item.order_index)
+    agenda_items = list(meeting.agenda_activities)
     _apply_activity_lock_metadata(meeting_id, meeting_manager, agenda_items)
-    _apply_transfer_counts(meeting_id, meeting_manager, agenda_items)
-    return [AgendaActivityResponse.model_validate(item) for item in agenda_items]
+    _apply_transfer_counts(meeting_id, meeting_manager, agenda_items, meeting=meeting)
+    return _AGENDA_LIST_ADAPTER.validate_python(agenda_items)
 
 
 @router.post(
@@ -1088,7 +1369,7 @@ async def reorder_meeting_agenda_items(
     # Broadcast agenda update
     await _broadcast_agenda_update(meeting_id, user.user_id, meeting_manager)
 
-    return [AgendaActivityResponse.model_validate(item) for item in reordered_agenda]
+    return _AGENDA_LIST_ADAPTER.validate_python(reordered_agenda)
 
 
 # Participants administration
@@ -1111,16 +1392,7 @@ async def list_meeting_participants(
         )
     _assert_meeting_access(meeting, user, require_facilitator=True)
     participants = meeting_manager.list_participants(meeting_id)
-    return [
-        {
-            "user_id": p.user_id,
-            "login": p.login,
-            "first_name": getattr(p, "first_name", None),
-            "last_name": getattr(p, "last_name", None),
-            "role": getattr(p.role, "value", p.role),
-        }
-        for p in participants
-    ]
+    return [_participant_to_dict(p) for p in participants]
 
 
 @router.post("/{meeting_id}/participants", status_code=status.HTTP_200_OK)
@@ -1158,14 +1430,7 @@ async def add_meeting_participant(
     return {
         "meeting_id": updated.meeting_id,
         "participants": [
-            {
-                "user_id": p.user_id,
-                "login": p.login,
-                "first_name": getattr(p, "first_name", None),
-                "last_name": getattr(p, "last_name", None),
-                "role": getattr(p.role, "value", p.role),
-            }
-            for p in (updated.participants or [])
+            _participant_to_dict(p) for p in (updated.participants or [])
         ],
     }
 
@@ -1194,14 +1459,7 @@ async def remove_meeting_participant(
     return {
         "meeting_id": updated.meeting_id,
         "participants": [
-            {
-                "user_id": p.user_id,
-                "login": p.login,
-                "first_name": getattr(p, "first_name", None),
-                "last_name": getattr(p, "last_name", None),
-                "role": getattr(p.role, "value", p.role),
-            }
-            for p in (updated.participants or [])
+            _participant_to_dict(p) for p in (updated.participants or [])
         ],
     }
 
@@ -1226,16 +1484,30 @@ async def bulk_update_meeting_participants(
         )
     _assert_meeting_access(meeting, user, require_facilitator=True)
 
+    if not payload.add and not payload.remove:
+        # Idempotent retries carry nothing to apply; answer from the meeting
+        # already loaded for the access check.
+        return {
+            "meeting_id": meeting_id,
+            "participants": _build_participant_summary(meeting.participants or []),
+            "summary": {
+                "added_user_ids": [],
+                "removed_user_ids": [],
+                "already_participants": [],
+                "missing_user_ids": [],
+                "not_in_meeting": [],
+            },
+        }
+
     updated_meeting, summary = meeting_manager.bulk_update_participants(
         meeting_id,
         add_user_ids=payload.add,
         remove_user_ids=payload.remove,
     )
-    refreshed = meeting_manager.get_meeting(meeting_id) or updated_meeting
     return {
-        "meeting_id": refreshed.meeting_id,
+        "meeting_id": meeting_id,
         "participants": _build_participant_summary(
-            getattr(refreshed, "participants", []) or []
+            getattr(updated_meeting, "participants", []) or []
         ),
         "summary": summary,
     }
@@ -1266,14 +1538,7 @@ async def get_activity_participant_assignment(
 
     _assert_meeting_access(meeting, user, require_facilitator=True)
 
-    activity = next(
-        (
-            item
-            for item in getattr(meeting, "agenda_activities", [])
-            if item.activity_id == activity_id
-        ),
-        None,
-    )
+    activity = activity_by_id(meeting, activity_id)
     if not activity:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Agenda activity not found"
@@ -1310,40 +1575,30 @@ async def update_activity_participant_assignment(
 
     _assert_meeting_access(meeting, user, require_facilitator=True)
 
-    activity = next(
-        (
-            item
-            for item in getattr(meeting, "agenda_activities", [])
-            if item.activity_id == activity_id
-        ),
-        None,
-    )
+    activity = activity_by_id(meeting, activity_id)
     if not activity:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Agenda activity not found"
         )
 
-    meeting_participant_ids: Set[str] = {
-        participant.user_id
-        for participant in getattr(meeting, "participants", []) or []
-        if participant.user_id
-    }
+    meeting_participant_ids = participant_user_ids(meeting)
 
     cleaned_ids: List[str] = []
     if payload.mode == "custom":
-        for raw in payload.participant_ids or []:
-            identifier = (raw or "").strip()
-            if not identifier:
-                continue
-            if identifier not in meeting_participant_ids:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"User {identifier} is not part of this meeting and cannot be assigned.",
-                )
-            cleaned_ids.append(identifier)
+        cleaned_ids = list(
+            dict.fromkeys(filter(None, map(str.strip, payload.participant_ids or ())))
+        )
+        if not meeting_participant_ids.issuperset(cleaned_ids):
+            identifier = next(
+                pid for pid in cleaned_ids if pid not in meeting_participant_ids
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"User {identifier} is not part of this meeting and cannot be assigned.",
+            )
 
-    desired_set: Set[str] = (
-        set(cleaned_ids) if payload.mode == "custom" else set(meeting_participant_ids)
+    desired_set: AbstractSet[str] = (
+        frozenset(cleaned_ids) if payload.mode == "custom" else meeting_participant_ids
     )
 
     snapshot = await meeting_state_manager.snapshot(meeting_id)
@@ -1375,6 +1630,8 @@ async def update_activity_participant_assignment(
             meeting_id,
             activity_id,
             desired_set,
+            meeting=meeting,
+            snapshot=snapshot,
         )
         if conflicting_user_ids:
             current_assignment = _build_activity_participant_assignment(meeting, activity)
@@ -1387,13 +1644,9 @@ async def update_activity_participant_assignment(
                 if snapshot
                 else None,
             }
-            return JSONResponse(
-                status_code=status.HTTP_409_CONFLICT,
-                content={
-                    "detail": "Updating this activity roster would create participant conflicts with another active activity.",
-                    "conflict_details": conflict_payload,
-                },
-                headers={"X-Conflict-Details": json.dumps(conflict_payload)},
+            return _conflict_response(
+                "Updating this activity roster would create participant conflicts with another active activity.",
+                conflict_payload,
             )
 
     participant_ids = cleaned_ids if payload.mode == "custom" else None
@@ -1409,11 +1662,7 @@ async def update_activity_participant_assignment(
     )
 
     if is_active:
-        desired_ids_sorted = (
-            sorted(desired_set)
-            if payload.mode == "custom"
-            else sorted(meeting_participant_ids)
-        )
+        desired_ids_sorted = sorted(desired_set)
         await _apply_live_roster_patch(
             meeting_id=meeting_id,
             activity_id=activity_id,
@@ -1529,13 +1778,16 @@ async def export_meeting(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found")
 
     _assert_meeting_access(meeting, user, require_facilitator=True)
-    bundle = _build_meeting_export_bundle(meeting, meeting_manager)
-    buffer = _build_meeting_export_zip(bundle)
+    # The idea/vote reads share one synchronous Session, which must not be used
+    # from two threads at once; run the whole build off the event loop instead.
+    bundle = await run_in_threadpool(
+        _build_meeting_export_bundle, meeting, meeting_manager
+    )
 
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     filename = f"meeting_{meeting.meeting_id}_{timestamp}.zip"
     return StreamingResponse(
-        buffer,
+        _iter_meeting_export_zip(bundle),
         media_type="application/zip",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -1554,48 +1806,39 @@ async def import_meeting(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
     content_type = request.headers.get("content-type", "")
-    if content_type.lower().startswith("multipart/"):
-        try:
-            form = await request.form()
-        except Exception as exc:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="There was an error parsing the body.",
-            ) from exc
-        uploaded = form.get("file")
-        if not uploaded or not hasattr(uploaded, "read"):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Import file is missing",
-            )
-        raw_bytes = await uploaded.read()
-    else:
-        raw_bytes = await request.body()
-    if not raw_bytes:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Import file is empty")
-
-    try:
-        archive = zipfile.ZipFile(io.BytesIO(raw_bytes))
-    except zipfile.BadZipFile as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid zip file"
-        ) from exc
-
-    json_name = next(
-        (name for name in archive.namelist() if name.lower().endswith(".json")), None
-    )
-    if not json_name:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Meeting bundle is missing a JSON export",
-        )
-
+    spooled: Optional[BinaryIO] = None
     try:
-        export_payload = json.loads(archive.read(json_name).decode("utf-8"))
-    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON export"
-        ) from exc
+        if content_type.lower().startswith("multipart/"):
+            try:
+                form = await request.form()
+            except Exception as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="There was an error parsing the body.",
+                ) from exc
+            uploaded = form.get("file")
+            if not uploaded or not hasattr(uploaded, "read"):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Import file is missing",
+                )
+            spooled = uploaded.file
+            if (getattr(uploaded, "size", None) or 0) > IMPORT_MAX_BODY_SIZE:
+                raise _import_too_large()
+            spooled.seek(0)
+        else:
+            spooled = tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MAX_SIZE)
+            received = 0
+            async for chunk in request.stream():
+                received += len(chunk)
+                if received > IMPORT_MAX_BODY_SIZE:
+                    raise _import_too_large()
+                # Writes hit disk once the spool rolls over; keep them off the loop.
+                await run_in_threadpool(spooled.write, chunk)
+        export_payload = _read_import_archive(spooled)
+    finally:
+        if spooled is not None:
+            spooled.close()
 
     meeting_payload = export_payload.get("meeting", {}) or {}
     base_title = meeting_payload.get("title") or "Imported Meeting"
@@ -1614,25 +1857,29 @@ async def import_meeting(
     new_start = datetime.now(UTC)
     new_end = new_start + timedelta(minutes=duration_minutes)
 
+    exported_users = [
+        entry
+        for key in ("participants", "facilitators", "ideas", "votes")
+        for entry in export_payload.get(key, []) or []
+        if isinstance(entry, dict)
+    ]
+    users_by_id = user_manager.get_users_by_ids(
+        entry.get("user_id") for entry in exported_users
+    )
+
     participants = []
     for entry in export_payload.get("participants", []) or []:
-        resolved = _resolve_import_user_id(entry, user_manager)
+        resolved = _resolve_import_user_id(entry, user_manager, users_by_id)
         if resolved and resolved != user.user_id:
             participants.append(resolved)
-    seen_participants = set()
-    participant_ids = [
-        pid for pid in participants if not (pid in seen_participants or seen_participants.add(pid))
-    ]
+    participant_ids = list(dict.fromkeys(participants))
 
     facilitators = []
     for entry in export_payload.get("facilitators", []) or []:
-        resolved = _resolve_import_user_id(entry, user_manager)
+        resolved = _resolve_import_user_id(entry, user_manager, users_by_id)
         if resolved and resolved != user.user_id:
             facilitators.append(resolved)
-    seen_facilitators = set()
-    facilitator_ids = [
-        fid for fid in facilitators if not (fid in seen_facilitators or seen_facilitators.add(fid))
-    ]
+    facilitator_ids = list(dict.fromkeys(facilitators))
 
     agenda_payloads: List[AgendaActivityCreate] = []
     for entry in export_payload.get("agenda", []) or []:
@@ -1690,76 +1937,93 @@ async def import_meeting(
             if mapped:
                 activity_map[old_id] = mapped
 
-        idea_id_map: Dict[int, int] = {}
-        idea_parent_links: List[Dict[str, int]] = []
+        # Server defaults only apply to omitted columns, and bulk executemany
+        # needs uniform rows, so rows without a source timestamp use import time.
+        imported_at = datetime.now(UTC)
+        idea_rows: List[Dict[str, object]] = []
+        idea_sources: List[Tuple[object, object]] = []
         for idea in export_payload.get("ideas", []) or []:
             content = (idea.get("content") or "").strip()
             if not content:
                 continue
-            old_id = idea.get("id")
-            old_parent_id = idea.get("parent_id")
-            old_activity_id = idea.get("activity_id")
-            mapped_activity = activity_map.get(old_activity_id)
-            raw_user_id = idea.get("user_id")
-            resolved_user_id = None
-            if raw_user_id:
-                resolved_user = user_manager.get_user_by_id(raw_user_id)
-                if resolved_user:
-                    resolved_user_id = resolved_user.user_id
-
-            db_idea = Idea(
-                content=content,
-                parent_id=None,
-                meeting_id=new_meeting.meeting_id,
-                activity_id=mapped_activity,
-                user_id=resolved_user_id,
-                submitted_name=idea.get("submitted_name"),
+            resolved_user = users_by_id.get(idea.get("user_id") or "")
+            idea_rows.append(
+                {
+                    "content": content,
+                    "parent_id": None,
+                    "meeting_id": new_meeting.meeting_id,
+                    "activity_id": activity_map.get(idea.get("activity_id")),
+                    "user_id": resolved_user.user_id if resolved_user else None,
+                    "submitted_name": idea.get("submitted_name"),
+                    "timestamp": _parse_datetime(idea.get("timestamp"))
+                    or imported_at,
+                }
             )
-            timestamp = _parse_datetime(idea.get("timestamp"))
-            if timestamp:
-                db_idea.timestamp = timestamp
-            meeting_manager.db.add(db_idea)
-            meeting_manager.db.flush()
+            idea_sources.append((idea.get("id"), idea.get("parent_id")))
 
-            if isinstance(old_id, int):
-                idea_id_map[old_id] = db_idea.id
-            if isinstance(old_parent_id, int):
-                idea_parent_links.append(
-                    {"child_id": db_idea.id, "parent_id": old_parent_id}
+        idea_id_map: Dict[int, int] = {}
+        idea_parent_links: List[Tuple[int, int]] = []
+        if idea_rows:
+            new_idea_ids = (
+                meeting_manager.db.execute(
+                    insert(Idea).returning(Idea.id, sort_by_parameter_order=True),
+                    idea_rows,
                 )
-
-        for link in idea_parent_links:
-            parent_new_id = idea_id_map.get(link["parent_id"])
-            if not parent_new_id:
-                continue
-            meeting_manager.db.query(Idea).filter(Idea.id == link["child_id"]).update(
-                {"parent_id": parent_new_id}
+                .scalars()
+                .all()
+            )
+            for new_id, (old_id, old_parent_id) in zip(new_idea_ids, idea_sources):
+                if isinstance(old_id, int):
+                    idea_id_map[old_id] = new_id
+                if isinstance(old_parent_id, int):
+                    idea_parent_links.append((new_id, old_parent_id))
+
+        parent_by_child = {
+            child_id: idea_id_map[old_parent_id]
+            for child_id, old_parent_id in idea_parent_links
+            if idea_id_map.get(old_parent_id)
+        }
+        # One UPDATE ... SET parent_id = CASE id ... per batch; see
+        # IMPORT_PARENT_BATCH_SIZE for the bound-parameter budget.
+        child_ids = list(parent_by_child)
+        for start in range(0, len(child_ids), IMPORT_PARENT_BATCH_SIZE):
+            batch = {
+                child_id: parent_by_child[child_id]
+                for child_id in child_ids[start : start + IMPORT_PARENT_BATCH_SIZE]
+            }
+            meeting_manager.db.execute(
+                update(Idea)
+                .where(Idea.id.in_(batch))
+                .values(parent_id=case(batch, value=Idea.id))
+                .execution_options(synchronize_session=False)
             )
 
+        vote_rows: List[Dict[str, object]] = []
         for vote in export_payload.get("votes", []) or []:
-            old_activity_id = vote.get("activity_id")
-            mapped_activity = activity_map.get(old_activity_id)
+            mapped_activity = activity_map.get(vote.get("activity_id"))
             if not mapped_activity:
                 continue
             raw_user_id = vote.get("user_id")
             if not raw_user_id:
                 continue
-            resolved_user = user_manager.get_user_by_id(raw_user_id)
+            resolved_user = users_by_id.get(raw_user_id)
             if not resolved_user:
                 continue
-
-            db_vote = VotingVote(
-                meeting_id=new_meeting.meeting_id,
-                activity_id=mapped_activity,
-                user_id=resolved_user.user_id,
-                option_id=vote.get("option_id") or "",
-                option_label=vote.get("option_label") or "",
-                weight=int(vote.get("weight") or 1),
+            vote_rows.append(
+                {
+                    "vote_id": generate_vote_id(),
+                    "meeting_id": new_meeting.meeting_id,
+                    "activity_id": mapped_activity,
+                    "user_id": resolved_user.user_id,
+                    "option_id": vote.get("option_id") or "",
+                    "option_label": vote.get("option_label") or "",
+                    "weight": int(vote.get("weight") or 1),
+                    "created_at": _parse_datetime(vote.get("created_at"))
+                    or imported_at,
+                }
             )
-            created_at = _parse_datetime(vote.get("created_at"))
-            if created_at:
-                db_vote.created_at = created_at
-            meeting_manager.db.add(db_vote)
+        if vote_rows:
+            meeting_manager.db.execute(insert(VotingVote), vote_rows)
 
         meeting_manager.db.commit()
         refreshed = meeting_manager.get_meeting(new_meeting.meeting_id) or new_meeting
@@ -1779,50 +2043,33 @@ async def import_meeting(
 @router.get("/{meeting_id}", response_model=MeetingResponse)
 async def get_meeting(
     meeting_id: str,
-    current_user: str = Depends(get_current_user),
-    user_manager: UserManager = Depends(
-        get_user_manager
-    ),  # Use get_user_manager dependency
+    user: User = Depends(get_current_user_model),
     meeting_manager: MeetingManager = Depends(
         get_meeting_manager
     ),  # Inject MeetingManager
 ):
     try:
-        # Get user info using injected user_manager and email
-        user = user_manager.get_user_by_login(current_user)  # Removed db parameter
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-            )
-
-        # Implement meeting fetching logic using injected meeting_manager
-        meeting = meeting_manager.get_meeting(meeting_id)  # Removed await
+        # Access is checked inside the query; only a miss needs the 403/404 split.
+        meeting = meeting_manager.get_meeting_for_user(meeting_id, user)
         if not meeting:
+            if meeting_manager.meeting_exists(meeting_id):
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Not enough permissions to view this meeting",
+                )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found"
             )
 
-        facilitator_links = getattr(meeting, "facilitator_links", []) or []
-        participants = getattr(meeting, "participants", []) or []
-        is_admin = user.role in {UserRole.ADMIN, UserRole.SUPER_ADMIN}
-        is_owner = meeting.owner_id == user.user_id
-        is_facilitator = any(link.user_id == user.user_id for link in facilitator_links)
-        is_participant = any(person.user_id == user.user_id for person in participants)
-        if not (is_admin or is_owner or is_facilitator or is_participant):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not enough permissions to view this meeting",
+        # Lock and transfer metadata only drive facilitator controls; plain
+        # participants get the schema defaults and skip the per-activity work.
+        if _meeting_access(meeting, user).can_facilitate:
+            agenda_items = getattr(meeting, "agenda_activities", []) or []
+            _apply_activity_lock_metadata(meeting_id, meeting_manager, agenda_items)
+            _apply_transfer_counts(
+                meeting_id, meeting_manager, agenda_items, meeting=meeting
             )
 
-        _apply_activity_lock_metadata(
-            meeting_id,
-            meeting_manager,
-            getattr(meeting, "agenda_activities", []) or [],
-        )
-        _apply_transfer_counts(
-            meeting_id, meeting_manager, getattr(meeting, "agenda_activities", []) or []
-        )
-
         return MeetingResponse.model_validate(meeting)
     except HTTPException:
         raise
@@ -1838,14 +2085,9 @@ async def get_meeting(
 @router.get("/{meeting_id}/state", response_model=MeetingStateSnapshot)
 async def get_meeting_state(
     meeting_id: str,
-    current_user: str = Depends(get_current_user),
-    user_manager: UserManager = Depends(get_user_manager),
+    user: User = Depends(get_current_user_model),
     meeting_manager: MeetingManager = Depends(get_meeting_manager),
 ):
-    user = user_manager.get_user_by_login(current_user)
-    if not user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-
     meeting = meeting_manager.get_meeting(meeting_id)
     if not meeting:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found")
@@ -1861,39 +2103,26 @@ async def get_meeting_state(
 async def update_meeting(
     meeting_id: str,
     meeting: MeetingUpdate,
-    current_user: str = Depends(get_current_user),
-    user_manager: UserManager = Depends(
-        get_user_manager
-    ),  # Use get_user_manager dependency
+    user: User = Depends(get_current_user_model),
     meeting_manager: MeetingManager = Depends(
         get_meeting_manager
     ),  # Inject MeetingManager
 ):
-    user = user_manager.get_user_by_login(current_user)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-        )
-
     existing_meeting = meeting_manager.get_meeting(meeting_id)
     if not existing_meeting:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found"
         )
 
-    facilitator_links = getattr(existing_meeting, "facilitator_links", []) or []
-    is_admin = user.role in {UserRole.ADMIN, UserRole.SUPER_ADMIN}
-    is_owner = existing_meeting.owner_id == user.user_id
-    is_facilitator = any(link.user_id == user.user_id for link in facilitator_links)
-
-    if not (is_admin or is_owner or is_facilitator):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions to update this meeting",
-        )
+    access = _assert_meeting_access(
+        existing_meeting,
+        user,
+        require_facilitator=True,
+        detail="Not enough permissions to update this meeting",
+    )
 
     update_payload = meeting.model_dump(exclude_unset=True)
-    if is_facilitator and not (is_admin or is_owner):
+    if not (access.is_admin or access.is_owner):
         restricted_fields = {"owner_id", "facilitator_ids"}
         attempted = restricted_fields.intersection(update_payload.keys())
         if attempted:
@@ -1915,33 +2144,24 @@ async def update_meeting(
 async def control_meeting(
     meeting_id: str,
     control: MeetingControlRequest,
-    current_user: str = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    user: User = Depends(get_current_user_model),
     user_manager: UserManager = Depends(get_user_manager),
     meeting_manager: MeetingManager = Depends(get_meeting_manager),
 ):
     """Allow facilitators to start/stop/pause/resume collaborative tools and broadcast state."""
-    user = user_manager.get_user_by_login(current_user)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-        )
-
     meeting = meeting_manager.get_meeting(meeting_id)
     if not meeting:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found"
         )
 
-    facilitator_links = getattr(meeting, "facilitator_links", []) or []
-    is_admin = user.role in {UserRole.ADMIN, UserRole.SUPER_ADMIN}
-    is_owner = meeting.owner_id == user.user_id
-    is_facilitator = any(link.user_id == user.user_id for link in facilitator_links)
-
-    if not (is_admin or is_owner or is_facilitator):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only facilitators can control meeting tools.",
-        )
+    _assert_meeting_access(
+        meeting,
+        user,
+        require_facilitator=True,
+        detail="Only facilitators can control meeting tools.",
+    )
 
     patch: dict = {}
     metadata_patch = dict(control.metadata or {})
@@ -1949,14 +2169,7 @@ async def control_meeting(
 
     # Helper to find the activity based on control.activityId
     if control.activityId:
-        activity_to_control = next(
-            (
-                a
-                for a in meeting.agenda_activities
-                if a.activity_id == control.activityId
-            ),
-            None,
-        )
+        activity_to_control = activity_by_id(meeting, control.activityId)
         if not activity_to_control:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1964,57 +2177,66 @@ async def control_meeting(
             )
 
     current_time_utc = datetime.now(timezone.utc)
+    current_time_iso = current_time_utc.isoformat()
     current_meeting_state = await meeting_state_manager.snapshot(
         meeting_id
     )  # Moved this line
 
+    def _all_meeting_participant_ids() -> FrozenSet[str]:
+        # The roster is already loaded on ``meeting``; the id set is cached on
+        # it no matter how many fallbacks ask for it.
+        return participant_user_ids(meeting)
+
     def _resolve_participant_ids_for_activity(
-        activity, default_ids: Optional[Iterable[str]] = None
+        activity, default_ids: Optional[AbstractSet[str]] = None
     ) -> List[str]:
         """Resolve participant ids for an activity, preferring live state metadata, then provided defaults, then config/all."""
         # 1) Live state (preserves custom scopes from previous start)
         if current_meeting_state:
+            activity_id = getattr(activity, "activity_id", None)
             active_entries = current_meeting_state.get("activeActivities") or []
             if isinstance(active_entries, dict):
-                active_entries = active_entries.values()
-            for entry in active_entries:
-                if not isinstance(entry, dict):
-                    continue
-                entry_id = entry.get("activityId") or entry.get("activity_id")
-                if entry_id == getattr(activity, "activity_id", None):
-                    ids = entry.get("participantIds") or entry.get("participant_ids")
-                    if isinstance(ids, list) and ids:
-                        cleaned = [str(pid).strip() for pid in ids if str(pid).strip()]
-                        if cleaned:
-                            return sorted(set(cleaned))
-                    break
+                entry = active_entries.get(activity_id)
+            else:
+                # Snapshots list entries sorted by id; only the matching one matters.
+                entry = next(
+                    (
+                        item
+                        for item in active_entries
+                        if isinstance(item, dict)
+                        and (item.get("activityId") or item.get("activity_id"))
+                        == activity_id
+                    ),
+                    None,
+                )
+            if isinstance(entry, dict):
+                cleaned = _clean_participant_ids(
+                    entry.get("participantIds") or entry.get("participant_ids")
+                )
+                if cleaned:
+                    return cleaned
 
         # 2) Explicit metadata on the incoming control payload
         meta_ids = metadata_patch.get("participantIds") or metadata_patch.get(
             "participant_ids"
         )
-        if isinstance(meta_ids, list) and meta_ids:
-            cleaned = [str(pid).strip() for pid in meta_ids if str(pid).strip()]
-            if cleaned:
-                return sorted(set(cleaned))
+        cleaned = _clean_participant_ids(meta_ids)
+        if cleaned:
+            return cleaned
 
-        # 3) Default provided by caller (e.g., computed during start)
+        # 3) Default provided by caller (already normalised during start)
         if default_ids:
-            cleaned = [str(pid).strip() for pid in default_ids if str(pid).strip()]
-            if cleaned:
-                return sorted(set(cleaned))
+            return sorted(default_ids)
 
         # 4) Activity config
-        config = dict(getattr(activity, "config", {}) or {})
-        raw_ids = config.get("participant_ids")
-        if isinstance(raw_ids, list) and raw_ids:
-            cleaned = [str(pid).strip() for pid in raw_ids if str(pid).strip()]
-            if cleaned:
-                return sorted(set(cleaned))
+        cleaned = _clean_participant_ids(
+            (getattr(activity, "config", None) or {}).get("participant_ids")
+        )
+        if cleaned:
+            return cleaned
 
         # 5) Fall back to all meeting participants
-        all_meeting_participants = meeting_manager.list_participants(meeting_id)
-        return sorted({p.user_id for p in all_meeting_participants})
+        return sorted(_all_meeting_participant_ids())
 
     if control.action == MeetingControlAction.START_TOOL:
         if not control.activityId:
@@ -2026,12 +2248,13 @@ async def control_meeting(
         # Determine participants for the activity being started
         activity_config = activity_to_control.config or {}
         new_activity_participant_ids_raw = activity_config.get("participant_ids")
-        default_participants: Set[str] = set()
+        default_participants: AbstractSet[str]
         if new_activity_participant_ids_raw:
-            default_participants = {str(pid).strip() for pid in new_activity_participant_ids_raw if str(pid).strip()}
+            default_participants = set(
+                filter(None, (str(pid).strip() for pid in new_activity_participant_ids_raw))
+            )
         else:  # "all" mode, so all meeting participants are involved
-            all_meeting_participants = meeting_manager.list_participants(meeting_id)
-            default_participants = {p.user_id for p in all_meeting_participants}
+            default_participants = _all_meeting_participant_ids()
 
         resolved_participants = _resolve_participant_ids_for_activity(
             activity_to_control, default_participants
@@ -2043,38 +2266,20 @@ async def control_meeting(
             meeting_id,
             control.activityId,
             new_activity_participant_ids,
+            meeting=meeting,
+            snapshot=current_meeting_state,
         )
 
         if conflicting_user_ids:
-            # Fetch user details for the conflicting IDs
-            conflicting_users_details = []
-            for user_id in conflicting_user_ids:
-                user_obj = user_manager.get_user_by_id(user_id)
-                if user_obj:
-                    conflicting_users_details.append(
-                        {
-                            "user_id": user_obj.user_id,
-                            "login": user_obj.login,
-                            "display_name": f"{user_obj.first_name} {user_obj.last_name}".strip()
-                            or user_obj.login,
-                        }
-                    )
-                else:
-                    conflicting_users_details.append(
-                        {"user_id": user_id, "display_name": "Unknown User"}
-                    )
-
             conflict_payload = {
-                "conflicting_users": conflicting_users_details,
+                "conflicting_users": _format_conflicting_users(
+                    user_manager, conflicting_user_ids
+                ),
                 "active_activity_id": current_meeting_state.get("currentActivity"),
             }
-            return JSONResponse(
-                status_code=status.HTTP_409_CONFLICT,
-                content={
-                    "detail": "Starting this activity would create participant conflicts with an already active activity.",
-                    "conflict_details": conflict_payload,
-                },
-                headers={"X-Conflict-Details": json.dumps(conflict_payload)},
+            return _conflict_response(
+                "Starting this activity would create participant conflicts with an already active activity.",
+                conflict_payload,
             )
 
         patch["currentTool"] = control.tool
@@ -2088,8 +2293,8 @@ async def control_meeting(
             activity_to_control.started_at = current_time_utc
             activity_to_control.stopped_at = None
             # Preserve any previously accumulated elapsed_duration so multiple runs accumulate
-            meeting_manager.db.commit()
-            meeting_manager.db.refresh(activity_to_control)
+            # Flush (not commit) so plugin queries on this session see the new timestamps.
+            meeting_manager.db.flush()
             registry = get_activity_registry()
             plugin = registry.get_plugin(activity_to_control.tool_type)
             if plugin:
@@ -2159,7 +2364,7 @@ async def control_meeting(
             "status": "in_progress",
             "metadata": dict(metadata_patch),
             "participantIds": activity_participant_ids_list,
-            "startedAt": current_time_utc.isoformat(),
+            "startedAt": current_time_iso,
             "stoppedAt": None,
             "elapsedTime": activity_to_control.elapsed_duration,
         }
@@ -2175,15 +2380,18 @@ async def control_meeting(
         patch["status"] = "paused"
         # Update stopped_at and accumulate elapsed time
         if activity_to_control.started_at:
-            started_at = activity_to_control.started_at
-            if started_at.tzinfo is None:
-                started_at = started_at.replace(tzinfo=timezone.utc)
-            time_spent = (current_time_utc - started_at).total_seconds()
-            activity_to_control.elapsed_duration = (activity_to_control.elapsed_duration or 0) + int(time_spent)
-            activity_to_control.stopped_at = current_time_utc # Mark as stopped (paused)
-            activity_to_control.started_at = None # Clear started_at to indicate it's not running
-            meeting_manager.db.commit()
-            meeting_manager.db.refresh(activity_to_control)
+            time_spent = _elapsed_seconds(
+                activity_to_control.started_at, current_time_utc
+            )
+            # Mark as stopped (paused) and clear started_at so it is not running
+            _write_activity_timing(
+                meeting_manager.db,
+                activity_to_control,
+                started_at=None,
+                stopped_at=current_time_utc,
+                elapsed_duration=(activity_to_control.elapsed_duration or 0)
+                + time_spent,
+            )
             participant_scope_ids = _resolve_participant_ids_for_activity(
                 activity_to_control
             )
@@ -2195,7 +2403,7 @@ async def control_meeting(
                     "metadata": dict(metadata_patch),
                     "participantIds": participant_scope_ids,
                     "startedAt": None,
-                    "stoppedAt": current_time_utc.isoformat(),
+                    "stoppedAt": current_time_iso,
                     "elapsedTime": activity_to_control.elapsed_duration,
                 }
             }
@@ -2207,12 +2415,13 @@ async def control_meeting(
         
         # Resume means it was paused, so it should have an accumulated elapsed_duration
         patch["status"] = "in_progress"
-        activity_to_control.started_at = current_time_utc
-        if activity_to_control.started_at.tzinfo is None:
-             activity_to_control.started_at = activity_to_control.started_at.replace(tzinfo=timezone.utc)
-        activity_to_control.stopped_at = None # Clear stopped_at
-        meeting_manager.db.commit()
-        meeting_manager.db.refresh(activity_to_control)
+        _write_activity_timing(
+            meeting_manager.db,
+            activity_to_control,
+            started_at=current_time_utc,
+            stopped_at=None,  # Clear stopped_at
+            elapsed_duration=activity_to_control.elapsed_duration,
+        )
         participant_scope_ids = _resolve_participant_ids_for_activity(
             activity_to_control
         )
@@ -2223,7 +2432,7 @@ async def control_meeting(
                 "status": "in_progress",
                 "metadata": dict(metadata_patch),
                 "participantIds": participant_scope_ids,
-                "startedAt": current_time_utc.isoformat(),
+                "startedAt": current_time_iso,
                 "stoppedAt": None,
                 "elapsedTime": activity_to_control.elapsed_duration,
             }
@@ -2272,22 +2481,22 @@ async def control_meeting(
             patch["currentTool"] = None # Clear current tool
             patch["status"] = "completed" # Status for a fully stopped activity
             
-            activity_to_control = next(
-                (a for a in meeting.agenda_activities if a.activity_id == activity_id_to_stop),
-                None,
-            )
+            activity_to_control = activity_by_id(meeting, activity_id_to_stop)
             if activity_to_control:
+                elapsed_duration = activity_to_control.elapsed_duration
                 if activity_to_control.started_at: # If it was running before stop
-                    started_at = activity_to_control.started_at
-                    if started_at.tzinfo is None:
-                        started_at = started_at.replace(tzinfo=timezone.utc)
-                    time_spent = (current_time_utc - started_at).total_seconds()
-                    activity_to_control.elapsed_duration = (activity_to_control.elapsed_duration or 0) + int(time_spent)
-                activity_to_control.stopped_at = current_time_utc
-                activity_to_control.started_at = None # Ensure it's not marked as started
+                    time_spent = _elapsed_seconds(
+                        activity_to_control.started_at, current_time_utc
+                    )
+                    elapsed_duration = (elapsed_duration or 0) + time_spent
                 # elapsed_duration is kept for results, not reset here
-                meeting_manager.db.commit()
-                meeting_manager.db.refresh(activity_to_control)
+                _write_activity_timing(
+                    meeting_manager.db,
+                    activity_to_control,
+                    started_at=None,  # Ensure it's not marked as started
+                    stopped_at=current_time_utc,
+                    elapsed_duration=elapsed_duration,
+                )
                 registry = get_activity_registry()
                 plugin = registry.get_plugin(activity_to_control.tool_type)
                 if plugin:
@@ -2331,9 +2540,16 @@ async def control_meeting(
         patch["metadata"] = patch.get("metadata", {})
         patch["metadata"]["elapsedTime"] = activity_to_control.elapsed_duration
 
+    # Single commit for every activity change above, made before the live
+    # state moves so clients never see a state the database does not hold.
+    meeting_manager.db.commit()
+
     _, snapshot = await meeting_state_manager.apply_patch(meeting_id, patch)
 
-    await websocket_manager.broadcast(
+    # Fan-out runs after the response is sent; the caller already gets the
+    # same snapshot in the HTTP body.
+    background_tasks.add_task(
+        websocket_manager.broadcast,
         meeting_id,
         {
             "type": "meeting_state",
@@ -2355,22 +2571,12 @@ async def control_meeting(
 @router.delete("/{meeting_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_meeting(
     meeting_id: str,
-    current_user: str = Depends(get_current_user),
-    user_manager: UserManager = Depends(
-        get_user_manager
-    ),  # Use get_user_manager dependency
+    user: User = Depends(get_current_user_model),
     meeting_manager: MeetingManager = Depends(
         get_meeting_manager
     ),  # Inject MeetingManager
 ):
     try:
-        # Get user info using injected user_manager and email
-        user = user_manager.get_user_by_login(current_user)  # Removed db parameter
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-            )
-
         # Implement meeting fetching logic using injected meeting_manager
         existing_meeting = meeting_manager.get_meeting(meeting_id)  # Removed await
         if not existing_meeting:
@@ -2378,9 +2584,8 @@ async def delete_meeting(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found"
             )
 
-        is_admin = user.role in {UserRole.ADMIN, UserRole.SUPER_ADMIN}
-        is_owner = existing_meeting.owner_id == user.user_id
-        if not (is_admin or is_owner):
+        access = _meeting_access(existing_meeting, user)
+        if not (access.is_admin or access.is_owner):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not enough permissions to delete this meeting",
@@ -2470,15 +2675,18 @@ async def restore_meeting_endpoint(
     return MeetingResponse.model_validate(updated)
 
 
-@router.post("/join", response_model=JoinMeetingResponse)
+@router.post(
+    "/join",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": JoinMeetingResponse}},
+)
 async def join_meeting_by_code(
     payload: JoinMeetingRequest,
-    response: Response,
     request: Request,
     optional_user=Depends(get_optional_user_model_dependency),
     user_manager: UserManager = Depends(get_user_manager),
     meeting_manager: MeetingManager = Depends(get_meeting_manager),
-) -> JoinMeetingResponse:
+) -> ORJSONResponse:
     """
     Join a meeting by code. Supports authenticated users as usual.
     If unauthenticated and payload.as_guest is True, create a unique participant
@@ -2486,6 +2694,7 @@ async def join_meeting_by_code(
     """
     # Resolve current user model (optional)
     user = None
+    access_token: Optional[str] = None
     if optional_user:
         # optional_user is a Pydantic schema; fetch full model via manager for consistency, or use minimal fields
         user = user_manager.get_user_by_login(optional_user.login)
@@ -2507,13 +2716,14 @@ async def join_meeting_by_code(
                 detail="Authentication required.",
             )
 
+        # Reject unknown codes before creating an account for the guest.
+        if meeting_manager.get_meeting_row(payload.meeting_code) is None:
+            raise HTTPException(status_code=404, detail="Meeting not found")
+
         display_name = (payload.display_name or "Guest").strip()
         email = payload.email.strip().lower() if payload.email else None
 
         # Derive a unique login; prefer email localpart when provided
-        import re
-        import random
-
         def slugify(s: str) -> str:
             base = re.sub(r"[^a-zA-Z0-9]+", "_", s).strip("_").lower()
             return base or "guest"
@@ -2524,12 +2734,13 @@ async def join_meeting_by_code(
         attempts = 0
         while user_manager.login_exists(candidate):
             attempts += 1
-            candidate = f"{base_login}_{random.randint(1000, 9999)}"
+            candidate = f"{base_login}_{secrets.randbelow(9000) + 1000}"
             if attempts > 50:
-                candidate = f"guest_{random.randint(100000, 999999)}"
+                candidate = f"guest_{secrets.token_hex(8)}"
                 break
 
-        hashed_password = get_password_hash("guest-" + str(random.getrandbits(64)))
+        # Guests authenticate through the issued cookie, never by password.
+        hashed_password = make_unusable_password()
         try:
             user = user_manager.add_user(
                 first_name=display_name,
@@ -2538,39 +2749,54 @@ async def join_meeting_by_code(
                 hashed_password=hashed_password,
                 role=UserRole.PARTICIPANT.value,
                 login=candidate,
+                commit=False,
             )
             # Issue session cookie to authenticate subsequent requests
             access_token = create_access_token(
                 data={"sub": user.login},
                 expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
             )
-            response.set_cookie(
-                key="access_token",
-                value=f"Bearer {access_token}",
-                httponly=True,
-                secure=get_secure_cookies_enabled(),
-                max_age=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-                expires=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-                samesite="lax",
-                path="/",
-            )
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to create guest: {str(e)}",
             )
 
-    meeting = meeting_manager.join_meeting_by_code(payload.meeting_code, user)
+    # The guest insert, roster link and display-name update share one
+    # transaction, so a failed join leaves no orphaned guest account behind.
+    try:
+        meeting = meeting_manager.join_meeting_by_code(
+            payload.meeting_code, user, commit=False
+        )
 
-    # Optionally update display name if provided and empty
-    if payload.display_name and not (user.first_name or user.last_name):
-        user.first_name = payload.display_name
-        user_manager.db.flush()
-        user_manager.db.commit()
+        # Optionally update display name if provided and empty
+        if payload.display_name and not (user.first_name or user.last_name):
+            user.first_name = payload.display_name
+        meeting_manager.db.commit()
+    except Exception:
+        # Only a guest created by this request has pending writes to discard.
+        if access_token is not None:
+            meeting_manager.db.rollback()
+        raise
 
-    redirect_url = f"/meeting/{meeting.meeting_id}"
-    return JoinMeetingResponse(
-        status="joined",
-        meeting_id=meeting.meeting_id,
-        redirect=redirect_url,
+    # The body is a fixed three-field shape, so it is rendered directly rather
+    # than validated again through the response model.
+    join_response = ORJSONResponse(
+        {
+            "status": "joined",
+            "meeting_id": meeting.meeting_id,
+            "redirect": f"/meeting/{meeting.meeting_id}",
+        }
     )
+    if access_token is not None:
+        join_response.set_cookie(
+            key="access_token",
+            value=f"Bearer {access_token}",
+            httponly=True,
+            secure=get_secure_cookies_enabled(),
+            max_age=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+            expires=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+            samesite="lax",
+            path="/",
+        )
+    return join_response
@@ -20,7 +20,7 @@ from grab_extension import GrabExtension, is_grab_enabled
 # Local imports
 from ..auth import get_current_active_user, get_optional_user_model_dependency
 from ..schemas.user import User
-from ..models.user import UserRole
+from ..models.user import ADMIN_ROLES, UserRole
 from ..data.user_manager import UserManager, get_user_manager
 from ..data.meeting_manager import MeetingManager, get_meeting_manager
 from sqlalchemy.orm import Session
@@ -35,12 +35,45 @@ INVALID_PASSWORD_PREFIX = f"{ERROR_PREFIX}invalid_password&details="
 
 router = APIRouter()
 
+_FACILITATOR_ROLES = ADMIN_ROLES | {UserRole.FACILITATOR}
+# Templates compare roles as plain strings, so they get a name -> value dict
+# instead of resolving members on the Enum class during every render.
+USER_ROLE_VALUES = {role.name: role.value for role in UserRole}
+
 # Initialize Jinja2 templates
 templates_path = Path(__file__).parent.parent / "templates"
 templates = Jinja2Templates(directory=str(templates_path))
-templates.env = templates.env.overlay(extensions=[GrabExtension])
+templates.env = templates.env.overlay(
+    extensions=[GrabExtension], auto_reload=False, cache_size=-1
+)
 templates.env.globals["grab_enabled"] = is_grab_enabled
 
+# Every page template is compiled once at import; handlers render the cached
+# Template objects directly instead of resolving the name per request.
+_PAGE_TEMPLATES = {
+    name: templates.get_template(name)
+    for name in (
+        "about.html",
+        "dashboard.html",
+        "settings.html",
+        "login.html",
+        "register.html",
+        "meeting_designer.html",
+        "activity_library.html",
+        "create_meeting.html",
+        "meeting_activity_log.html",
+        "meeting.html",
+        "admin/users.html",
+        "profile.html",
+    )
+}
+
+
+def _render_page(request: Request, name: str, context: dict) -> HTMLResponse:
+    # ``request`` is injected here, so handler contexts do not repeat it.
+    return HTMLResponse(_PAGE_TEMPLATES[name].render({"request": request, **context}))
+
+
 logger = logging.getLogger(__name__)  # Add this
 
 
@@ -75,11 +108,10 @@ async def about(
     current_user: User = Depends(get_optional_user_model_dependency),
 ):
     """Public about page with project attribution and licensing links."""
-    return templates.TemplateResponse(
+    return _render_page(
         request,
         "about.html",
         {
-            "request": request,
             "current_user": current_user,
             "project_github_url": PROJECT_GITHUB_URL,
             "project_license_url": PROJECT_LICENSE_URL,
@@ -95,7 +127,6 @@ async def dashboard(
         get_current_active_user
     ),  # Use get_current_active_user to get full user model
     user_manager: UserManager = Depends(get_user_manager),
-    meeting_manager: MeetingManager = Depends(get_meeting_manager),
 ):
     """Display the adaptive dashboard based on user role."""
 
@@ -110,38 +141,35 @@ async def dashboard(
 
     ui_refresh = get_ui_refresh_settings()
     context = {
-        "request": request,
         "current_user": current_user,
-        "UserRole": UserRole,  # Pass the Enum itself to the template for comparisons
+        "UserRole": USER_ROLE_VALUES,
         "ui_refresh": ui_refresh,
     }
 
     # Fetch data common to all roles (e.g., notifications - implement later)
 
     # Fetch data specific to roles
-    if current_user.role in {UserRole.ADMIN, UserRole.SUPER_ADMIN}:
+    if current_user.role in ADMIN_ROLES:
         context["restart_supervised"] = get_restart_enabled()
         try:
-            context["total_user_count"] = (
-                user_manager.get_user_count()
-            )  # Renamed for clarity
-            context["meeting_count"] = meeting_manager.get_meeting_count()
+            # Fetch user, per-role and meeting counts in a single query
+            role_counts = user_manager.get_role_counts(include_meeting_count=True)
+            context["total_user_count"] = role_counts["total"]  # Renamed for clarity
+            context["meeting_count"] = role_counts["meetings"]
             # context["users"] = user_manager.get_all_users() # No longer showing full list on dashboard
-            # Fetch role counts
-            context["admin_count"] = user_manager.get_admin_count()
-            context["facilitator_count"] = user_manager.get_facilitator_count()
-            context["participant_count"] = user_manager.get_participant_count()
-        except Exception as e:
-            print(f"Error fetching admin data for dashboard: {e}")
+            context["admin_count"] = role_counts["admin"]
+            context["facilitator_count"] = role_counts["facilitator"]
+            context["participant_count"] = role_counts["participant"]
+        except Exception:
+            logger.exception("Error fetching admin data for dashboard")
             # Handle error appropriately, maybe set defaults
             context["total_user_count"] = "Error"
             context["meeting_count"] = "Error"
-            context["meeting_count"] = "Error"
             context["admin_count"] = "Error"
             context["facilitator_count"] = "Error"
             context["participant_count"] = "Error"
 
-    if current_user.role in {UserRole.FACILITATOR, UserRole.ADMIN, UserRole.SUPER_ADMIN}:
+    if current_user.role in _FACILITATOR_ROLES:
         # Fetch facilitator-specific data (e.g., meetings they facilitate)
         # context["facilitated_meetings"] = meeting_manager.get_meetings_by_facilitator(db, current_user.user_id) # Example
         context["facilitated_meetings"] = []  # Placeholder
@@ -151,13 +179,8 @@ async def dashboard(
     # context["participant_meetings"] = meeting_manager.get_meetings_by_participant(db, current_user.user_id) # Example
     context["participant_meetings"] = []  # Placeholder
 
-    context.update(
-        {
-            "role": current_user.role,
-            "UserRole": UserRole,  # For role comparisons in template
-        }
-    )
-    return templates.TemplateResponse(request, "dashboard.html", context)
+    context["role"] = current_user.role
+    return _render_page(request, "dashboard.html", context)
 
 
 @router.get("/settings", response_class=HTMLResponse, response_model=None)
@@ -166,20 +189,17 @@ async def settings_page(
     current_user: User = Depends(get_current_active_user),
 ):
     """Settings page — accessible to Facilitators and Admins."""
-    if current_user.role not in {
-        UserRole.FACILITATOR, UserRole.ADMIN, UserRole.SUPER_ADMIN
-    }:
+    if current_user.role not in _FACILITATOR_ROLES:
         return RedirectResponse(url="/dashboard", status_code=status.HTTP_302_FOUND)
 
-    is_admin = current_user.role in {UserRole.ADMIN, UserRole.SUPER_ADMIN}
+    is_admin = current_user.role in ADMIN_ROLES
     ui_refresh = get_ui_refresh_settings()
-    return templates.TemplateResponse(
+    return _render_page(
         request,
         "settings.html",
         {
-            "request": request,
             "current_user": current_user,
-            "UserRole": UserRole,
+            "UserRole": USER_ROLE_VALUES,
             "is_admin": is_admin,
             "ui_refresh": ui_refresh,
         },
@@ -197,13 +217,13 @@ async def login(
         return RedirectResponse(url="/dashboard", status_code=status.HTTP_302_FOUND)
 
     # Check if any admin user exists
-    show_setup_alert = not user_manager.has_admin_user()
+    show_setup_alert = not user_manager.has_admin_user(allow_cached=True)
 
-    return templates.TemplateResponse(request, 
+    return _render_page(
+        request,
         "login.html",
         {
-            "request": request,
-            "UserRole": UserRole,  # For role comparisons in template
+            "UserRole": USER_ROLE_VALUES,
             "show_setup_alert": show_setup_alert,
             "frontend_reliability": get_frontend_reliability_settings(),
         },
@@ -219,24 +239,23 @@ async def login(
 async def register(
     request: Request,
     current_user: User = Depends(get_optional_user_model_dependency),
-    db: Session = Depends(get_db),
     user_manager: UserManager = Depends(get_user_manager),
 ):
     """Show register page - handles initial admin setup"""
     if current_user:
         return RedirectResponse(url="/dashboard", status_code=status.HTTP_302_FOUND)
 
-    is_initial_setup = not user_manager.has_admin_user()
+    is_initial_setup = not user_manager.has_admin_user(allow_cached=True)
 
-    return templates.TemplateResponse(request, 
+    return _render_page(
+        request,
         "register.html",
         {
-            "request": request,
             "is_initial_setup": is_initial_setup,
             "initial_role": (
                 UserRole.SUPER_ADMIN.value if is_initial_setup else UserRole.PARTICIPANT.value
             ),
-            "UserRole": UserRole,  # For role comparisons in template
+            "UserRole": USER_ROLE_VALUES,
             "frontend_reliability": get_frontend_reliability_settings(),
         },
     )
@@ -266,20 +285,19 @@ async def meeting_designer(
                 detail="Authenticated user not available.",
             )
         current_user = cached_user
-    if current_user.role not in [UserRole.FACILITATOR, UserRole.ADMIN, UserRole.SUPER_ADMIN]:
+    if current_user.role not in _FACILITATOR_ROLES:
         raise HTTPException(
             status_code=403,
             detail="Only facilitators and administrators can use the AI Meeting Designer",
         )
 
-    return templates.TemplateResponse(
+    return _render_page(
         request,
         "meeting_designer.html",
         {
-            "request": request,
             "current_user": current_user,
             "role": current_user.role,
-            "UserRole": UserRole,
+            "UserRole": USER_ROLE_VALUES,
         },
     )
 
@@ -298,20 +316,19 @@ async def activity_library(
                 detail="Authenticated user not available.",
             )
         current_user = cached_user
-    if current_user.role not in [UserRole.FACILITATOR, UserRole.ADMIN, UserRole.SUPER_ADMIN]:
+    if current_user.role not in _FACILITATOR_ROLES:
         raise HTTPException(
             status_code=403,
             detail="Only facilitators and administrators can view the activity library",
         )
 
-    return templates.TemplateResponse(
+    return _render_page(
         request,
         "activity_library.html",
         {
-            "request": request,
             "current_user": current_user,
             "role": current_user.role,
-            "UserRole": UserRole,
+            "UserRole": USER_ROLE_VALUES,
         },
     )
 
@@ -320,7 +337,6 @@ async def activity_library(
 async def create_meeting(
     request: Request,
     current_user: User = Depends(get_current_active_user),
-    meeting_manager: MeetingManager = Depends(get_meeting_manager),
 ):
     """Display meeting creation page - requires facilitator/admin"""
     if current_user is None:
@@ -331,19 +347,19 @@ async def create_meeting(
                 detail="Authenticated user not available for meeting creation.",
             )
         current_user = cached_user
-    if current_user.role not in [UserRole.FACILITATOR, UserRole.ADMIN, UserRole.SUPER_ADMIN]:
+    if current_user.role not in _FACILITATOR_ROLES:
         raise HTTPException(
             status_code=403,
             detail="Only facilitators and administrators can create meetings",
         )
 
-    return templates.TemplateResponse(request, 
+    return _render_page(
+        request,
         "create_meeting.html",
         {
-            "request": request,
             "current_user": current_user,
             "role": current_user.role,
-            "UserRole": UserRole,  # For role comparisons in template
+            "UserRole": USER_ROLE_VALUES,
             "page_mode": "create",
             "meeting_id": None,
         },
@@ -366,31 +382,26 @@ async def meeting_settings(
             )
         current_user = cached_user
 
-    meeting = meeting_manager.get_meeting(meeting_id)
+    meeting = meeting_manager.get_meeting_row(meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
-    facilitator_ids = {
-        link.user_id for link in getattr(meeting, "facilitator_links", []) or []
-    }
-    facilitator_ids.add(getattr(meeting, "owner_id", ""))
-
-    is_admin = current_user.role in {UserRole.ADMIN, UserRole.SUPER_ADMIN}
-    is_meeting_facilitator = current_user.user_id in facilitator_ids
-
-    if not (is_admin or is_meeting_facilitator):
+    is_admin = current_user.role in ADMIN_ROLES
+    if not is_admin and not meeting_manager.user_has_access(
+        meeting_id, current_user.user_id, include_participants=False
+    ):
         raise HTTPException(
             status_code=403,
             detail="Only facilitators and administrators can configure meetings",
         )
 
-    return templates.TemplateResponse(request, 
+    return _render_page(
+        request,
         "create_meeting.html",
         {
-            "request": request,
             "current_user": current_user,
             "role": current_user.role,
-            "UserRole": UserRole,
+            "UserRole": USER_ROLE_VALUES,
             "page_mode": "edit",
             "meeting_id": meeting_id,
         },
@@ -414,19 +425,14 @@ async def meeting_activity_log(
             )
         current_user = cached_user
 
-    meeting = meeting_manager.get_meeting(meeting_id)
+    meeting = meeting_manager.get_meeting_row(meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
-    facilitator_ids = {
-        link.user_id for link in getattr(meeting, "facilitator_links", []) or []
-    }
-    facilitator_ids.add(getattr(meeting, "owner_id", ""))
-
-    is_admin = current_user.role in {UserRole.ADMIN, UserRole.SUPER_ADMIN}
-    is_meeting_facilitator = current_user.user_id in facilitator_ids
-
-    if not (is_admin or is_meeting_facilitator):
+    is_admin = current_user.role in ADMIN_ROLES
+    if not is_admin and not meeting_manager.user_has_access(
+        meeting_id, current_user.user_id, include_participants=False
+    ):
         raise HTTPException(
             status_code=403,
             detail="Only facilitators and administrators can view the activity log",
@@ -434,15 +440,15 @@ async def meeting_activity_log(
 
     activity_log_settings = get_meeting_activity_log_settings()
 
-    return templates.TemplateResponse(request, 
+    return _render_page(
+        request,
         "meeting_activity_log.html",
         {
-            "request": request,
             "meeting_id": meeting_id,
             "current_user": current_user,
             "meeting": meeting,
             "role": current_user.role,
-            "UserRole": UserRole,
+            "UserRole": USER_ROLE_VALUES,
             "activity_log_settings": activity_log_settings,
         },
     )
@@ -466,27 +472,13 @@ async def meeting(
             )
         current_user = cached_user
     # Validate that current user has access to this meeting
-    meeting = meeting_manager.get_meeting(meeting_id)
+    meeting = meeting_manager.get_meeting_row(meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
     # Check if user is participant/facilitator/admin
-    facilitator_ids = {
-        link.user_id
-        for link in getattr(meeting, "facilitator_links", []) or []
-        if getattr(link, "user_id", None)
-    }
-    if getattr(meeting, "owner_id", None):
-        facilitator_ids.add(meeting.owner_id)
-    participant_ids = {
-        getattr(participant, "user_id", None)
-        for participant in getattr(meeting, "participants", [])
-    }
-
-    if (
-        current_user.role not in {UserRole.ADMIN, UserRole.SUPER_ADMIN}
-        and current_user.user_id not in participant_ids
-        and current_user.user_id not in facilitator_ids
+    if current_user.role not in ADMIN_ROLES and not meeting_manager.user_has_access(
+        meeting_id, current_user.user_id
     ):
         raise HTTPException(
             status_code=403, detail="You do not have access to this meeting"
@@ -496,15 +488,15 @@ async def meeting(
     meeting_refresh = get_meeting_refresh_settings()
     frontend_reliability = get_frontend_reliability_settings()
 
-    return templates.TemplateResponse(request, 
+    return _render_page(
+        request,
         "meeting.html",
         {
-            "request": request,
             "meeting_id": meeting_id,
             "current_user": current_user,
             "meeting": meeting,
             "role": current_user.role,
-            "UserRole": UserRole,  # For role comparisons in template
+            "UserRole": USER_ROLE_VALUES,
             "brainstorming_limits": brainstorming_limits,
             "meeting_refresh": meeting_refresh,
             "frontend_reliability": frontend_reliability,
@@ -525,16 +517,16 @@ async def admin_users(
                 detail="Authenticated user not available for admin view.",
             )
         current_user = cached_user
-    if current_user.role not in {UserRole.ADMIN, UserRole.SUPER_ADMIN}:
+    if current_user.role not in ADMIN_ROLES:
         raise HTTPException(status_code=403, detail="Admin access required")
 
-    return templates.TemplateResponse(request, 
+    return _render_page(
+        request,
         "admin/users.html",
         {
-            "request": request,
             "current_user": current_user,
             "role": current_user.role,
-            "UserRole": UserRole,  # For role comparisons in template
+            "UserRole": USER_ROLE_VALUES,
             "default_user_password": DEFAULT_USER_PASSWORD,
             "ui_refresh": get_ui_refresh_settings(),
         },
@@ -557,12 +549,12 @@ async def read_profile_page(
                 detail="Authenticated user not available for profile view.",
             )
         current_user = cached_user
-    return templates.TemplateResponse(request, 
+    return _render_page(
+        request,
         "profile.html",
         {
-            "request": request,
             "current_user": current_user,
             "role": current_user.role,
-            "UserRole": UserRole,  # For role comparisons in template
+            "UserRole": USER_ROLE_VALUES,
         },
     )
@@ -3,12 +3,17 @@ from __future__ import annotations
 import logging
 from typing import Optional, Set
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-
-from app.auth.auth import get_current_user
-from app.data.meeting_manager import MeetingManager, get_meeting_manager
-from app.data.user_manager import UserManager, get_user_manager
-from app.models.user import User, UserRole
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+
+from app.auth.auth import get_current_user_model
+from app.data.meeting_manager import (
+    MeetingManager,
+    activity_by_id,
+    facilitator_user_ids,
+    get_meeting_manager,
+    participant_user_ids,
+)
+from app.models.user import ADMIN_ROLES, User, UserRole
 from app.schemas.rank_order_voting import (
     RankOrderResetRequest,
     RankOrderSubmitRequest,
@@ -25,144 +30,134 @@ router = APIRouter(
 )
 logger = logging.getLogger("app")
 
+_ACTIVE_STATUSES = frozenset({"in_progress", "paused"})
 
-def _ensure_user_access(
+
+def _authorize_and_count(
     meeting,
     user: User,
-    allowed_participant_ids: Optional[Set[str]] = None,
-) -> tuple[bool, bool]:
-    facilitator_ids = {
-        link.user_id
-        for link in getattr(meeting, "facilitator_links", []) or []
-        if getattr(link, "user_id", None)
-    }
-    if getattr(meeting, "owner_id", None):
-        facilitator_ids.add(meeting.owner_id)
-
-    participant_ids = {
-        getattr(participant, "user_id", None)
-        for participant in getattr(meeting, "participants", [])
-    }
+    allowed_participant_ids: Optional[Set[str]],
+    active_user_ids: Set[str],
+) -> tuple[bool, int]:
+    """Check the user's access and count active in-scope participants.
 
+    Returns ``(is_facilitator, active_participant_count)``; admins count as
+    facilitators. Both answers come from the same cached roster id set.
+    """
+    user_id = user.user_id
     role_value = getattr(user, "role", UserRole.PARTICIPANT.value)
-    is_admin = role_value in {UserRole.ADMIN.value, UserRole.SUPER_ADMIN.value}
-    is_facilitator = is_admin or user.user_id in facilitator_ids
-    is_participant = is_facilitator or is_admin or user.user_id in participant_ids
+    is_admin = role_value in ADMIN_ROLES
+    meeting_participants = participant_user_ids(meeting)
+    # Roster id sets are cached on the loaded meeting, so repeat checks are O(1).
+    is_facilitator = (
+        is_admin
+        or meeting.owner_id == user_id
+        or user_id in facilitator_user_ids(meeting)
+    )
 
-    if not is_participant:
+    if not is_facilitator and user_id not in meeting_participants:
         raise HTTPException(
             status_code=403, detail="You do not have access to this meeting."
         )
     if (
         allowed_participant_ids
         and not is_facilitator
-        and not is_admin
-        and user.user_id not in allowed_participant_ids
+        and user_id not in allowed_participant_ids
     ):
         raise HTTPException(
             status_code=403, detail="You are not assigned to this activity."
         )
-    return is_participant, is_facilitator or is_admin
 
+    active_in_meeting = meeting_participants & active_user_ids
+    if allowed_participant_ids:
+        active_in_meeting &= allowed_participant_ids
+    return is_facilitator, len(active_in_meeting)
 
-def _compute_active_participant_count(
-    meeting,
-    allowed_participant_ids: Optional[Set[str]],
-    active_user_ids: Set[str],
-) -> int:
-    meeting_participants = {
-        getattr(participant, "user_id", None)
-        for participant in getattr(meeting, "participants", []) or []
-        if getattr(participant, "user_id", None)
-    }
-    if not active_user_ids:
-        return 0
 
-    if allowed_participant_ids:
-        return sum(
-            1
-            for user_id in active_user_ids
-            if user_id in allowed_participant_ids and user_id in meeting_participants
-        )
+def _lower(value) -> str:
+    return value.lower() if isinstance(value, str) else str(value or "").lower()
 
-    return sum(1 for user_id in active_user_ids if user_id in meeting_participants)
 
+def _clean_ids(values) -> Set[str]:
+    # Strip each id once; ids are normally clean strings already.
+    cleaned: Set[str] = set()
+    for value in values:
+        text = value.strip() if isinstance(value, str) else str(value).strip()
+        if text:
+            cleaned.add(text)
+    return cleaned
 
-async def _resolve_scope(
-    meeting_id: str,
+
+def _custom_scope_ids(metadata) -> Optional[Set[str]]:
+    scope = _lower(
+        metadata.get("participantScope") or metadata.get("participant_scope")
+    )
+    meta_ids = metadata.get("participantIds") or metadata.get("participant_ids")
+    if scope == "custom" and isinstance(meta_ids, list):
+        return _clean_ids(meta_ids) or None
+    return None
+
+
+async def _load_meeting_and_snapshot(
+    meeting_manager: MeetingManager, meeting_id: str
+):
+    """Load the meeting, then the live state snapshot with its activity index."""
+    meeting = meeting_manager.get_meeting(meeting_id)
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    snapshot = await meeting_state_manager.snapshot(meeting_id, index_activities=True)
+    return meeting, snapshot
+
+
+def _resolve_scope(
+    snapshot: Optional[dict],
     activity_id: str,
     activity,
 ) -> tuple[Optional[Set[str]], bool, Set[str]]:
     allowed: Optional[Set[str]] = None
     is_active = False
     active_user_ids: Set[str] = set()
-    snapshot = await meeting_state_manager.snapshot(meeting_id)
 
     if snapshot:
         participants = snapshot.get("participants")
         if isinstance(participants, list):
-            active_user_ids = {str(pid).strip() for pid in participants if str(pid).strip()}
-
-        active_entries = snapshot.get("activeActivities") or []
-        if isinstance(active_entries, dict):
-            active_entries = active_entries.values()
+            active_user_ids = _clean_ids(participants)
+
+        indexed_entries = snapshot.get("activeActivitiesById")
+        if isinstance(indexed_entries, dict):
+            candidate = indexed_entries.get(activity_id)
+            active_entries = [candidate] if candidate is not None else []
+        else:
+            # Snapshots taken without the index fall back to scanning the list.
+            active_entries = snapshot.get("activeActivities") or []
+            if isinstance(active_entries, dict):
+                active_entries = active_entries.values()
         for entry in active_entries:
             if not isinstance(entry, dict):
                 continue
             if (
-                str(entry.get("tool") or "").lower() == "rank_order_voting"
+                _lower(entry.get("tool")) == "rank_order_voting"
                 and (entry.get("activityId") or entry.get("activity_id")) == activity_id
             ):
-                status_value = str(entry.get("status") or "").lower()
-                if status_value in {"in_progress", "paused"}:
+                if _lower(entry.get("status")) in _ACTIVE_STATUSES:
                     is_active = True
-                metadata = entry.get("metadata") or {}
-                scope = str(
-                    metadata.get("participantScope")
-                    or metadata.get("participant_scope")
-                    or ""
-                ).lower()
-                meta_ids = metadata.get("participantIds") or metadata.get(
-                    "participant_ids"
-                )
-                if scope == "custom" and isinstance(meta_ids, list):
-                    normalized = {
-                        str(pid).strip() for pid in meta_ids if str(pid).strip()
-                    }
-                    if normalized:
-                        allowed = normalized
+                allowed = _custom_scope_ids(entry.get("metadata") or {})
                 break
 
         if allowed is None:
-            current_tool = str(snapshot.get("currentTool") or "").lower()
+            current_tool = _lower(snapshot.get("currentTool"))
             current_activity = snapshot.get("currentActivity") or snapshot.get(
                 "agendaItemId"
             )
             if current_tool == "rank_order_voting" and current_activity == activity_id:
-                status_value = str(snapshot.get("status") or "").lower()
-                if status_value in {"in_progress", "paused"}:
+                if _lower(snapshot.get("status")) in _ACTIVE_STATUSES:
                     is_active = True
-                metadata = snapshot.get("metadata") or {}
-                scope = str(
-                    metadata.get("participantScope")
-                    or metadata.get("participant_scope")
-                    or ""
-                ).lower()
-                meta_ids = metadata.get("participantIds") or metadata.get(
-                    "participant_ids"
-                )
-                if scope == "custom" and isinstance(meta_ids, list):
-                    normalized = {
-                        str(pid).strip() for pid in meta_ids if str(pid).strip()
-                    }
-                    if normalized:
-                        allowed = normalized
+                allowed = _custom_scope_ids(snapshot.get("metadata") or {})
 
     if allowed is None and activity:
-        config = dict(getattr(activity, "config", {}) or {})
-        raw_ids = config.get("participant_ids")
+        raw_ids = (getattr(activity, "config", None) or {}).get("participant_ids")
         if isinstance(raw_ids, list) and raw_ids:
-            allowed = {str(pid).strip() for pid in raw_ids if str(pid).strip()}
+            allowed = _clean_ids(raw_ids)
 
     return allowed, is_active, active_user_ids
 
@@ -171,45 +166,27 @@ async def _resolve_scope(
 async def get_rank_order_summary(
     meeting_id: str,
     activity_id: str = Query(..., description="Agenda activity identifier"),
-    current_user_login: str = Depends(get_current_user),
+    user: User = Depends(get_current_user_model),
     meeting_manager: MeetingManager = Depends(get_meeting_manager),
-    user_manager: UserManager = Depends(get_user_manager),
 ):
-    user = user_manager.get_user_by_login(current_user_login)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    meeting, snapshot = await _load_meeting_and_snapshot(meeting_manager, meeting_id)
 
-    meeting = meeting_manager.get_meeting(meeting_id)
-    if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
-
-    activity = next(
-        (
-            item
-            for item in getattr(meeting, "agenda_activities", [])
-            if item.activity_id == activity_id
-        ),
-        None,
-    )
+    activity = activity_by_id(meeting, activity_id)
     if not activity:
         raise HTTPException(status_code=404, detail="Agenda activity not found")
 
-    allowed_participant_ids, is_active, active_user_ids = await _resolve_scope(
-        meeting_id, activity_id, activity
+    allowed_participant_ids, is_active, active_user_ids = _resolve_scope(
+        snapshot, activity_id, activity
+    )
+    is_facilitator, active_count = _authorize_and_count(
+        meeting, user, allowed_participant_ids, active_user_ids
     )
-    _, is_facilitator = _ensure_user_access(meeting, user, allowed_participant_ids)
     if not is_active and not is_facilitator:
         raise HTTPException(
             status_code=403,
             detail="This activity is not open for rank-order voting.",
         )
 
-    active_count = _compute_active_participant_count(
-        meeting,
-        allowed_participant_ids,
-        active_user_ids,
-    )
-
     manager = RankOrderVotingManager(meeting_manager.db)
     summary = manager.build_summary(
         meeting,
@@ -226,45 +203,28 @@ async def get_rank_order_summary(
 async def submit_rank_order_ranking(
     meeting_id: str,
     payload: RankOrderSubmitRequest,
-    current_user_login: str = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    user: User = Depends(get_current_user_model),
     meeting_manager: MeetingManager = Depends(get_meeting_manager),
-    user_manager: UserManager = Depends(get_user_manager),
 ):
-    user = user_manager.get_user_by_login(current_user_login)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    meeting, snapshot = await _load_meeting_and_snapshot(meeting_manager, meeting_id)
 
-    meeting = meeting_manager.get_meeting(meeting_id)
-    if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
-
-    activity = next(
-        (
-            item
-            for item in getattr(meeting, "agenda_activities", [])
-            if item.activity_id == payload.activity_id
-        ),
-        None,
-    )
+    activity = activity_by_id(meeting, payload.activity_id)
     if not activity:
         raise HTTPException(status_code=404, detail="Agenda activity not found")
 
-    allowed_participant_ids, is_active, active_user_ids = await _resolve_scope(
-        meeting_id, payload.activity_id, activity
+    allowed_participant_ids, is_active, active_user_ids = _resolve_scope(
+        snapshot, payload.activity_id, activity
+    )
+    _, active_count = _authorize_and_count(
+        meeting, user, allowed_participant_ids, active_user_ids
     )
-    _ensure_user_access(meeting, user, allowed_participant_ids)
     if not is_active:
         raise HTTPException(
             status_code=403,
             detail="This activity is not open for rank-order voting.",
         )
 
-    active_count = _compute_active_participant_count(
-        meeting,
-        allowed_participant_ids,
-        active_user_ids,
-    )
-
     manager = RankOrderVotingManager(meeting_manager.db)
     summary = manager.submit_ranking(
         meeting,
@@ -275,7 +235,9 @@ async def submit_rank_order_ranking(
         active_participant_count=active_count,
     )
 
-    await websocket_manager.broadcast(
+    # Fan out after the response is sent so the caller does not wait on peers.
+    background_tasks.add_task(
+        websocket_manager.broadcast,
         meeting_id,
         {
             "type": "rank_order_voting_update",
@@ -291,45 +253,28 @@ async def submit_rank_order_ranking(
 async def reset_rank_order_ranking(
     meeting_id: str,
     payload: RankOrderResetRequest,
-    current_user_login: str = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    user: User = Depends(get_current_user_model),
     meeting_manager: MeetingManager = Depends(get_meeting_manager),
-    user_manager: UserManager = Depends(get_user_manager),
 ):
-    user = user_manager.get_user_by_login(current_user_login)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    meeting = meeting_manager.get_meeting(meeting_id)
-    if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+    meeting, snapshot = await _load_meeting_and_snapshot(meeting_manager, meeting_id)
 
-    activity = next(
-        (
-            item
-            for item in getattr(meeting, "agenda_activities", [])
-            if item.activity_id == payload.activity_id
-        ),
-        None,
-    )
+    activity = activity_by_id(meeting, payload.activity_id)
     if not activity:
         raise HTTPException(status_code=404, detail="Agenda activity not found")
 
-    allowed_participant_ids, is_active, active_user_ids = await _resolve_scope(
-        meeting_id, payload.activity_id, activity
+    allowed_participant_ids, is_active, active_user_ids = _resolve_scope(
+        snapshot, payload.activity_id, activity
+    )
+    _, active_count = _authorize_and_count(
+        meeting, user, allowed_participant_ids, active_user_ids
     )
-    _ensure_user_access(meeting, user, allowed_participant_ids)
     if not is_active:
         raise HTTPException(
             status_code=403,
             detail="This activity is not open for rank-order voting.",
         )
 
-    active_count = _compute_active_participant_count(
-        meeting,
-        allowed_participant_ids,
-        active_user_ids,
-    )
-
     manager = RankOrderVotingManager(meeting_manager.db)
     summary = manager.reset_ranking(
         meeting,
@@ -339,7 +284,9 @@ async def reset_rank_order_ranking(
         active_participant_count=active_count,
     )
 
-    await websocket_manager.broadcast(
+    # Fan out after the response is sent so the caller does not wait on peers.
+    background_tasks.add_task(
+        websocket_manager.broadcast,
         meeting_id,
         {
             "type": "rank_order_voting_update",
@@ -1,10 +1,17 @@
 import logging
 from datetime import datetime, UTC
-from typing import Dict
+from typing import Dict, List
+
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+from fastapi.concurrency import run_in_threadpool
 from app.data.meeting_manager import MeetingManager, get_meeting_manager
 from app.services import meeting_state_manager
-from app.utils.websocket_manager import ConnectionInfo, websocket_manager
+from app.utils.websocket_manager import (
+    ConnectionInfo,
+    encode_message,
+    websocket_manager,
+)
 from app.models.meeting import AgendaActivity
 from app.services.meeting_state import JSONCompatibleDict
 
@@ -12,6 +19,10 @@ router = APIRouter(prefix="/ws", tags=["realtime"])
 
 logger = logging.getLogger(__name__)
 
+# Agendas longer than this are formatted in the threadpool so a burst of
+# connects to a large meeting does not stall other sockets.
+AGENDA_FORMAT_OFFLOAD_THRESHOLD = 50
+
 
 def _serialize_connection(connection: ConnectionInfo) -> Dict[str, str]:
     """Helper to convert connection metadata into a JSON-friendly shape."""
@@ -34,6 +45,37 @@ def _format_agenda_activity(activity: AgendaActivity) -> JSONCompatibleDict:
     }
 
 
+def _build_formatted_agenda(
+    activities: List[AgendaActivity],
+) -> List[JSONCompatibleDict]:
+    # agenda_activities is already ordered by order_index on the relationship.
+    return [_format_agenda_activity(a) for a in activities]
+
+
+async def _load_formatted_agenda(meeting) -> List[JSONCompatibleDict]:
+    """Format the meeting agenda, off the event loop when it is large."""
+    activities = list(meeting.agenda_activities)
+    if len(activities) > AGENDA_FORMAT_OFFLOAD_THRESHOLD:
+        return await run_in_threadpool(_build_formatted_agenda, activities)
+    return _build_formatted_agenda(activities)
+
+
+async def _sync_agenda(
+    meeting_id: str, formatted_agenda: List[JSONCompatibleDict]
+) -> None:
+    """Ensure the meeting state carries the agenda loaded for this connection.
+
+    The list is formatted once per connection; inbound messages only reassign
+    it when another writer has replaced the state's agenda in the meantime.
+    """
+    live_state = meeting_state_manager.peek(meeting_id)
+    if live_state is not None and live_state.agenda is formatted_agenda:
+        return
+    current_meeting_state = await meeting_state_manager.get_or_create(meeting_id)
+    if current_meeting_state.agenda is not formatted_agenda:
+        current_meeting_state.agenda = formatted_agenda
+
+
 @router.websocket("/meetings/{meeting_id}")
 async def meeting_socket(
     websocket: WebSocket,
@@ -49,10 +91,7 @@ async def meeting_socket(
         await websocket.close(code=1008, reason="Meeting not found")
         return
 
-    formatted_agenda = [
-        _format_agenda_activity(a)
-        for a in sorted(meeting.agenda_activities, key=lambda x: x.order_index)
-    ]
+    formatted_agenda = await _load_formatted_agenda(meeting)
 
     client_hint = websocket.query_params.get("clientId") or websocket.query_params.get(
         "userId"
@@ -68,13 +107,14 @@ async def meeting_socket(
             meeting_id, connection_id, user_id=user_identifier
         )
 
-    # Ensure the meeting state manager has the latest agenda from the database
-    current_meeting_state = await meeting_state_manager.get_or_create(meeting_id)
-    current_meeting_state.agenda = formatted_agenda
+    await _sync_agenda(meeting_id, formatted_agenda)
     state_snapshot = await meeting_state_manager.register_participant(
         meeting_id, user_identifier
     )
     participants = state_snapshot.get("participants", [])
+    # The ack and the join broadcast carry the same snapshot; encode it once
+    # and embed the pre-serialized JSON in both messages.
+    encoded_state = orjson.Fragment(encode_message(state_snapshot))
 
     await websocket_manager.send_personal_message(
         meeting_id,
@@ -86,28 +126,30 @@ async def meeting_socket(
                 "connectionId": connection_id,
                 "userId": user_identifier,
                 "participants": participants,
-                "state": state_snapshot,
+                "state": encoded_state,
             },
         },
     )
 
-    await websocket_manager.broadcast(
-        meeting_id,
-        {
-            "type": "participant_joined",
-            "payload": {
-                "meetingId": meeting_id,
-                "connectionId": connection_id,
-                "userId": user_identifier,
-                "state": state_snapshot,
+    # The first socket in a meeting has nobody to announce itself to.
+    if websocket_manager.peer_count(meeting_id, exclude=connection_id):
+        await websocket_manager.broadcast(
+            meeting_id,
+            {
+                "type": "participant_joined",
+                "payload": {
+                    "meetingId": meeting_id,
+                    "connectionId": connection_id,
+                    "userId": user_identifier,
+                    "state": encoded_state,
+                },
             },
-        },
-        skip_connection=connection_id,
-    )
+            skip_connection=connection_id,
+        )
 
     try:
         while True:
-            message = await websocket.receive_json()
+            message = orjson.loads(await websocket.receive_text())
             message_type = message.get("type")
             payload = message.get("payload", {})
 
@@ -148,11 +190,7 @@ async def meeting_socket(
                     },
                 )
             elif message_type == "state_request":
-                # Ensure the meeting state manager has the latest agenda from the database
-                current_meeting_state = await meeting_state_manager.get_or_create(
-                    meeting_id
-                )
-                current_meeting_state.agenda = formatted_agenda
+                await _sync_agenda(meeting_id, formatted_agenda)
                 snapshot = await meeting_state_manager.snapshot(meeting_id)
                 await websocket_manager.send_personal_message(
                     meeting_id,
@@ -164,11 +202,7 @@ async def meeting_socket(
                 )
             elif message_type == "state_update":
                 patch = payload if isinstance(payload, dict) else {}
-                # Ensure the meeting state manager has the latest agenda from the database
-                current_meeting_state = await meeting_state_manager.get_or_create(
-                    meeting_id
-                )
-                current_meeting_state.agenda = formatted_agenda
+                await _sync_agenda(meeting_id, formatted_agenda)
                 _, snapshot = await meeting_state_manager.apply_patch(meeting_id, patch)
                 await websocket_manager.broadcast(
                     meeting_id,
@@ -228,15 +262,16 @@ async def meeting_socket(
             meeting_id,
             user_identifier,
         )
-        await websocket_manager.broadcast(
-            meeting_id,
-            {
-                "type": "participant_left",
-                "payload": {
-                    "meetingId": meeting_id,
-                    "connectionId": connection_id,
-                    "userId": user_identifier,
-                    "state": state_snapshot,
+        if websocket_manager.peer_count(meeting_id):
+            await websocket_manager.broadcast(
+                meeting_id,
+                {
+                    "type": "participant_left",
+                    "payload": {
+                        "meetingId": meeting_id,
+                        "connectionId": connection_id,
+                        "userId": user_identifier,
+                        "state": state_snapshot,
+                    },
                 },
-            },
-        )
+            )
@@ -52,7 +52,7 @@ from app.config.settings_store import (
     delete_setting,
 )
 from app.data.user_manager import UserManager, get_user_manager
-from app.models.user import UserRole
+from app.models.user import ADMIN_ROLES, UserRole
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +60,6 @@ router = APIRouter(prefix="/api/settings", tags=["settings"])
 
 # ── Role helpers ──────────────────────────────────────────────────────────────
 
-_ADMIN_ROLES = {UserRole.ADMIN, UserRole.SUPER_ADMIN}
 _FACILITATOR_ROLES = {UserRole.FACILITATOR, UserRole.ADMIN, UserRole.SUPER_ADMIN}
 
 # Settings keys that only admins may write
@@ -137,7 +136,7 @@ def _require_facilitator_or_admin(user_manager: UserManager, user_id: str) -> Us
 
 def _require_admin(user_manager: UserManager, user_id: str) -> UserRole:
     role = _get_user_role(user_manager, user_id)
-    if role not in _ADMIN_ROLES:
+    if role not in ADMIN_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="This setting requires Administrator access.",
@@ -259,7 +258,7 @@ async def get_settings(
 ) -> Dict[str, Any]:
     """Return all runtime settings.  API keys/passwords are masked."""
     role = _require_facilitator_or_admin(user_manager, current_user)
-    is_admin = role in _ADMIN_ROLES
+    is_admin = role in ADMIN_ROLES
     return _build_settings_response(is_admin)
 
 
@@ -278,7 +277,7 @@ async def save_settings(
       as "clear this override" and will delete the DB row.
     """
     role = _require_facilitator_or_admin(user_manager, current_user)
-    is_admin = role in _ADMIN_ROLES
+    is_admin = role in ADMIN_ROLES
 
     updates = body.settings
     if not updates:
@@ -336,7 +335,7 @@ async def reset_setting(
 ) -> Dict[str, Any]:
     """Delete a DB override so the setting reverts to its config.yaml / hardcoded default."""
     role = _require_facilitator_or_admin(user_manager, current_user)
-    is_admin = role in _ADMIN_ROLES
+    is_admin = role in ADMIN_ROLES
 
     if key not in _ALL_KNOWN_KEYS:
         raise HTTPException(
@@ -5,11 +5,18 @@ from datetime import datetime
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
+from sqlalchemy import insert
 from sqlalchemy.orm import Session, joinedload
 
 from app.auth import get_current_active_user
 from app.data.activity_bundle_manager import ActivityBundleManager
-from app.data.meeting_manager import MeetingManager, get_meeting_manager
+from app.data.meeting_manager import (
+    MeetingManager,
+    activity_by_id,
+    facilitator_user_ids,
+    get_meeting_manager,
+)
 from app.database import get_db
 from app.models.categorization import (
     CategorizationAssignment,
@@ -19,7 +26,7 @@ from app.models.categorization import (
 )
 from app.models.idea import Idea
 from app.models.meeting import AgendaActivity, Meeting, MeetingFacilitator
-from app.models.user import User, UserRole
+from app.models.user import ADMIN_ROLES, User
 from app.models.voting import VotingVote
 from app.schemas.meeting import AgendaActivityCreate, AgendaActivityResponse
 from app.schemas.transfer import (
@@ -42,13 +49,15 @@ from app.utils.websocket_manager import websocket_manager
 transfer_router = APIRouter(prefix="/api/meetings/{meeting_id}/transfer")
 logger = logging.getLogger(__name__)
 
+_AGENDA_LIST_ADAPTER = TypeAdapter(List[AgendaActivityResponse])
+
 
 def _assert_facilitator_access(meeting: Meeting, user: User) -> None:
-    facilitator_links = getattr(meeting, "facilitator_links", []) or []
-    is_admin = user.role in {UserRole.ADMIN, UserRole.SUPER_ADMIN}
-    is_owner = meeting.owner_id == user.user_id
-    is_facilitator = any(link.user_id == user.user_id for link in facilitator_links)
-    if not (is_admin or is_owner or is_facilitator):
+    if not (
+        user.role in ADMIN_ROLES
+        or meeting.owner_id == user.user_id
+        or user.user_id in facilitator_user_ids(meeting)
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only facilitators can transfer ideas.",
@@ -56,14 +65,7 @@ def _assert_facilitator_access(meeting: Meeting, user: User) -> None:
 
 
 def _resolve_activity(meeting: Meeting, activity_id: str):
-    activity = next(
-        (
-            item
-            for item in getattr(meeting, "agenda_activities", [])
-            if item.activity_id == activity_id
-        ),
-        None,
-    )
+    activity = activity_by_id(meeting, activity_id)
     if not activity:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Agenda activity not found"
@@ -117,8 +119,8 @@ def _normalize_items(items: List[TransferBundleItem]) -> List[Dict[str, Any]]:
 
 
 def _dedupe_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    seen: set[tuple] = set()
-    deduped: List[Dict[str, Any]] = []
+    # First entry per key wins; dict insertion order preserves the input order.
+    deduped: Dict[tuple, Dict[str, Any]] = {}
     for entry in items:
         source = entry.get("source") or {}
         key = (
@@ -129,11 +131,8 @@ def _dedupe_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             entry.get("parent_id"),
             entry.get("submitted_name"),
         )
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(entry)
-    return deduped
+        deduped.setdefault(key, entry)
+    return list(deduped.values())
 
 
 def _parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
@@ -167,20 +166,22 @@ def _split_ideas_and_comments(
     items: List[Dict[str, Any]]
 ) -> tuple[list[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
     ideas: List[Dict[str, Any]] = []
-    comments_by_parent: Dict[str, List[Dict[str, Any]]] = {}
     idea_ids = set()
+    # Comments are bucketed in the same pass and filtered afterwards, so a
+    # comment listed before its parent idea is still kept.
+    pending: Dict[Any, List[Dict[str, Any]]] = {}
     for entry in items:
-        if entry.get("parent_id") is None:
+        parent_id = entry.get("parent_id")
+        if parent_id is None:
             ideas.append(entry)
             if entry.get("id") is not None:
                 idea_ids.add(entry.get("id"))
-    for entry in items:
-        parent_id = entry.get("parent_id")
-        if parent_id is None:
-            continue
-        if parent_id not in idea_ids:
-            continue
-        comments_by_parent.setdefault(str(parent_id), []).append(entry)
+        else:
+            pending.setdefault(parent_id, []).append(entry)
+    comments_by_parent: Dict[str, List[Dict[str, Any]]] = {}
+    for parent_id, entries in pending.items():
+        if parent_id in idea_ids:
+            comments_by_parent.setdefault(str(parent_id), []).extend(entries)
     return ideas, comments_by_parent
 
 
@@ -200,29 +201,24 @@ def _append_comments_to_content(
     """
     content = str(idea_entry.get("content", "")).strip()
     idea_id = idea_entry.get("id")
-    
-    if not idea_id or str(idea_id) not in comments_by_parent:
-        return content
-    
-    comments = comments_by_parent.get(str(idea_id), [])
-    if not comments:
+    if not idea_id:
         return content
-    
-    # Extract comment text and filter out empty ones
-    comment_texts = [
+    return _with_comment_text(
+        content, _join_comment_texts(comments_by_parent.get(str(idea_id), []))
+    )
+
+
+def _join_comment_texts(comments: List[Dict[str, Any]]) -> str:
+    """Join non-empty comment contents with the ``; `` delimiter."""
+    return "; ".join(
         str(comment.get("content", "")).strip()
         for comment in comments
         if comment.get("content")
-    ]
-    
-    if not comment_texts:
-        return content
-    
-    # Join comments with semicolon delimiter
-    comments_str = "; ".join(comment_texts)
-    
-    # Append to content in parentheses
-    return f"{content} (Comments: {comments_str})"
+    )
+
+
+def _with_comment_text(content: str, comments_str: Optional[str]) -> str:
+    return f"{content} (Comments: {comments_str})" if comments_str else content
 
 
 def _upsert_transfer_bundle(
@@ -367,12 +363,15 @@ async def _broadcast_agenda_update(
     meeting_id: str,
     initiator_id: str,
     meeting_manager: MeetingManager,
-) -> None:
-    updated_agenda_items = meeting_manager.list_agenda(meeting_id)
-    payload = [
-        AgendaActivityResponse.model_validate(item).model_dump()
-        for item in updated_agenda_items
-    ]
+    agenda_items: Optional[list] = None,
+) -> List[Dict[str, Any]]:
+    """Broadcast the serialized agenda and return it for reuse by the caller."""
+    updated_agenda_items = (
+        agenda_items if agenda_items is not None else meeting_manager.list_agenda(meeting_id)
+    )
+    payload = _AGENDA_LIST_ADAPTER.dump_python(
+        _AGENDA_LIST_ADAPTER.validate_python(updated_agenda_items)
+    )
     await websocket_manager.broadcast(
         meeting_id,
         {
@@ -381,6 +380,7 @@ async def _broadcast_agenda_update(
             "meta": {"initiatorId": initiator_id},
         },
     )
+    return payload
 
 
 def _map_transfer_config(
@@ -392,6 +392,23 @@ def _map_transfer_config(
     inherited_config_from_donor: bool,
 ) -> dict:
     """Apply tool-type-specific mapping of transferred ideas into the target config dict. Mutates and returns config."""
+    # Join each parent's comments once; the option loops below only look up
+    # the joined text by idea id.
+    comment_text_by_parent: Dict[str, str] = (
+        {
+            parent_id: _join_comment_texts(entries)
+            for parent_id, entries in comments_by_parent.items()
+        }
+        if include_comments and comments_by_parent
+        else {}
+    )
+
+    def _content_with_comments(entry: Dict[str, Any], content: str) -> str:
+        idea_id = entry.get("id")
+        if not idea_id:
+            return content
+        return _with_comment_text(content, comment_text_by_parent.get(str(idea_id)))
+
     if target_tool == "voting":
         config.setdefault("allow_retract", True)
         use_transferred_options = inherited_config_from_donor or not config.get("options")
@@ -404,7 +421,7 @@ def _map_transfer_config(
                 if not content:
                     continue
                 if include_comments and comments_by_parent:
-                    modified_content = _append_comments_to_content(entry, comments_by_parent)
+                    modified_content = _content_with_comments(entry, content)
                     if modified_content != content:
                         logger.info(
                             "transfer commit appending comments: original='%s' modified='%s' idea_id=%s",
@@ -445,7 +462,7 @@ def _map_transfer_config(
                 if not content:
                     continue
                 if include_comments and comments_by_parent:
-                    content = _append_comments_to_content(entry, comments_by_parent)
+                    content = _content_with_comments(entry, content)
                 mapped_items.append(content)
             if mapped_items:
                 config["items"] = mapped_items
@@ -472,7 +489,7 @@ def _map_transfer_config(
                 if not content:
                     continue
                 if include_comments and comments_by_parent:
-                    content = _append_comments_to_content(entry, comments_by_parent)
+                    content = _content_with_comments(entry, content)
                 mapped_entry = {
                     "id": entry.get("id"),
                     "content": content,
@@ -497,6 +514,28 @@ def _map_transfer_config(
     return config
 
 
+def _idea_row(
+    meeting_id: str,
+    activity_id: str,
+    entry: Dict[str, Any],
+    *,
+    parent_id: Optional[int],
+) -> Dict[str, Any]:
+    """Build bulk-insert parameters for one transferred idea or comment."""
+    row: Dict[str, Any] = {
+        "meeting_id": meeting_id,
+        "activity_id": activity_id,
+        "content": entry.get("content"),
+        "submitted_name": entry.get("submitted_name"),
+        "parent_id": parent_id,
+        "idea_metadata": entry.get("metadata") or {},
+    }
+    timestamp = _parse_iso_timestamp(entry.get("timestamp") or entry.get("created_at"))
+    if timestamp:
+        row["timestamp"] = timestamp
+    return row
+
+
 def _seed_brainstorming_ideas(
     db: Session,
     meeting_id: str,
@@ -518,45 +557,30 @@ def _seed_brainstorming_ideas(
         )
         return
 
-    idea_map: Dict[str, int] = {}
-    for idea_entry in ideas:
-        idea = Idea(
-            meeting_id=meeting_id,
-            activity_id=activity_id,
-            content=idea_entry.get("content"),
-            submitted_name=idea_entry.get("submitted_name"),
-            parent_id=None,
-            idea_metadata=idea_entry.get("metadata") or {},
-        )
-        timestamp = _parse_iso_timestamp(
-            idea_entry.get("timestamp") or idea_entry.get("created_at")
-        )
-        if timestamp:
-            idea.timestamp = timestamp
-        db.add(idea)
-        db.flush()
-        if idea_entry.get("id") is not None:
-            idea_map[str(idea_entry.get("id"))] = idea.id
+    idea_rows = [
+        _idea_row(meeting_id, activity_id, idea_entry, parent_id=None)
+        for idea_entry in ideas
+    ]
+    # One INSERT ... RETURNING for every idea; sort_by_parameter_order keeps
+    # the returned ids aligned with ``ideas`` so client keys can be mapped.
+    new_ids = db.scalars(
+        insert(Idea).returning(Idea.id, sort_by_parameter_order=True),
+        idea_rows,
+    ).all()
+    idea_map: Dict[str, int] = {
+        str(idea_entry.get("id")): new_id
+        for idea_entry, new_id in zip(ideas, new_ids)
+        if idea_entry.get("id") is not None
+    }
 
-    for parent_key, comment_entries in comments_by_parent.items():
-        parent_id = idea_map.get(str(parent_key))
-        if not parent_id:
-            continue
-        for comment_entry in comment_entries:
-            comment = Idea(
-                meeting_id=meeting_id,
-                activity_id=activity_id,
-                content=comment_entry.get("content"),
-                submitted_name=comment_entry.get("submitted_name"),
-                parent_id=parent_id,
-                idea_metadata=comment_entry.get("metadata") or {},
-            )
-            timestamp = _parse_iso_timestamp(
-                comment_entry.get("timestamp") or comment_entry.get("created_at")
-            )
-            if timestamp:
-                comment.timestamp = timestamp
-            db.add(comment)
+    comment_rows = [
+        _idea_row(meeting_id, activity_id, comment_entry, parent_id=parent_id)
+        for parent_key, comment_entries in comments_by_parent.items()
+        if (parent_id := idea_map.get(str(parent_key)))
+        for comment_entry in comment_entries
+    ]
+    if comment_rows:
+        db.execute(insert(Idea), comment_rows)
     db.commit()
     seeded_count = (
         db.query(Idea)
@@ -840,6 +864,7 @@ async def commit_transfer(
 
     bundle_metadata = dict(payload.metadata or {})
     round_index = _resolve_round_index(metadata=bundle_metadata, donor=donor)
+    comment_count = sum(len(entries) for entries in comments_by_parent.values())
     bundle_metadata = ensure_transfer_metadata(
         base=bundle_metadata,
         meeting_id=meeting_id,
@@ -850,7 +875,7 @@ async def commit_transfer(
         tool_details={
             "include_comments": payload.include_comments,
             "idea_count": len(ideas),
-            "comment_count": sum(len(entries) for entries in comments_by_parent.values()),
+            "comment_count": comment_count,
         },
     )
     append_transfer_history(
@@ -863,7 +888,7 @@ async def commit_transfer(
             "target_mode": "existing" if existing_target_mode else "new",
             "include_comments": payload.include_comments,
             "idea_count": len(ideas),
-            "comment_count": sum(len(entries) for entries in comments_by_parent.values()),
+            "comment_count": comment_count,
         },
         created_at=bundle_metadata.get("created_at"),
     )
@@ -874,18 +899,14 @@ async def commit_transfer(
             "comments_by_parent": comments_by_parent,
         }
     )
-    bundle_metadata = ensure_transfer_metadata(
-        base=bundle_metadata,
-        meeting_id=meeting_id,
-        source_activity_id=payload.donor_activity_id,
-        source_tool_type=donor.tool_type,
-        round_index=round_index,
-        tool_type=target_tool,
-        tool_details={
-            "activity_id": created.activity_id,
-            "title": created.title,
-        },
-    )
+    # ensure_transfer_metadata already returned a fresh ``tools`` dict, so the
+    # target tool block can be merged in place instead of normalizing again.
+    tools = bundle_metadata["tools"]
+    tools[target_tool] = {
+        **(tools.get(target_tool) or {}),
+        "activity_id": created.activity_id,
+        "title": created.title,
+    }
     bundle_manager = ActivityBundleManager(db)
     input_bundle = bundle_manager.create_bundle(
         meeting_id, created.activity_id, "input", ideas, bundle_metadata
@@ -899,7 +920,12 @@ async def commit_transfer(
             comments_by_parent=comments_by_parent,
         )
 
-    await _broadcast_agenda_update(meeting_id, current_user.user_id, meeting_manager)
+    agenda_payload = await _broadcast_agenda_update(
+        meeting_id,
+        current_user.user_id,
+        meeting_manager,
+        agenda_items=meeting_manager.list_agenda(meeting_id),
+    )
     await meeting_state_manager.apply_patch(
         meeting_id,
         {
@@ -910,15 +936,15 @@ async def commit_transfer(
         },
     )
 
-    agenda_items = meeting_manager.list_agenda(meeting_id)
-    target_activity_payload = AgendaActivityResponse.model_validate(created).model_dump()
+    # The created activity was serialized with the agenda; reuse that entry.
+    target_activity_payload = next(
+        (item for item in agenda_payload if item["activity_id"] == created.activity_id),
+        None,
+    ) or AgendaActivityResponse.model_validate(created).model_dump()
     # target_activity is the canonical key; new_activity is None for existing-target transfers.
     return {
         "target_activity": target_activity_payload,
         "new_activity": None if existing_target_mode else target_activity_payload,
-        "agenda": [
-            AgendaActivityResponse.model_validate(item).model_dump()
-            for item in agenda_items
-        ],
+        "agenda": agenda_payload,
         "input_bundle_id": input_bundle.bundle_id,
     }
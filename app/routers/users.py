@@ -710,7 +710,7 @@ async def user_directory(
             )
 
         if meeting_id:
-            meeting = meeting_manager.get_meeting(meeting_id)
+            meeting = meeting_manager.get_meeting_with_roster(meeting_id)
             if not meeting:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found"
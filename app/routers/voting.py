@@ -6,10 +6,15 @@ from typing import Optional, Set
 from app.services import meeting_state_manager
 
 from app.auth.auth import get_current_user
-from app.data.meeting_manager import MeetingManager, get_meeting_manager
+from app.data.meeting_manager import (
+    MeetingManager,
+    facilitator_user_ids,
+    get_meeting_manager,
+    participant_user_ids,
+)
 from app.services.voting_manager import VotingManager
 from app.data.user_manager import UserManager, get_user_manager
-from app.models.user import User, UserRole
+from app.models.user import ADMIN_ROLES, User, UserRole
 from app.schemas.voting import (
     VoteCastRequest,
     VoteCastResponse,
@@ -27,23 +32,15 @@ def _ensure_user_access(
     user: User,
     allowed_participant_ids: Optional[Set[str]] = None,
 ) -> tuple[bool, bool]:
-    facilitator_ids = {
-        link.user_id
-        for link in getattr(meeting, "facilitator_links", []) or []
-        if getattr(link, "user_id", None)
-    }
-    if getattr(meeting, "owner_id", None):
-        facilitator_ids.add(meeting.owner_id)
-
-    participant_ids = {
-        getattr(participant, "user_id", None)
-        for participant in getattr(meeting, "participants", [])
-    }
-
+    user_id = user.user_id
     role_value = getattr(user, "role", UserRole.PARTICIPANT.value)
-    is_admin = role_value in {UserRole.ADMIN.value, UserRole.SUPER_ADMIN.value}
-    is_facilitator = is_admin or user.user_id in facilitator_ids
-    is_participant = is_facilitator or is_admin or user.user_id in participant_ids
+    is_admin = role_value in ADMIN_ROLES
+    is_facilitator = (
+        is_admin
+        or getattr(meeting, "owner_id", None) == user_id
+        or user_id in facilitator_user_ids(meeting)
+    )
+    is_participant = is_facilitator or user_id in participant_user_ids(meeting)
 
     if not is_participant:
         raise HTTPException(
@@ -130,8 +127,7 @@ async def _resolve_voting_scope(
                         allowed = normalized
 
     if allowed is None and activity:
-        config = dict(getattr(activity, "config", {}) or {})
-        raw_ids = config.get("participant_ids")
+        raw_ids = (getattr(activity, "config", None) or {}).get("participant_ids")
         if isinstance(raw_ids, list) and raw_ids:
             allowed = {str(pid).strip() for pid in raw_ids if str(pid).strip()}
     return allowed, is_active
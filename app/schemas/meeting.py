@@ -249,14 +249,15 @@ class MeetingResponse(BaseModel):
     @classmethod
     def _attach_participant_ids(cls, data):
         def extract_ids(source):
-            ids = []
-            for participant in source or []:
-                user_id = getattr(participant, "user_id", None)
-                if user_id:
-                    ids.append(user_id)
             # Preserve order while removing duplicates
-            seen = set()
-            return [pid for pid in ids if not (pid in seen or seen.add(pid))]
+            return list(
+                dict.fromkeys(
+                    filter(
+                        None,
+                        (getattr(participant, "user_id", None) for participant in source or []),
+                    )
+                )
+            )
 
         if isinstance(data, dict):
             if not data.get("participant_ids"):
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
 from typing import Any, Dict, List, Optional
 
+from app.plugins.base import ActivityPlugin
 from app.plugins.registry import get_activity_registry
 from app.utils.identifiers import derive_activity_prefix
 
@@ -130,13 +132,10 @@ def get_enriched_activity_catalog() -> List[Dict[str, Any]]:
     return catalog
 
 
-def get_activity_definition(tool_type: str) -> Optional[Dict[str, Any]]:
-    """Return the catalog entry for the given tool type, if registered."""
-    normalised = (tool_type or "").strip().lower()
-    registry = get_activity_registry()
-    plugin = registry.get_plugin(normalised)
-    if not plugin:
-        return None
+@functools.lru_cache(maxsize=64)
+def _build_activity_definition(plugin: ActivityPlugin, normalised: str) -> Dict[str, Any]:
+    # Keyed on the plugin instance, so re-registering a tool type builds a
+    # fresh entry instead of serving the old manifest.
     entry = {
         "tool_type": plugin.manifest.tool_type,
         "label": plugin.manifest.label,
@@ -149,3 +148,20 @@ def get_activity_definition(tool_type: str) -> Optional[Dict[str, Any]]:
     enriched = dict(entry)
     enriched["stem"] = derive_activity_prefix(normalised)
     return enriched
+
+
+def get_activity_definition(tool_type: str) -> Optional[Dict[str, Any]]:
+    """Return the catalog entry for the given tool type, if registered.
+
+    Entries are memoized per plugin; callers get a copy whose top level and
+    ``default_config`` may be modified freely.
+    """
+    normalised = (tool_type or "").strip().lower()
+    registry = get_activity_registry()
+    plugin = registry.get_plugin(normalised)
+    if not plugin:
+        return None
+    cached = _build_activity_definition(plugin, normalised)
+    definition = dict(cached)
+    definition["default_config"] = dict(cached["default_config"])
+    return definition
@@ -42,9 +42,13 @@ class MeetingState:
     def touch(self) -> None:
         self.last_updated = _now()
 
-    def to_payload(self) -> JSONCompatibleDict:
-        """Return a JSON-friendly snapshot of the meeting state."""
-        return {
+    def to_payload(self, *, index_activities: bool = False) -> JSONCompatibleDict:
+        """Return a JSON-friendly snapshot of the meeting state.
+
+        ``index_activities`` adds ``activeActivitiesById`` for server-side
+        lookups; it is left out of payloads sent to clients.
+        """
+        payload = {
             "meetingId": self.meeting_id,
             "currentActivity": self.current_activity,
             "currentTool": self.current_tool,
@@ -59,6 +63,9 @@ class MeetingState:
             ],
             "updatedAt": self.last_updated.isoformat(),
         }
+        if index_activities:
+            payload["activeActivitiesById"] = dict(self.active_activities)
+        return payload
 
 
 class MeetingStateManager:
@@ -76,10 +83,22 @@ class MeetingStateManager:
                 self._states[meeting_id] = state
             return state
 
-    async def snapshot(self, meeting_id: str) -> Optional[JSONCompatibleDict]:
+    def peek(self, meeting_id: str) -> Optional[MeetingState]:
+        """Return the live state, if any, without taking the lock.
+
+        A single dict lookup with no await cannot interleave with the locked
+        mutators, so read-mostly callers can skip the lock round-trip.
+        """
+        return self._states.get(meeting_id)
+
+    async def snapshot(
+        self, meeting_id: str, *, index_activities: bool = False
+    ) -> Optional[JSONCompatibleDict]:
         async with self._lock:
             state = self._states.get(meeting_id)
-            return state.to_payload() if state else None
+            if state is None:
+                return None
+            return state.to_payload(index_activities=index_activities)
 
     async def register_participant(
         self,
@@ -11,7 +11,11 @@ from app.plugins.builtin.voting_plugin import VotingPlugin
 from app.plugins.builtin.brainstorming_plugin import BrainstormingPlugin
 from app.plugins.context import ActivityContext
 from app.services.activity_pipeline import ActivityPipeline
-from app.services.activity_catalog import get_activity_catalog, normalise_reliability_policy
+from app.services.activity_catalog import (
+    get_activity_catalog,
+    get_activity_definition,
+    normalise_reliability_policy,
+)
 from app.services.categorization_manager import CategorizationManager
 from app.services.voting_manager import VotingManager
 
@@ -357,6 +361,21 @@ def test_activity_catalog_includes_core_tools():
     assert submit_policy.get("idempotency_header") == "X-Idempotency-Key"
 
 
+def test_activity_definition_is_memoized_but_returned_as_copy():
+    first = get_activity_definition(" Voting ")
+    assert first is not None
+    assert first["tool_type"] == "voting"
+    first["label"] = "Changed"
+    first["default_config"]["injected"] = True
+
+    second = get_activity_definition("voting")
+    assert second is not first
+    assert second["label"] != "Changed"
+    assert "injected" not in second["default_config"]
+    assert second["reliability_policy"] is first["reliability_policy"]
+    assert get_activity_definition("not-a-tool") is None
+
+
 def test_reliability_policy_normalisation_applies_safe_defaults():
     normalised = normalise_reliability_policy(
         {
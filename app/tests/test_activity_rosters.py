@@ -1,4 +1,5 @@
 import asyncio
+import json
 import pytest
 from datetime import datetime, timedelta, timezone
 from app.data.meeting_manager import MeetingManager
@@ -162,6 +163,28 @@ def test_api_update_activity_participants(client, db_session: Session):
     assert data["participant_ids"] == []
 
 
+def test_put_custom_roster_dedupes_ids(client, db_session: Session):
+    owner = create_test_user(db_session, "owner", "facilitator")
+    p1 = create_test_user(db_session, "p1")
+    p2 = create_test_user(db_session, "p2")
+    meeting = create_test_meeting(db_session, owner, [p1, p2])
+    activity = meeting.agenda_activities[0]
+
+    client.post(
+        "/api/auth/token", json={"username": "owner", "password": TEST_PASSWORD}
+    )
+
+    response = client.put(
+        f"/api/meetings/{meeting.meeting_id}/agenda/{activity.activity_id}/participants",
+        json={
+            "mode": "custom",
+            "participant_ids": [p2.user_id, p1.user_id, f" {p2.user_id} "],
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["participant_ids"] == [p2.user_id, p1.user_id]
+
+
 def test_put_empty_custom_normalizes_to_all(client, db_session: Session):
     """Roster Rodeo / Payload Polka — empty custom PUT payloads normalize to all-participants."""
     owner = create_test_user(db_session, "owner_step1", "facilitator")
@@ -471,6 +494,7 @@ def test_put_409_includes_current_assignment(client, db_session: Session, monkey
         current_assignment = conflict_details["current_assignment"]
         assert current_assignment["mode"] == "custom"
         assert current_assignment["participant_ids"] == [p1.user_id]
+        assert json.loads(response.headers["X-Conflict-Details"]) == conflict_details
         assert {row["user_id"] for row in current_assignment["available_participants"]} == {
             p1.user_id,
             p2.user_id,
@@ -763,3 +787,71 @@ def test_transition_from_all_to_custom_via_single_removal(client, db_session: Se
     payload = response.json()
     assert payload["mode"] == "custom"
     assert set(payload["participant_ids"]) == {p1.user_id, p2.user_id}
+
+
+def test_start_tool_409_lists_conflicting_users(client, db_session: Session, monkeypatch):
+    monkeypatch.setattr(
+        "app.data.meeting_manager.get_activity_participant_exclusivity",
+        lambda: True,
+    )
+    owner = create_test_user(db_session, "owner_start_conflict", "facilitator")
+    p1 = create_test_user(db_session, "p1_start_conflict")
+    p2 = create_test_user(db_session, "p2_start_conflict")
+    meeting = create_test_meeting(db_session, owner, [p1, p2])
+    manager = MeetingManager(db_session)
+    activity_a = meeting.agenda_activities[0]
+    activity_b = manager.add_agenda_activity(
+        meeting.meeting_id,
+        AgendaActivityCreate(tool_type="brainstorming", title="Brainstorm", order_index=2),
+    )
+    manager.set_activity_participants(meeting.meeting_id, activity_a.activity_id, [p1.user_id])
+    manager.set_activity_participants(meeting.meeting_id, activity_b.activity_id, [p1.user_id])
+
+    asyncio.run(meeting_state_manager.reset(meeting.meeting_id))
+    try:
+        asyncio.run(
+            meeting_state_manager.apply_patch(
+                meeting.meeting_id,
+                {
+                    "currentActivity": activity_a.activity_id,
+                    "currentTool": activity_a.tool_type,
+                    "status": "in_progress",
+                    "activeActivities": [
+                        {
+                            "activityId": activity_a.activity_id,
+                            "tool": activity_a.tool_type,
+                            "status": "in_progress",
+                            "metadata": {
+                                "participantScope": "custom",
+                                "participantIds": [p1.user_id],
+                            },
+                            "participantIds": [p1.user_id],
+                            "startedAt": datetime.now(timezone.utc).isoformat(),
+                            "stoppedAt": None,
+                            "elapsedTime": 0,
+                        },
+                    ],
+                },
+            )
+        )
+
+        client.post(
+            "/api/auth/token", json={"username": owner.login, "password": TEST_PASSWORD}
+        )
+        response = client.post(
+            f"/api/meetings/{meeting.meeting_id}/control",
+            json={
+                "action": "start_tool",
+                "tool": activity_b.tool_type,
+                "activityId": activity_b.activity_id,
+            },
+        )
+        assert response.status_code == 409, response.json()
+        conflict_details = response.json()["conflict_details"]
+        assert [user["user_id"] for user in conflict_details["conflicting_users"]] == [
+            p1.user_id
+        ]
+        assert conflict_details["conflicting_users"][0]["login"] == p1.login
+        assert conflict_details["active_activity_id"] == activity_a.activity_id
+    finally:
+        asyncio.run(meeting_state_manager.reset(meeting.meeting_id))
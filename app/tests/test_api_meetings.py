@@ -12,7 +12,12 @@ from fastapi.testclient import TestClient
 
 from app.config.loader import get_guest_join_enabled
 from app.data.user_manager import UserManager
-from app.data.meeting_manager import MeetingManager
+from app.data.meeting_manager import (
+    MeetingManager,
+    activity_by_id,
+    facilitator_user_ids,
+    participant_user_ids,
+)
 from app.services import meeting_state_manager
 from app.schemas.meeting import AgendaActivityCreate
 from app.schemas.meeting import MeetingCreate, PublicityType
@@ -20,8 +25,9 @@ from app.models.categorization import CategorizationBallot
 from app.models.idea import Idea
 from app.models.meeting import AgendaActivity
 from app.models.voting import VotingVote
-from app.models.user import UserRole
+from app.models.user import User, UserRole
 from app.utils.security import get_password_hash
+from app.routers import meetings as meetings_router
 
 EXPORT_ZIP_BASE64 = (
     "UEsDBBQAAAAIAOGKMFzeP7hayQIAAAoPAAAMAAAAbWVldGluZy5qc29u1VZda9swFH3vrwh+XVNkx05b"
@@ -202,6 +208,7 @@ def test_export_meeting_returns_zip_bundle(
     meeting_payload = json.loads(archive.read("meeting.json").decode("utf-8"))
     assert meeting_payload["meeting"]["meeting_id"] == test_meeting_data
     assert meeting_payload["meeting"]["title"] == "Test Meeting for Get"
+    assert meeting_payload["exported_at"].endswith("+00:00")
 
 
 def test_import_meeting_bundle_from_fixture(
@@ -228,6 +235,65 @@ def test_import_meeting_bundle_from_fixture(
     )
     assert idea_count == 6
 
+    comments = (
+        db_session.query(Idea)
+        .filter(Idea.meeting_id == payload["id"], Idea.parent_id.isnot(None))
+        .all()
+    )
+    assert len(comments) == 1
+    parent = db_session.get(Idea, comments[0].parent_id)
+    assert parent is not None
+    assert parent.meeting_id == payload["id"]
+
+
+def test_import_meeting_bundle_accepts_multipart_and_rejects_bad_input(
+    authenticated_client: TestClient,
+):
+    zip_bytes = _decode_export_zip()
+    response = authenticated_client.post(
+        "/api/meetings/import",
+        files={"file": ("meeting.zip", zip_bytes, "application/zip")},
+    )
+    assert response.status_code == 200, response.json()
+    assert response.json()["agenda"]
+
+    empty = authenticated_client.post(
+        "/api/meetings/import",
+        content=b"",
+        headers={"Content-Type": "application/zip"},
+    )
+    assert empty.status_code == 400
+    assert empty.json()["detail"] == "Import file is empty"
+
+    not_zip = authenticated_client.post(
+        "/api/meetings/import",
+        content=b"not a zip archive",
+        headers={"Content-Type": "application/zip"},
+    )
+    assert not_zip.status_code == 400
+    assert not_zip.json()["detail"] == "Invalid zip file"
+
+
+def test_import_meeting_bundle_rejects_oversized_bodies(
+    authenticated_client: TestClient, monkeypatch
+):
+    zip_bytes = _decode_export_zip()
+    monkeypatch.setattr(meetings_router, "IMPORT_MAX_BODY_SIZE", len(zip_bytes) - 1)
+
+    raw = authenticated_client.post(
+        "/api/meetings/import",
+        content=zip_bytes,
+        headers={"Content-Type": "application/zip"},
+    )
+    assert raw.status_code == 413
+    assert raw.json()["detail"] == "Import file is too large"
+
+    multipart = authenticated_client.post(
+        "/api/meetings/import",
+        files={"file": ("meeting.zip", zip_bytes, "application/zip")},
+    )
+    assert multipart.status_code == 413
+
 
 def test_create_meeting_returns_new_meeting(
     authenticated_client: TestClient, user_manager_with_admin: UserManager
@@ -435,6 +501,24 @@ def test_add_agenda_item_to_meeting(
     assert any(item["activity_id"] == created["activity_id"] for item in items)
 
 
+def test_add_agenda_item_broadcasts_agenda_update_before_responding(
+    authenticated_client: TestClient, test_meeting_data: str, monkeypatch
+):
+    sent = []
+
+    async def _record_broadcast(meeting_id, message, **_kwargs):
+        sent.append((meeting_id, message.get("type")))
+
+    monkeypatch.setattr(meetings_router.websocket_manager, "broadcast", _record_broadcast)
+
+    create_response = authenticated_client.post(
+        f"/api/meetings/{test_meeting_data}/agenda",
+        json={"tool_type": "voting", "title": "Broadcast check"},
+    )
+    assert create_response.status_code == 201, create_response.json()
+    assert (test_meeting_data, "agenda_update") in sent
+
+
 def test_update_and_delete_agenda_item(
     authenticated_client: TestClient, test_meeting_data: str, mocker
 ):
@@ -877,6 +961,62 @@ def test_start_preserves_accumulated_elapsed_time(
     assert payload["metadata"]["elapsedTime"] == 25
 
 
+def test_pause_resume_stop_persist_activity_timing(
+    authenticated_client: TestClient,
+    user_manager_with_admin: UserManager,
+):
+    admin_user = user_manager_with_admin.get_user_by_email(
+        os.getenv("ADMIN_EMAIL", "admin@decidero.local")
+    )
+    assert admin_user is not None
+
+    meeting_response = authenticated_client.post(
+        "/api/meetings/",
+        json={
+            "title": "Timing Persistence",
+            "description": "Control actions write timing fields",
+            "scheduled_datetime": (datetime.now(UTC) + timedelta(hours=1)).isoformat(),
+            "agenda_items": ["Item A"],
+            "participant_contacts": [admin_user.login],
+        },
+    )
+    assert meeting_response.status_code == 200, meeting_response.json()
+    meeting_data = meeting_response.json()
+    meeting_id = meeting_data["id"]
+    activity_id = meeting_data["agenda"][0]["activity_id"]
+    db = user_manager_with_admin.db
+
+    def _control(action: str):
+        response = authenticated_client.post(
+            f"/api/meetings/{meeting_id}/control",
+            json={"action": action, "tool": "brainstorming", "activityId": activity_id},
+        )
+        assert response.status_code == 200, response.json()
+        db.expire_all()
+        activity = (
+            db.query(AgendaActivity)
+            .filter(AgendaActivity.activity_id == activity_id)
+            .one()
+        )
+        return response.json()["state"], activity
+
+    _control("start_tool")
+    paused_state, paused = _control("pause_tool")
+    assert paused.started_at is None
+    assert paused.stopped_at is not None
+    assert paused_state["activeActivities"][0]["elapsedTime"] == paused.elapsed_duration
+
+    _, resumed = _control("resume_tool")
+    assert resumed.started_at is not None
+    assert resumed.stopped_at is None
+    assert resumed.elapsed_duration == paused.elapsed_duration
+
+    _, stopped = _control("stop_tool")
+    assert stopped.started_at is None
+    assert stopped.stopped_at is not None
+    assert stopped.elapsed_duration >= paused.elapsed_duration
+
+
 def test_participant_cannot_control_meeting(
     client: TestClient,
     db_session,
@@ -1192,6 +1332,71 @@ def test_guest_join_by_code_success(
     assert "access_token" in join_res.cookies
 
 
+def test_guest_join_returns_body_and_cookie_when_enabled(
+    client: TestClient, user_manager_with_admin: UserManager, monkeypatch
+):
+    from app.auth import auth as auth_module
+
+    monkeypatch.setattr(auth_module, "get_guest_join_enabled", lambda: True)
+    monkeypatch.setattr(meetings_router, "get_guest_join_enabled", lambda: True)
+    admin_email = os.getenv("ADMIN_EMAIL", "admin@decidero.local")
+    admin_user = user_manager_with_admin.get_user_by_email(admin_email)
+    assert admin_user is not None
+    meeting = MeetingManager(user_manager_with_admin.db).create_meeting(
+        MeetingCreate(
+            title="Guest Cookie Session",
+            description="Guest join response shape",
+            start_time=datetime.now(UTC) + timedelta(minutes=30),
+            duration_minutes=30,
+            publicity=PublicityType.PUBLIC,
+            owner_id=admin_user.user_id,
+            participant_ids=[],
+            additional_facilitator_ids=[],
+        ),
+        admin_user.user_id,
+    )
+
+    join_res = client.post(
+        "/api/meetings/join",
+        json={
+            "meeting_code": meeting.meeting_id,
+            "display_name": "Cookie Guest",
+            "as_guest": True,
+        },
+    )
+
+    assert join_res.status_code == 200, join_res.text
+    assert join_res.headers["content-type"] == "application/json"
+    assert join_res.json() == {
+        "status": "joined",
+        "meeting_id": meeting.meeting_id,
+        "redirect": f"/meeting/{meeting.meeting_id}",
+    }
+    assert join_res.cookies["access_token"].strip('"').startswith("Bearer ")
+
+
+def test_guest_join_for_unknown_meeting_leaves_no_guest_account(
+    client: TestClient, db_session, monkeypatch
+):
+    from app.auth import auth as auth_module
+
+    monkeypatch.setattr(auth_module, "get_guest_join_enabled", lambda: True)
+    monkeypatch.setattr(meetings_router, "get_guest_join_enabled", lambda: True)
+
+    join_res = client.post(
+        "/api/meetings/join",
+        json={
+            "meeting_code": "MTG-MISSING",
+            "display_name": "Orphan Guest",
+            "as_guest": True,
+        },
+    )
+
+    assert join_res.status_code == 404, join_res.text
+    assert "access_token" not in join_res.cookies
+    assert db_session.query(User).filter(User.login == "orphan_guest").count() == 0
+
+
 def test_guest_join_requires_flag(
     client: TestClient, user_manager_with_admin: UserManager
 ):
@@ -1296,3 +1501,86 @@ def test_join_meeting_by_code_not_found(authenticated_client: TestClient):
         "/api/meetings/join", json={"meeting_code": bad_code}
     )
     assert res.status_code == 404
+
+
+def test_activity_by_id_index_tracks_agenda_changes():
+    class _MeetingStub:
+        def __init__(self, activities):
+            self.agenda_activities = activities
+
+    first = AgendaActivity(activity_id="MTG-BRAINS-0001")
+    second = AgendaActivity(activity_id="MTG-VOTING-0001")
+    meeting = _MeetingStub([first])
+
+    assert activity_by_id(meeting, "MTG-BRAINS-0001") is first
+    assert activity_by_id(meeting, "MTG-VOTING-0001") is None
+
+    meeting.agenda_activities.append(second)
+    assert activity_by_id(meeting, "MTG-VOTING-0001") is second
+
+    meeting.agenda_activities = [second]
+    assert activity_by_id(meeting, "MTG-BRAINS-0001") is None
+
+
+def test_facilitator_user_ids_cache_tracks_link_changes():
+    class _Link:
+        def __init__(self, user_id):
+            self.user_id = user_id
+
+    class _MeetingStub:
+        def __init__(self, links):
+            self.facilitator_links = links
+
+    meeting = _MeetingStub([_Link("USR-A")])
+    assert facilitator_user_ids(meeting) == frozenset({"USR-A"})
+
+    meeting.facilitator_links.append(_Link("USR-B"))
+    assert facilitator_user_ids(meeting) == frozenset({"USR-A", "USR-B"})
+
+    meeting.facilitator_links = []
+    assert facilitator_user_ids(meeting) == frozenset()
+
+
+def test_participant_user_ids_cache_skips_missing_ids():
+    class _Participant:
+        def __init__(self, user_id):
+            self.user_id = user_id
+
+    class _MeetingStub:
+        def __init__(self, participants):
+            self.participants = participants
+
+    meeting = _MeetingStub([_Participant("USR-A"), _Participant(None)])
+    first = participant_user_ids(meeting)
+    assert first == frozenset({"USR-A"})
+    assert participant_user_ids(meeting) is first
+
+    meeting.participants.append(_Participant("USR-B"))
+    assert participant_user_ids(meeting) == frozenset({"USR-A", "USR-B"})
+
+
+def test_conflict_response_shares_encoding_between_body_and_header():
+    payload = {"conflicting_users": [{"user_id": "USR-1", "display_name": "Ana"}]}
+    response = meetings_router._conflict_response("Conflict", payload)
+    assert response.status_code == 409
+    assert json.loads(response.body) == {
+        "detail": "Conflict",
+        "conflict_details": payload,
+    }
+    assert response.headers["X-Conflict-Details"] == json.dumps(
+        payload, separators=(",", ":")
+    )
+
+    accented = {"conflicting_users": [{"user_id": "USR-2", "display_name": "Zoë"}]}
+    response = meetings_router._conflict_response("Conflict", accented)
+    assert json.loads(response.body)["conflict_details"] == accented
+    header = response.headers["X-Conflict-Details"]
+    assert header.isascii()
+    assert json.loads(header) == accented
+
+
+def test_elapsed_seconds_uses_the_exact_delta():
+    started = datetime(2024, 1, 1, 10, 0, 0, 900000)
+    now = datetime(2024, 1, 1, 10, 0, 2, 100000, tzinfo=UTC)
+    assert meetings_router._elapsed_seconds(started, now) == 1
+    assert meetings_router._elapsed_seconds(started.replace(tzinfo=UTC), now) == 1
@@ -207,3 +207,13 @@ def test_bulk_participant_endpoint_supports_add_and_remove(
     assert after_payload["summary"]["removed_user_ids"] == [roster_one.user_id]
     remaining_ids = {row["user_id"] for row in after_payload["participants"]}
     assert roster_one.user_id not in remaining_ids
+
+    noop_res = authenticated_client.post(
+        f"/api/meetings/{meeting_id}/participants/bulk",
+        json={"add": [], "remove": []},
+    )
+    assert noop_res.status_code == 200, noop_res.json()
+    noop_payload = noop_res.json()
+    assert noop_payload["summary"]["added_user_ids"] == []
+    assert noop_payload["summary"]["removed_user_ids"] == []
+    assert {row["user_id"] for row in noop_payload["participants"]} == remaining_ids
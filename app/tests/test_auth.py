@@ -1,10 +1,14 @@
+import asyncio
 from sqlalchemy.orm import Session
 import pytest
 from fastapi.testclient import TestClient
 from app.data.user_manager import UserManager
 from app.models.user import UserRole
 from app.schemas.schemas import Permission
+from fastapi import HTTPException
 from app.auth.auth import (
+    create_access_token,
+    get_current_user_model,
     has_permission,
     ROLE_PERMISSIONS,
     SECRET_KEY,
@@ -119,6 +123,20 @@ def test_login_with_admin(
     assert response.headers.get("cache-control") == "no-store"
 
 
+def test_access_token_signed_with_cached_key_matches_secret():
+    token = create_access_token({"sub": "cached_key_user"})
+    claims = jwt.decode(
+        token,
+        SECRET_KEY,
+        algorithms=[ALGORITHM],
+        issuer=JWT_ISSUER,
+        options={"verify_aud": False},
+    )
+    assert claims["sub"] == "cached_key_user"
+    with pytest.raises(jwt.JWTError):
+        jwt.decode(token, "x" * 32, algorithms=[ALGORITHM])
+
+
 def test_invalid_login(
     user_manager_fixture: UserManager, client: TestClient
 ):  # Added client fixture
@@ -368,3 +386,16 @@ def test_register_password_fails_complexity_handled_by_pydantic(
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+def test_get_current_user_model_resolves_login(
+    user_manager_fixture: UserManager,
+):
+    user = asyncio.run(
+        get_current_user_model(ADMIN_LOGIN_FOR_TEST, user_manager_fixture)
+    )
+    assert user.login == ADMIN_LOGIN_FOR_TEST
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(get_current_user_model("missing_login", user_manager_fixture))
+    assert excinfo.value.status_code == 404
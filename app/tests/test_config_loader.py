@@ -46,6 +46,54 @@ def test_ui_refresh_coercion(monkeypatch, tmp_path):
     assert settings["failure_backoff_seconds"] == 10
 
 
+def test_ui_refresh_is_cached_until_cleared(monkeypatch, tmp_path):
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path, "ui_refresh:\n  dashboard_interval_seconds: 30\n")
+    monkeypatch.setattr(loader, "_CONFIG_PATH", config_path)
+
+    first = loader.get_ui_refresh_settings()
+    _write_config(config_path, "ui_refresh:\n  dashboard_interval_seconds: 45\n")
+
+    assert loader.get_ui_refresh_settings() is first
+    assert first["dashboard_interval_seconds"] == 30
+
+    loader.clear_config_caches()
+    assert loader.get_ui_refresh_settings()["dashboard_interval_seconds"] == 45
+
+
+def test_load_config_reparses_only_when_file_changes(monkeypatch, tmp_path):
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path, "auth:\n  allow_guest_join: true\n")
+    monkeypatch.setattr(loader, "_CONFIG_PATH", config_path)
+
+    calls = []
+    real_safe_load = loader.yaml.safe_load
+    monkeypatch.setattr(
+        loader.yaml,
+        "safe_load",
+        lambda handle: calls.append(1) or real_safe_load(handle),
+    )
+
+    first = loader.load_config()
+    first["auth"]["allow_guest_join"] = False
+    assert loader.load_config()["auth"]["allow_guest_join"] is True
+    assert len(calls) == 1
+
+    _write_config(config_path, "auth:\n  allow_guest_join: false\n")
+    assert loader.load_config()["auth"]["allow_guest_join"] is False
+    assert len(calls) == 2
+
+
+def test_load_config_does_not_cache_error_fallback(monkeypatch, tmp_path):
+    config_path = tmp_path / "config.yaml"
+    monkeypatch.setattr(loader, "_CONFIG_PATH", config_path)
+
+    assert loader.load_config() == {}
+
+    _write_config(config_path, "auth:\n  allow_guest_join: true\n")
+    assert loader.load_config() == {"auth": {"allow_guest_join": True}}
+
+
 def test_meeting_refresh_defaults_when_missing(monkeypatch, tmp_path):
     config_path = tmp_path / "config.yaml"
     monkeypatch.setattr(loader, "_CONFIG_PATH", config_path)
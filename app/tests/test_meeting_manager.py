@@ -1,6 +1,7 @@
 import pytest
 import re
 from fastapi import HTTPException
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from app.data.meeting_manager import MeetingManager
 from app.schemas.meeting import (
@@ -210,6 +211,208 @@ def test_get_meeting(
     )
 
 
+def test_get_meeting_eager_loads_relationships(
+    meeting_manager_instance: MeetingManager,
+    db_session: Session,
+    test_facilitator: User,
+    other_user: User,
+):
+    meeting_payload = MeetingCreate(
+        title="Eager Loaded Meeting",
+        description="Meeting loaded with relationships",
+        duration_minutes=30,
+        publicity=PublicityType.PUBLIC,
+        owner_id=test_facilitator.user_id,
+        participant_ids=[other_user.user_id],
+        additional_facilitator_ids=[],
+    )
+    created = meeting_manager_instance.create_meeting(
+        meeting_payload,
+        facilitator_id=test_facilitator.user_id,
+        agenda_items=[AgendaActivityCreate(tool_type="brainstorming", title="Ideas")],
+    )
+    db_session.expunge_all()
+
+    fetched = meeting_manager_instance.get_meeting(created.meeting_id)
+    assert fetched is not None
+    loaded = fetched.__dict__
+    assert "participants" in loaded
+    assert "facilitator_links" in loaded
+    assert "agenda_activities" in loaded
+    assert [p.user_id for p in fetched.participants] == [other_user.user_id]
+    assert fetched.facilitator_links[0].user.user_id == test_facilitator.user_id
+    assert meeting_manager_instance.get_meeting("MTG-MISSING") is None
+
+
+def test_get_meeting_for_user_filters_by_access(
+    meeting_manager_instance: MeetingManager,
+    db_session: Session,
+    test_facilitator: User,
+    co_facilitator: User,
+    other_user: User,
+):
+    created = meeting_manager_instance.create_meeting(
+        MeetingCreate(
+            title="Access Filtered Meeting",
+            description="Meeting visible to its roster",
+            duration_minutes=30,
+            publicity=PublicityType.PUBLIC,
+            owner_id=test_facilitator.user_id,
+            participant_ids=[other_user.user_id],
+            additional_facilitator_ids=[],
+        ),
+        facilitator_id=test_facilitator.user_id,
+    )
+    meeting_id = created.meeting_id
+
+    assert meeting_manager_instance.get_meeting_for_user(meeting_id, test_facilitator)
+    assert meeting_manager_instance.get_meeting_for_user(meeting_id, other_user)
+    assert meeting_manager_instance.get_meeting_for_user(meeting_id, co_facilitator) is None
+    assert meeting_manager_instance.meeting_exists(meeting_id)
+    assert not meeting_manager_instance.meeting_exists("MTG-MISSING")
+
+    co_facilitator.role = UserRole.ADMIN
+    assert meeting_manager_instance.get_meeting_for_user(meeting_id, co_facilitator)
+
+
+def test_get_meeting_row_and_user_has_access(
+    meeting_manager_instance: MeetingManager,
+    db_session: Session,
+    test_facilitator: User,
+    co_facilitator: User,
+    other_user: User,
+):
+    created = meeting_manager_instance.create_meeting(
+        MeetingCreate(
+            title="Page Access Meeting",
+            description="Meeting loaded for page access checks",
+            duration_minutes=30,
+            publicity=PublicityType.PUBLIC,
+            owner_id=test_facilitator.user_id,
+            participant_ids=[other_user.user_id],
+            additional_facilitator_ids=[],
+        ),
+        facilitator_id=test_facilitator.user_id,
+    )
+    meeting_id = created.meeting_id
+    owner_id = test_facilitator.user_id
+    participant_id = other_user.user_id
+    outsider_id = co_facilitator.user_id
+    db_session.expunge_all()
+
+    meeting = meeting_manager_instance.get_meeting_row(meeting_id)
+    assert meeting is not None
+    loaded = meeting.__dict__
+    assert "participants" not in loaded
+    assert "facilitator_links" not in loaded
+    assert meeting_manager_instance.get_meeting_row("MTG-MISSING") is None
+
+    has_access = meeting_manager_instance.user_has_access
+    assert has_access(meeting_id, owner_id)
+    assert has_access(meeting_id, participant_id)
+    assert not has_access(meeting_id, participant_id, include_participants=False)
+    assert not has_access(meeting_id, outsider_id)
+    assert not has_access("MTG-MISSING", owner_id)
+
+
+def test_get_meeting_with_roster_loads_only_rosters(
+    meeting_manager_instance: MeetingManager,
+    db_session: Session,
+    test_facilitator: User,
+    other_user: User,
+):
+    created = meeting_manager_instance.create_meeting(
+        MeetingCreate(
+            title="Roster Only Meeting",
+            description="Meeting loaded for the user directory",
+            duration_minutes=30,
+            publicity=PublicityType.PUBLIC,
+            owner_id=test_facilitator.user_id,
+            participant_ids=[other_user.user_id],
+            additional_facilitator_ids=[],
+        ),
+        facilitator_id=test_facilitator.user_id,
+    )
+    db_session.expunge_all()
+
+    meeting = meeting_manager_instance.get_meeting_with_roster(created.meeting_id)
+    assert meeting is not None
+    loaded = meeting.__dict__
+    assert "participants" in loaded
+    assert "facilitator_links" in loaded
+    assert "agenda_activities" not in loaded
+    assert other_user.user_id in {p.user_id for p in meeting.participants}
+    assert meeting_manager_instance.get_meeting_with_roster("MTG-MISSING") is None
+
+
+def test_get_meeting_row_reuses_identity_map(
+    meeting_manager_instance: MeetingManager,
+    db_session: Session,
+    test_facilitator: User,
+):
+    created = meeting_manager_instance.create_meeting(
+        MeetingCreate(
+            title="Identity Map Meeting",
+            description="Repeat lookups should not re-query",
+            duration_minutes=30,
+            publicity=PublicityType.PUBLIC,
+            owner_id=test_facilitator.user_id,
+            participant_ids=[],
+            additional_facilitator_ids=[],
+        ),
+        facilitator_id=test_facilitator.user_id,
+    )
+    meeting_id = created.meeting_id
+    db_session.expunge_all()
+
+    first = meeting_manager_instance.get_meeting_row(meeting_id)
+    assert first is not None
+
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", _record)
+    try:
+        assert meeting_manager_instance.get_meeting_row(meeting_id) is first
+    finally:
+        event.remove(bind, "before_cursor_execute", _record)
+    assert statements == []
+
+
+def test_membership_probes_use_exists(
+    meeting_manager_instance: MeetingManager,
+    test_facilitator: User,
+    other_user: User,
+):
+    created = meeting_manager_instance.create_meeting(
+        MeetingCreate(
+            title="Membership Probe Meeting",
+            description="Meeting for EXISTS membership checks",
+            duration_minutes=30,
+            publicity=PublicityType.PUBLIC,
+            owner_id=test_facilitator.user_id,
+            participant_ids=[other_user.user_id],
+            additional_facilitator_ids=[],
+        ),
+        facilitator_id=test_facilitator.user_id,
+    )
+    meeting_id = created.meeting_id
+
+    assert meeting_manager_instance.user_is_facilitator(
+        meeting_id, test_facilitator.user_id
+    )
+    assert not meeting_manager_instance.user_is_facilitator(
+        meeting_id, other_user.user_id
+    )
+    assert meeting_manager_instance.user_is_participant(meeting_id, other_user.user_id)
+    assert not meeting_manager_instance.user_is_participant(
+        "MTG-MISSING", other_user.user_id
+    )
+
+
 def test_activity_ids_unique_across_meetings(
     meeting_manager_instance: MeetingManager,
     db_session: Session,
@@ -1332,6 +1535,72 @@ async def test_check_participant_collisions_with_multiple_active(
     assert no_conflict == []
 
 
+@pytest.mark.asyncio
+async def test_check_participant_collisions_reuses_supplied_snapshot(
+    meeting_manager_instance: MeetingManager,
+    db_session: Session,
+    test_facilitator: User,
+    mocker,
+):
+    participant = _create_temp_user(db_session, "Reuse", "One", "reuse_one")
+    meeting = meeting_manager_instance.create_meeting(
+        meeting_data=MeetingCreate(
+            title="Snapshot Reuse Meeting",
+            description="Collision check with caller-provided state",
+            duration_minutes=30,
+            publicity=PublicityType.PUBLIC,
+            owner_id=test_facilitator.user_id,
+            participant_ids=[participant.user_id],
+            additional_facilitator_ids=[],
+        ),
+        facilitator_id=test_facilitator.user_id,
+        agenda_items=[
+            AgendaActivityCreate(tool_type="brainstorming", title="A1"),
+            AgendaActivityCreate(tool_type="voting", title="A2"),
+        ],
+    )
+    active_activity_id = meeting.agenda_activities[0].activity_id
+    next_activity_id = meeting.agenda_activities[1].activity_id
+
+    mocker.patch(
+        "app.data.meeting_manager.get_activity_participant_exclusivity",
+        return_value=True,
+    )
+    snapshot_spy = mocker.patch(
+        "app.data.meeting_manager.meeting_state_manager.snapshot"
+    )
+    get_meeting_spy = mocker.spy(meeting_manager_instance, "get_meeting")
+    supplied = {
+        "activeActivities": [
+            {
+                "activityId": active_activity_id,
+                "status": "in_progress",
+                "participantIds": [],
+            }
+        ]
+    }
+
+    conflict = await meeting_manager_instance.check_participant_collisions(
+        meeting.meeting_id,
+        next_activity_id,
+        {participant.user_id},
+        meeting=meeting,
+        snapshot=supplied,
+    )
+    assert conflict == [participant.user_id]
+
+    no_state = await meeting_manager_instance.check_participant_collisions(
+        meeting.meeting_id,
+        next_activity_id,
+        {participant.user_id},
+        meeting=meeting,
+        snapshot=None,
+    )
+    assert no_state == []
+    snapshot_spy.assert_not_called()
+    get_meeting_spy.assert_not_called()
+
+
 def test_update_meeting_owner_updates_roster(
     meeting_manager_instance: MeetingManager,
     db_session: Session,
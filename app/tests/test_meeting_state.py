@@ -132,5 +132,84 @@ def test_meeting_state_websocket_flow(db_session, client: TestClient):
             assert state_payload["metadata"]["step"] == "intro"
             assert "USR-WS-001" in state_payload["participants"]
             assert state_payload["updatedAt"]
+            assert [item["title"] for item in state_payload["agenda"]] == ["Intro"]
     finally:
         asyncio.run(meeting_state_manager.reset(meeting_id))
+
+
+@pytest.mark.anyio("asyncio")
+async def test_sync_agenda_keeps_connection_list_and_restores_replaced_agenda():
+    from app.routers import realtime
+
+    meeting_id = "MTG-SYNC-AGENDA"
+    formatted = [{"activity_id": "MTG-SYNC-0001", "order_index": 1}]
+    try:
+        await realtime._sync_agenda(meeting_id, formatted)
+        state = await meeting_state_manager.get_or_create(meeting_id)
+        assert state.agenda is formatted
+
+        await meeting_state_manager.apply_patch(meeting_id, {"agenda": []})
+        await realtime._sync_agenda(meeting_id, formatted)
+        assert state.agenda is formatted
+        assert meeting_state_manager.peek(meeting_id) is state
+    finally:
+        await meeting_state_manager.reset(meeting_id)
+
+
+@pytest.mark.anyio("asyncio")
+async def test_snapshot_activity_index_is_opt_in():
+    manager = MeetingStateManager()
+    await manager.apply_patch(
+        "MTG-INDEX",
+        {
+            "activeActivities": {
+                "MTG-RANK-0001": {"tool": "rank_order_voting", "status": "in_progress"}
+            }
+        },
+    )
+
+    plain = await manager.snapshot("MTG-INDEX")
+    assert "activeActivitiesById" not in plain
+
+    indexed = await manager.snapshot("MTG-INDEX", index_activities=True)
+    entry = indexed["activeActivitiesById"]["MTG-RANK-0001"]
+    assert entry["activityId"] == "MTG-RANK-0001"
+    assert indexed["activeActivities"] == [entry]
+    assert await manager.snapshot("MTG-MISSING", index_activities=True) is None
+
+
+@pytest.mark.anyio("asyncio")
+async def test_large_agendas_are_formatted_in_threadpool(monkeypatch):
+    from types import SimpleNamespace
+
+    from app.models.meeting import AgendaActivity
+    from app.routers import realtime
+
+    offloaded = []
+
+    async def _record_threadpool(func, *args):
+        offloaded.append(len(args[0]))
+        return func(*args)
+
+    monkeypatch.setattr(realtime, "run_in_threadpool", _record_threadpool)
+    monkeypatch.setattr(realtime, "AGENDA_FORMAT_OFFLOAD_THRESHOLD", 2)
+
+    def _meeting(count):
+        return SimpleNamespace(
+            agenda_activities=[
+                AgendaActivity(
+                    activity_id=f"MTG-OFF-{index:04d}",
+                    order_index=index,
+                    title=f"Item {index}",
+                    tool_type="brainstorming",
+                )
+                for index in range(1, count + 1)
+            ]
+        )
+
+    small = await realtime._load_formatted_agenda(_meeting(2))
+    large = await realtime._load_formatted_agenda(_meeting(3))
+
+    assert offloaded == [3]
+    assert [item["activity_id"] for item in small] == ["MTG-OFF-0001", "MTG-OFF-0002"]
+    assert [item["order_index"] for item in large] == [1, 2, 3]
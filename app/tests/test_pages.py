@@ -1,4 +1,8 @@
+import re
+from pathlib import Path
+
 from fastapi.testclient import TestClient
+from app.routers import pages
 from app.tests.conftest import (
     ADMIN_EMAIL_FOR_TEST,
     ADMIN_PASSWORD_FOR_TEST,
@@ -6,6 +10,23 @@ from app.tests.conftest import (
 )  # Import admin credentials if needed for login setup
 
 
+def test_page_templates_are_preloaded():
+    source = Path(pages.__file__).read_text()
+    rendered = set(re.findall(r'_render_page\(\s*request,\s*"([^"]+)"', source))
+    assert rendered
+    assert rendered <= set(pages._PAGE_TEMPLATES)
+    assert pages.templates.env.auto_reload is False
+
+
+def test_user_role_values_resolve_like_enum_members_in_templates():
+    template = pages.templates.env.from_string(
+        "{{ role == UserRole.ADMIN }}|{{ UserRole.SUPER_ADMIN }}"
+    )
+    assert template.render(role="admin", UserRole=pages.USER_ROLE_VALUES) == (
+        "True|super_admin"
+    )
+
+
 # Tests for GET requests to page routes
 def test_get_login_page(client: TestClient):
     response = client.get("/login")
@@ -45,6 +66,23 @@ def test_get_dashboard_authenticated(client: TestClient, user_manager_with_admin
     )
 
 
+def test_dashboard_logs_admin_count_failures(
+    client: TestClient, user_manager_with_admin, monkeypatch
+):
+    login_data = {"username": ADMIN_LOGIN_FOR_TEST, "password": ADMIN_PASSWORD_FOR_TEST}
+    assert client.post("/api/auth/token", json=login_data).status_code == 200
+
+    def _failing_counts(self, **kwargs):
+        raise RuntimeError("count query failed")
+
+    logged = []
+    monkeypatch.setattr(pages.UserManager, "get_role_counts", _failing_counts)
+    monkeypatch.setattr(pages.logger, "exception", lambda msg, *a: logged.append(msg))
+    response = client.get("/dashboard")
+    assert response.status_code == 200
+    assert logged == ["Error fetching admin data for dashboard"]
+
+
 def test_get_profile_page_unauthenticated(client: TestClient):
     response = client.get("/profile", follow_redirects=False)
     assert response.status_code == 307
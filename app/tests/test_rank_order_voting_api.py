@@ -76,7 +76,18 @@ def test_rank_order_submit_and_aggregate_results_for_facilitator(
     client: TestClient,
     user_manager_with_admin: UserManager,
     db_session,
+    monkeypatch,
 ):
+    from app.routers import rank_order_voting
+
+    broadcasts = []
+
+    async def _record_broadcast(meeting_id, message, **_kwargs):
+        broadcasts.append((meeting_id, message))
+
+    monkeypatch.setattr(
+        rank_order_voting.websocket_manager, "broadcast", _record_broadcast
+    )
     admin_email = os.getenv("ADMIN_EMAIL", "admin@decidero.local")
     admin_user = user_manager_with_admin.get_user_by_email(admin_email)
     assert admin_user is not None
@@ -132,6 +143,16 @@ def test_rank_order_submit_and_aggregate_results_for_facilitator(
         json={"activity_id": activity_id, "ordered_option_ids": option_ids},
     )
     assert submit_response.status_code == 200, submit_response.json()
+    assert broadcasts == [
+        (
+            meeting.meeting_id,
+            {
+                "type": "rank_order_voting_update",
+                "payload": {"activity_id": activity_id},
+                "meta": {"initiatorId": participant.user_id},
+            },
+        )
+    ]
 
     admin_login = os.getenv("ADMIN_LOGIN", admin_email.split("@")[0])
     admin_password = os.getenv("ADMIN_PASSWORD", "Admin@123!")
@@ -248,3 +269,45 @@ def test_rank_order_empty_config_does_not_break_meeting_payload(
     agenda = meeting_resp.json().get("agenda", [])
     rank_activity = next(item for item in agenda if item["activity_id"] == activity_id)
     assert rank_activity.get("transfer_count") == 0
+
+
+def test_resolve_scope_normalizes_ids_from_state_and_config():
+    from types import SimpleNamespace
+
+    from app.routers import rank_order_voting
+
+    meeting_id = "MTG-RANK-SCOPE"
+
+    async def _run():
+        await meeting_state_manager.apply_patch(
+            meeting_id,
+            {
+                "participants": ["USR-A", "USR-B"],
+                "activeActivities": {
+                    "RANK-1": {
+                        "tool": "Rank_Order_Voting",
+                        "status": "IN_PROGRESS",
+                        "metadata": {
+                            "participantScope": "Custom",
+                            "participantIds": [" USR-A ", "", 42],
+                        },
+                    }
+                },
+            },
+        )
+        try:
+            return await meeting_state_manager.snapshot(
+                meeting_id, index_activities=True
+            )
+        finally:
+            await meeting_state_manager.reset(meeting_id)
+
+    snapshot = asyncio.run(_run())
+    active = rank_order_voting._resolve_scope(snapshot, "RANK-1", None)
+    idle = rank_order_voting._resolve_scope(
+        snapshot,
+        "RANK-2",
+        SimpleNamespace(config={"participant_ids": ["USR-B ", " "]}),
+    )
+    assert active == ({"USR-A", "42"}, True, {"USR-A", "USR-B"})
+    assert idle == ({"USR-B"}, False, {"USR-A", "USR-B"})
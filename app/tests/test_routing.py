@@ -0,0 +1,12 @@
+from fastapi.responses import ORJSONResponse
+
+from app.routers.meetings import router as meetings_router
+
+
+def test_meetings_routes_default_to_orjson_responses():
+    assert meetings_router.default_response_class is ORJSONResponse
+    api_routes = [
+        route for route in meetings_router.routes if hasattr(route, "response_class")
+    ]
+    assert api_routes
+    assert all(route.response_class is ORJSONResponse for route in api_routes)
@@ -1,6 +1,5 @@
 import asyncio
 from datetime import datetime, timedelta, UTC
-
 from fastapi.testclient import TestClient
 
 from app.data.activity_bundle_manager import ActivityBundleManager
@@ -47,6 +46,7 @@ def test_transfer_commit_response_contains_target_activity(
     authenticated_client: TestClient,
     user_manager_with_admin,
     db_session,
+    monkeypatch,
 ):
     facilitator = user_manager_with_admin.get_user_by_email("admin@decidero.local")
     assert facilitator is not None
@@ -96,6 +96,14 @@ def test_transfer_commit_response_contains_target_activity(
         assert bundles_resp.status_code == 200, bundles_resp.json()
         items = bundles_resp.json()["input"]["items"]
 
+        list_agenda_calls = []
+        original_list_agenda = MeetingManager.list_agenda
+
+        def _counting_list_agenda(self, *args, **kwargs):
+            list_agenda_calls.append(args)
+            return original_list_agenda(self, *args, **kwargs)
+
+        monkeypatch.setattr(MeetingManager, "list_agenda", _counting_list_agenda)
         commit_resp = authenticated_client.post(
             f"/api/meetings/{meeting.meeting_id}/transfer/commit",
             json={
@@ -111,6 +119,10 @@ def test_transfer_commit_response_contains_target_activity(
         assert "target_activity" in payload
         assert "new_activity" in payload
         assert payload["target_activity"] == payload["new_activity"]
+        assert len(list_agenda_calls) == 1
+        assert payload["target_activity"] in payload["agenda"]
+        agenda_ids = [item["activity_id"] for item in payload["agenda"]]
+        assert agenda_ids == [activity_id, payload["target_activity"]["activity_id"]]
     finally:
         asyncio.run(meeting_state_manager.reset(meeting.meeting_id))
 
@@ -2005,6 +2017,8 @@ def test_transfer_metadata_history_on_draft_and_commit(
         assert history[-1].get("created_at") == commit_metadata.get("created_at")
         tools = commit_metadata.get("tools") or {}
         assert tools.get("brainstorming", {}).get("activity_id") == new_activity_id
+        assert tools.get("transfer", {}).get("idea_count") is not None
+        assert commit_metadata.get("source", {}).get("tool_type") == "brainstorming"
     finally:
         asyncio.run(meeting_state_manager.reset(meeting.meeting_id))
 
@@ -2763,3 +2777,126 @@ def test_transfer_commit_to_voting_resets_stale_state(
         )
     finally:
         asyncio.run(meeting_state_manager.reset(meeting.meeting_id))
+
+
+def test_seed_brainstorming_ideas_bulk_inserts_ideas_and_comments(
+    user_manager_with_admin,
+    db_session,
+):
+    from app.routers.transfer import _seed_brainstorming_ideas
+
+    facilitator = user_manager_with_admin.get_user_by_email("admin@decidero.local")
+    assert facilitator is not None
+
+    meeting_manager = MeetingManager(db_session)
+    start_time = datetime.now(UTC) + timedelta(minutes=5)
+    meeting = meeting_manager.create_meeting(
+        meeting_data=MeetingCreate(
+            title="Transfer Bulk Seed Test",
+            description="Seeding should keep comments attached to their parents.",
+            start_time=start_time,
+            end_time=start_time + timedelta(minutes=30),
+            duration_minutes=30,
+            publicity=PublicityType.PRIVATE,
+            owner_id=facilitator.user_id,
+            participant_ids=[],
+            additional_facilitator_ids=[],
+        ),
+        facilitator_id=facilitator.user_id,
+        agenda_items=[AgendaActivityCreate(tool_type="brainstorming", title="Target")],
+    )
+    activity_id = meeting.agenda_activities[0].activity_id
+
+    ideas = [
+        {"id": "a", "content": "First", "timestamp": "2024-01-01T10:00:00Z"},
+        {"id": "b", "content": "Second", "metadata": {"votes": 2}},
+        {"id": "c", "content": "Third", "created_at": "2024-01-01T11:00:00Z"},
+    ]
+    comments = {
+        "c": [{"content": "On third"}],
+        "a": [{"content": "On first", "timestamp": "2024-01-01T12:00:00Z"}],
+        "missing": [{"content": "Orphan"}],
+    }
+    _seed_brainstorming_ideas(db_session, meeting.meeting_id, activity_id, ideas, comments)
+
+    rows = (
+        db_session.query(Idea)
+        .filter(Idea.meeting_id == meeting.meeting_id, Idea.activity_id == activity_id)
+        .all()
+    )
+    parents = {row.content: row for row in rows if row.parent_id is None}
+    replies = {row.content: row for row in rows if row.parent_id is not None}
+    assert set(parents) == {"First", "Second", "Third"}
+    assert parents["Second"].idea_metadata == {"votes": 2}
+    assert parents["Second"].timestamp is not None
+    assert set(replies) == {"On first", "On third"}
+    assert replies["On first"].parent_id == parents["First"].id
+    assert replies["On third"].parent_id == parents["Third"].id
+
+
+def test_dedupe_items_keeps_first_entry_in_order():
+    from app.routers.transfer import _dedupe_items
+
+    first = {"id": "1", "content": "A"}
+    items = [
+        first,
+        {"content": "B", "source": {"original_id": "9"}},
+        {"id": "1", "content": "A duplicate"},
+        {"content": "C"},
+        {"content": "D", "source": {"original_id": "9"}},
+        {"content": "C", "parent_id": "1"},
+    ]
+    deduped = _dedupe_items(items)
+    assert [entry["content"] for entry in deduped] == ["A", "B", "C", "C"]
+    assert deduped[0] is first
+
+
+def test_split_ideas_and_comments_keeps_comments_listed_before_parent():
+    from app.routers.transfer import _split_ideas_and_comments
+
+    items = [
+        {"id": "c1", "parent_id": "i2", "content": "early comment"},
+        {"id": "i1", "content": "idea one"},
+        {"id": "c2", "parent_id": "missing", "content": "orphan"},
+        {"id": "i2", "content": "idea two"},
+        {"id": "c3", "parent_id": "i1", "content": "reply"},
+    ]
+    ideas, comments_by_parent = _split_ideas_and_comments(items)
+    assert [entry["id"] for entry in ideas] == ["i1", "i2"]
+    assert {key: [c["id"] for c in value] for key, value in comments_by_parent.items()} == {
+        "i2": ["c1"],
+        "i1": ["c3"],
+    }
+
+
+def test_assert_facilitator_access_short_circuits_for_admins_and_owners():
+    from types import SimpleNamespace
+
+    import pytest
+    from fastapi import HTTPException
+
+    from app.models.user import UserRole
+    from app.routers.transfer import _assert_facilitator_access
+
+    class _Meeting:
+        owner_id = "owner"
+
+        @property
+        def facilitator_links(self):
+            raise AssertionError("facilitator links should not be read")
+
+    admin = SimpleNamespace(user_id="someone", role=UserRole.ADMIN)
+    owner = SimpleNamespace(user_id="owner", role=UserRole.PARTICIPANT)
+    _assert_facilitator_access(_Meeting(), admin)
+    _assert_facilitator_access(_Meeting(), owner)
+
+    meeting = SimpleNamespace(
+        owner_id="owner",
+        facilitator_links=[SimpleNamespace(user_id="cofac")],
+    )
+    cofacilitator = SimpleNamespace(user_id="cofac", role=UserRole.FACILITATOR)
+    _assert_facilitator_access(meeting, cofacilitator)
+    outsider = SimpleNamespace(user_id="outsider", role=UserRole.PARTICIPANT)
+    with pytest.raises(HTTPException) as excinfo:
+        _assert_facilitator_access(meeting, outsider)
+    assert excinfo.value.status_code == 403
@@ -20,3 +20,34 @@ def test_comments_parentheses_format_matches_transfer_convention():
 
     assert transfer_text == categorization_text
     assert transfer_text == "Base idea (Comments: first comment; second comment)"
+
+
+def test_mapped_voting_options_use_the_same_comment_format():
+    from app.routers.transfer import _map_transfer_config
+
+    ideas = [
+        {"id": 42, "content": " Base idea "},
+        {"id": 43, "content": "Lonely idea"},
+    ]
+    comments_by_parent = {
+        "42": [
+            {"content": "first comment"},
+            {"content": ""},
+            {"content": "second comment "},
+        ]
+    }
+
+    config = _map_transfer_config(
+        "voting",
+        {},
+        ideas,
+        comments_by_parent,
+        include_comments=True,
+        inherited_config_from_donor=False,
+    )
+
+    assert config["options"] == [
+        _append_comments_to_content(ideas[0], comments_by_parent),
+        "Lonely idea",
+    ]
+    assert config["options"][0] == "Base idea (Comments: first comment; second comment)"
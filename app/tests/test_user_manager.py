@@ -1,8 +1,10 @@
 import pytest
 from sqlalchemy.orm import Session
+from app.data import user_manager as user_manager_module
 from app.data.user_manager import UserManager
-from app.utils.security import get_password_hash
-from app.models.user import UserRole
+from app.utils.security import get_password_hash, make_unusable_password
+from app.models.meeting import Meeting
+from app.models.user import User, UserRole
 
 # Removed setup_module as encryption_manager is not directly tested here,
 # and User Manager relies on password hashes, not direct encryption itself.
@@ -281,6 +283,26 @@ def test_add_user_without_email_is_verified(
     assert user.verification_token is None
 
 
+def test_unusable_password_never_verifies(
+    user_manager: UserManager, db_session: Session
+):
+    placeholder = make_unusable_password()
+    user = user_manager.add_user(
+        first_name="Guest",
+        last_name="",
+        email=None,
+        hashed_password=placeholder,
+        role=UserRole.PARTICIPANT.value,
+        login="unusable_guest",
+    )
+    db_session.commit()
+
+    assert user.hashed_password.startswith("!")
+    assert make_unusable_password() != placeholder
+    assert user_manager.verify_user_credentials("unusable_guest", placeholder) is None
+    assert user_manager.verify_user_credentials("unusable_guest", "") is None
+
+
 def test_batch_add_users_by_pattern_verifies_users_without_email(
     user_manager: UserManager, db_session: Session
 ):
@@ -310,3 +332,92 @@ def test_batch_add_users_by_pattern_verifies_users_without_email(
         created_user = user_manager.get_user_by_login(login)
         assert created_user is not None
         assert created_user.is_verified is True
+
+
+def test_get_users_by_ids_returns_mapping(user_manager: UserManager, db_session: Session):
+    first = user_manager.add_user(
+        first_name="Batch",
+        last_name="One",
+        email="batch.one@example.com",
+        hashed_password=get_password_hash("ValidPassword123!"),
+        role=UserRole.PARTICIPANT.value,
+        login="batch.one",
+    )
+    second = user_manager.add_user(
+        first_name="Batch",
+        last_name="Two",
+        email="batch.two@example.com",
+        hashed_password=get_password_hash("ValidPassword123!"),
+        role=UserRole.PARTICIPANT.value,
+        login="batch.two",
+    )
+    db_session.commit()
+
+    found = user_manager.get_users_by_ids(
+        [first.user_id, second.user_id, first.user_id, "USR-MISSING", None]
+    )
+    assert set(found) == {first.user_id, second.user_id}
+    assert found[second.user_id].login == "batch.two"
+    assert user_manager.get_users_by_ids([]) == {}
+
+
+def test_user_role_is_stored_as_plain_string():
+    user = User(login="role_normalise", hashed_password="x", role=UserRole.ADMIN)
+    assert type(user.role) is str
+    assert user.role == "admin"
+
+    user.role = "facilitator"
+    assert user.role == "facilitator"
+
+
+def test_get_role_counts_matches_individual_counts(
+    user_manager: UserManager, db_session: Session
+):
+    for index, role in enumerate(
+        [UserRole.FACILITATOR, UserRole.PARTICIPANT, UserRole.PARTICIPANT]
+    ):
+        user_manager.add_user(
+            first_name="Role",
+            last_name=f"Count{index}",
+            email=None,
+            hashed_password=get_password_hash("ValidPassword123!"),
+            role=role.value,
+            login=f"role_count_{index}",
+        )
+    db_session.commit()
+
+    counts = user_manager.get_role_counts()
+
+    assert counts == {
+        "total": user_manager.get_user_count(),
+        "admin": user_manager.get_admin_count(),
+        "facilitator": user_manager.get_facilitator_count(),
+        "participant": user_manager.get_participant_count(),
+    }
+    assert counts["participant"] >= 2
+
+    with_meetings = user_manager.get_role_counts(include_meeting_count=True)
+    assert with_meetings == {**counts, "meetings": db_session.query(Meeting).count()}
+
+
+def test_has_admin_user_reuses_cached_positive_answer(
+    user_manager: UserManager, db_session: Session, monkeypatch
+):
+    monkeypatch.setattr(user_manager_module, "_admin_exists_until", 0.0)
+    assert user_manager.has_admin_user(allow_cached=True) is False
+
+    user_manager.add_user(
+        first_name="Cached",
+        last_name="Admin",
+        email=None,
+        hashed_password=get_password_hash("ValidPassword123!"),
+        role=UserRole.ADMIN.value,
+        login="cached_admin",
+    )
+    db_session.commit()
+    assert user_manager.has_admin_user(allow_cached=True) is True
+
+    user_manager.delete_user("cached_admin")
+    db_session.commit()
+    assert user_manager.has_admin_user(allow_cached=True) is True
+    assert user_manager.has_admin_user() is False
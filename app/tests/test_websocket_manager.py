@@ -1,5 +1,8 @@
+import json
+
 import pytest
 
+from app.utils import websocket_manager as websocket_manager_module
 from app.utils.websocket_manager import ConnectionInfo, WebSocketManager
 
 
@@ -12,6 +15,7 @@ class _FakeSocket:
     def __init__(self, *, on_send=None, should_fail: bool = False):
         self._on_send = on_send
         self._should_fail = should_fail
+        self.sent: list[str] = []
 
     async def send_json(self, _message):
         if self._on_send:
@@ -19,6 +23,13 @@ class _FakeSocket:
         if self._should_fail:
             raise RuntimeError("send failed")
 
+    async def send_text(self, payload):
+        if self._on_send:
+            self._on_send()
+        if self._should_fail:
+            raise RuntimeError("send failed")
+        self.sent.append(payload)
+
 
 @pytest.mark.anyio("asyncio")
 async def test_broadcast_uses_snapshot_when_connections_change():
@@ -56,3 +67,101 @@ async def test_broadcast_drops_failed_connections():
 
     assert "conn-ok" in manager.active_connections[meeting_id]
     assert "conn-fail" not in manager.active_connections[meeting_id]
+
+
+@pytest.mark.anyio("asyncio")
+async def test_broadcast_serializes_once_and_yields_between_batches(monkeypatch):
+    manager = WebSocketManager()
+    meeting_id = "MTG-WS-3"
+    sockets = {f"conn-{index}": _FakeSocket() for index in range(5)}
+    manager.active_connections[meeting_id] = {
+        connection_id: ConnectionInfo(id=connection_id, websocket=socket)
+        for connection_id, socket in sockets.items()
+    }
+
+    dumps_calls = []
+    real_dumps = websocket_manager_module.orjson.dumps
+
+    def _counting_dumps(*args, **kwargs):
+        dumps_calls.append(args[0])
+        return real_dumps(*args, **kwargs)
+
+    yields = []
+    real_sleep = websocket_manager_module.asyncio.sleep
+
+    async def _recording_sleep(delay):
+        yields.append(delay)
+        await real_sleep(delay)
+
+    monkeypatch.setattr(websocket_manager_module, "BROADCAST_BATCH_SIZE", 2)
+    monkeypatch.setattr(websocket_manager_module.orjson, "dumps", _counting_dumps)
+    monkeypatch.setattr(websocket_manager_module.asyncio, "sleep", _recording_sleep)
+
+    message = {"type": "participant_joined", "payload": {1: "a"}}
+    await manager.broadcast(meeting_id, message, skip_connection="conn-0")
+
+    assert len(dumps_calls) == 1
+    assert yields == [0]
+    assert sockets["conn-0"].sent == []
+    for connection_id in ("conn-1", "conn-2", "conn-3", "conn-4"):
+        (payload,) = sockets[connection_id].sent
+        assert json.loads(payload) == {
+            "type": "participant_joined",
+            "payload": {"1": "a"},
+        }
+
+
+@pytest.mark.anyio("asyncio")
+async def test_personal_messages_are_encoded_with_orjson():
+    manager = WebSocketManager()
+    meeting_id = "MTG-WS-4"
+    socket = _FakeSocket()
+    manager.active_connections[meeting_id] = {
+        "conn-a": ConnectionInfo(id="conn-a", websocket=socket)
+    }
+
+    await manager.send_personal_message(
+        meeting_id, "conn-a", {"type": "pong", "payload": {"ok": True}}
+    )
+
+    assert socket.sent == ['{"type":"pong","payload":{"ok":true}}']
+
+
+def test_encode_message_embeds_pre_encoded_fragments():
+    state = {"participants": ["USR-A"], "status": None}
+    fragment = websocket_manager_module.orjson.Fragment(
+        websocket_manager_module.encode_message(state)
+    )
+
+    encoded = websocket_manager_module.encode_message(
+        {"type": "connection_ack", "payload": {"state": fragment}}
+    )
+
+    assert json.loads(encoded) == {
+        "type": "connection_ack",
+        "payload": {"state": state},
+    }
+
+
+def test_connection_info_is_slotted():
+    connection = ConnectionInfo(id="conn-a", websocket=_FakeSocket())
+    connection.user_id = "USR-A"
+
+    assert not hasattr(connection, "__dict__")
+    with pytest.raises(AttributeError):
+        connection.extra = "not allowed"
+
+
+def test_peer_count_excludes_the_given_connection():
+    manager = WebSocketManager()
+    meeting_id = "MTG-WS-5"
+    assert manager.peer_count(meeting_id) == 0
+
+    manager.active_connections[meeting_id] = {
+        "conn-a": ConnectionInfo(id="conn-a", websocket=_FakeSocket()),
+        "conn-b": ConnectionInfo(id="conn-b", websocket=_FakeSocket()),
+    }
+
+    assert manager.peer_count(meeting_id) == 2
+    assert manager.peer_count(meeting_id, exclude="conn-a") == 1
+    assert manager.peer_count(meeting_id, exclude="conn-missing") == 2
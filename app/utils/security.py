@@ -1,9 +1,14 @@
+import secrets
+
 from passlib.context import CryptContext
 
 # Password Hashing Context
 # Using bcrypt as the scheme
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Stored hashes starting with this prefix never match any password.
+UNUSABLE_PASSWORD_PREFIX = "!"
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -14,6 +19,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if the password matches the hash, False otherwise.
     """
+    if not hashed_password or hashed_password.startswith(UNUSABLE_PASSWORD_PREFIX):
+        return False
     return pwd_context.verify(plain_password.strip(), hashed_password)
 
 
@@ -26,3 +33,13 @@ def get_password_hash(password: str) -> str:
         The generated password hash.
     """
     return pwd_context.hash(password.strip())
+
+
+def make_unusable_password() -> str:
+    """
+    Generates a placeholder hash for accounts that never log in with a password.
+    Returns:
+        A random value carrying the unusable prefix, so verification always fails
+        without paying for a bcrypt round.
+    """
+    return UNUSABLE_PASSWORD_PREFIX + secrets.token_urlsafe(48)
@@ -1,26 +1,45 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from typing import Dict, Optional, Any
 from uuid import uuid4
 
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+# Sends are awaited concurrently in batches of this size, yielding to the
+# event loop between batches so large meetings do not starve other tasks.
+BROADCAST_BATCH_SIZE = 50
+BROADCAST_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
 
-@dataclass
+
+def encode_message(message: Dict[str, Any]) -> str:
+    """Serialize an outbound message with orjson rather than the stdlib codec."""
+    return orjson.dumps(message, option=BROADCAST_JSON_OPTIONS).decode()
+
+
+@dataclass(slots=True)
 class ConnectionInfo:
-    """Metadata describing a single WebSocket connection."""
+    """Metadata describing a single WebSocket connection.
+
+    Slotted so each live socket carries no per-instance ``__dict__``.
+    """
 
     id: str
     websocket: WebSocket
     user_id: Optional[str] = None
 
     async def send_json(self, message: Dict[str, Any]) -> None:
-        """Proxy to the underlying WebSocket send_json method."""
-        await self.websocket.send_json(message)
+        """Encode ``message`` with orjson and send it as a text frame."""
+        await self.send_text(encode_message(message))
+
+    async def send_text(self, payload: str) -> None:
+        """Send an already-serialized message to the underlying WebSocket."""
+        await self.websocket.send_text(payload)
 
 
 class WebSocketManager:
@@ -78,19 +97,42 @@ class WebSocketManager:
         skip_connection: Optional[str] = None,
     ) -> None:
         """Broadcast a message to all connected clients in a meeting."""
-        meeting_connections = self.active_connections.get(meeting_id, {})
-        disconnected: list[str] = []
+        await self.broadcast_text(
+            meeting_id, encode_message(message), skip_connection=skip_connection
+        )
 
+    async def broadcast_text(
+        self,
+        meeting_id: str,
+        payload: str,
+        *,
+        skip_connection: Optional[str] = None,
+    ) -> None:
+        """Send a pre-serialized JSON payload to every client in a meeting."""
         # Iterate over a snapshot to avoid mutation-during-iteration when
         # disconnect() runs concurrently in other request handlers.
-        for connection_id, connection in list(meeting_connections.items()):
-            if skip_connection and connection_id == skip_connection:
-                continue
+        targets = [
+            connection
+            for connection_id, connection in self.active_connections.get(
+                meeting_id, {}
+            ).items()
+            if connection_id != skip_connection
+        ]
+        disconnected: list[str] = []
 
-            try:
-                await connection.send_json(message)
-            except Exception:  # pragma: no cover - depends on network
-                disconnected.append(connection_id)
+        for start in range(0, len(targets), BROADCAST_BATCH_SIZE):
+            batch = targets[start : start + BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(connection.send_text(payload) for connection in batch),
+                return_exceptions=True,
+            )
+            disconnected.extend(
+                connection.id
+                for connection, result in zip(batch, results)
+                if isinstance(result, Exception)
+            )
+            if start + BROADCAST_BATCH_SIZE < len(targets):
+                await asyncio.sleep(0)
 
         for connection_id in disconnected:
             self.disconnect(meeting_id, connection_id)
@@ -110,6 +152,14 @@ class WebSocketManager:
         except Exception:  # pragma: no cover - depends on network
             self.disconnect(meeting_id, connection_id)
 
+    def peer_count(self, meeting_id: str, *, exclude: Optional[str] = None) -> int:
+        """Return how many connections in a meeting a broadcast would reach."""
+        meeting_connections = self.active_connections.get(meeting_id, {})
+        count = len(meeting_connections)
+        if exclude is not None and exclude in meeting_connections:
+            count -= 1
+        return count
+
     def active_users(self, meeting_id: str) -> Dict[str, ConnectionInfo]:
         """Return the active connection metadata for a meeting."""
         return self.active_connections.get(meeting_id, {}).copy()